@@ -16,6 +16,8 @@ from ..notification import Notifier
 
 
 class _Entity:
+    __slots__ = ()
+
     _MANAGER_NAME: str
     _is_in_context = False
     _in_context_attributes_changed_collector: List
@@ -27,13 +29,22 @@ class _Entity:
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         # If multiple entities is in context, the last to enter will be the first to exit
+        events = self._leave_context()
+        _get_manager(self._MANAGER_NAME)._set(self)
+
+        for event in events:
+            Notifier.publish(event)
+        _get_manager(self._MANAGER_NAME)._set(self)
+
+    def _leave_context(self) -> List:
+        """Apply the changes made in context without saving the entity, and return the events to publish.
+
+        Used to save many entities changed in context at once.
+        """
         self._is_in_context = False
         if hasattr(self, "_properties"):
             for to_delete_key in self._properties._pending_deletions:
                 self._properties.data.pop(to_delete_key, None)
             self._properties.data.update(self._properties._pending_changes)
-        _get_manager(self._MANAGER_NAME)._set(self)
-
-        for event in self._in_context_attributes_changed_collector:
-            Notifier.publish(event)
-        _get_manager(self._MANAGER_NAME)._set(self)
+            self._properties._clear_cache()
+        return self._in_context_attributes_changed_collector
@@ -13,6 +13,8 @@ from typing import Optional
 
 
 class _Labeled:
+    __slots__ = ()
+
     __LABEL_SEPARATOR = " > "
 
     @abc.abstractmethod
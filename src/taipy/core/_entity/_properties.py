@@ -9,7 +9,13 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+import re
 from collections import UserDict
+from copy import copy
+from typing import Any, Dict, Tuple
+
+from taipy.config.common._template_handler import _TemplateHandler as _tpl
 
 from ..notification import _ENTITY_TO_EVENT_ENTITY_TYPE, EventOperation, Notifier, _make_event
 
@@ -18,6 +24,7 @@ class _Properties(UserDict):
     __PROPERTIES_ATTRIBUTE_NAME = "properties"
 
     def __init__(self, entity_owner, **kwargs):
+        self._cached_values: Dict[Any, Tuple[Any, Tuple]] = {}
         super().__init__(**kwargs)
         self._entity_owner = entity_owner
         self._pending_changes = {}
@@ -25,6 +32,7 @@ class _Properties(UserDict):
 
     def __setitem__(self, key, value):
         super(_Properties, self).__setitem__(key, value)
+        self._cached_values.pop(key, None)
         from ... import core as tp
 
         if hasattr(self, "_entity_owner"):
@@ -44,12 +52,18 @@ class _Properties(UserDict):
                 self._entity_owner._in_context_attributes_changed_collector.append(event)
 
     def __getitem__(self, key):
-        from taipy.config.common._template_handler import _TemplateHandler as _tpl
-
-        return _tpl._replace_templates(super(_Properties, self).__getitem__(key))
+        if cached := self._cached_values.get(key):
+            value, env_dependencies = cached
+            if all(os.environ.get(var) == env_value for var, env_value in env_dependencies):
+                return copy(value) if isinstance(value, (dict, list)) else value
+        template = super(_Properties, self).__getitem__(key)
+        value = _tpl._replace_templates(template)
+        self._cached_values[key] = (value, self.__env_dependencies(template))
+        return copy(value) if isinstance(value, (dict, list)) else value
 
     def __delitem__(self, key):
         super(_Properties, self).__delitem__(key)
+        self._cached_values.pop(key, None)
         from ... import core as tp
 
         if hasattr(self, "_entity_owner"):
@@ -66,3 +80,21 @@ class _Properties(UserDict):
                 self._pending_changes.pop(key, None)
                 self._pending_deletions.add(key)
                 self._entity_owner._in_context_attributes_changed_collector.append(event)
+
+    def _clear_cache(self):
+        self._cached_values.clear()
+
+    @staticmethod
+    def __env_dependencies(template) -> Tuple:
+        """Return the environment variables, and their current values, the template resolution depends on."""
+        if isinstance(template, (tuple, list)):
+            items = template
+        elif isinstance(template, (dict, UserDict)):
+            items = template.values()
+        else:
+            items = [template]
+        dependencies = []
+        for item in items:
+            if "ENV" in str(item) and (match := re.fullmatch(_tpl._PATTERN, str(item))):
+                dependencies.append((match.group(1), os.environ.get(match.group(1))))
+        return tuple(dependencies)
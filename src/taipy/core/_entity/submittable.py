@@ -11,14 +11,16 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, Iterable, List, Optional, Set, Union
 
 import networkx as nx
 
 from ..common._listattributes import _ListAttributes
 from ..common._utils import _Subscriber
 from ..data.data_node import DataNode
+from ..exceptions.exceptions import InvalidSubmissionTarget
 from ..job.job import Job
+from ..task._staleness import _Staleness
 from ..task.task import Task
 from ._dag import _DAG
 
@@ -32,6 +34,8 @@ class Submittable:
         subscribers (List[Callable]): The list of callbacks to be called on `Job^`'s status change.
     """
 
+    __slots__ = ()
+
     def __init__(self, subscribers: Optional[List[_Subscriber]] = None):
         self._subscribers = _ListAttributes(self, subscribers or list())
 
@@ -42,6 +46,20 @@ class Submittable:
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+        targets: Optional[Iterable[Union[DataNode, str]]] = None,
+    ):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def resubmit_stale(
+        self,
+        callbacks: Optional[List[Callable]] = None,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ):
         raise NotImplementedError
 
@@ -96,6 +114,22 @@ class Submittable:
         dag = self._build_dag()
         return {node for node in dag.nodes if isinstance(node, DataNode) and node.edit_in_progress}
 
+    def get_stale_tasks(self) -> List[Task]:
+        """Return the stale tasks of the submittable entity, whose outputs are not up to date with their inputs.
+
+        A task is stale if one of its outputs was never written or has expired, if one of its inputs was edited
+        after its outputs, or if one of the tasks writing its inputs is stale. The staleness is evaluated from the
+        edit dates of the data nodes saved in the repository, so the edits made by any process are taken into
+        account.
+
+        Returns:
+            The list of stale tasks, in topological order.
+        """
+        return self.__get_stale_tasks(self._build_dag())
+
+    def __get_stale_tasks(self, dag: nx.DiGraph) -> List[Task]:
+        return _Staleness._get_stale_tasks([node for node in nx.topological_sort(dag) if isinstance(node, Task)])
+
     @abc.abstractmethod
     def subscribe(self, callback: Callable[[Submittable, Job], None], params: Optional[List[Any]] = None):
         raise NotImplementedError
@@ -125,12 +159,41 @@ class Submittable:
                 graph.add_node(task)
         return graph
 
-    def _get_sorted_tasks(self) -> List[List[Task]]:
+    def _get_sorted_tasks(
+        self, targets: Optional[Iterable[Union[DataNode, str]]] = None, stale_only: bool = False
+    ) -> List[List[Task]]:
+        """Returns the tasks of the submittable entity, by topological generation.
+
+        Parameters:
+            targets (Optional[Iterable[Union[DataNode^, str]]]): The optional data nodes, data node ids or data
+                node config ids to compute. If given, only the tasks these data nodes depend on are returned.
+            stale_only (bool): If True, only the stale tasks are returned.
+        Raises:
+            InvalidSubmissionTarget^: If a target is not a data node of the submittable entity.
+        """
         dag = self._build_dag()
+        if targets is not None:
+            dag = nx.DiGraph(dag.subgraph(self.__get_target_ancestors(dag, targets)))
+        if stale_only:
+            stale_tasks = set(self.__get_stale_tasks(dag))
+            dag = nx.DiGraph(dag.subgraph(n for n in dag.nodes if isinstance(n, DataNode) or n in stale_tasks))
         remove = [node for node, degree in dict(dag.in_degree).items() if degree == 0 and isinstance(node, DataNode)]
         dag.remove_nodes_from(remove)
         return list(nodes for nodes in nx.topological_generations(dag) if (Task in (type(node) for node in nodes)))
 
+    def __get_target_ancestors(self, dag: nx.DiGraph, targets: Iterable[Union[DataNode, str]]) -> Set:
+        data_nodes = [node for node in dag.nodes if isinstance(node, DataNode)]
+        nodes: Set = set()
+        for target in targets:
+            target_id = target.id if isinstance(target, DataNode) else target
+            target_dns = [dn for dn in data_nodes if target_id in (dn.id, dn.config_id)]
+            if not target_dns:
+                raise InvalidSubmissionTarget(target_id, self.id)  # type: ignore
+            for dn in target_dns:
+                nodes.add(dn)
+                nodes.update(nx.ancestors(dag, dn))
+        return nodes
+
     def _add_subscriber(self, callback: Callable, params: Optional[List[Any]] = None):
         params = [] if params is None else params
         self._subscribers.append(_Subscriber(callback=callback, params=params))
@@ -38,6 +38,7 @@ from .taipy import (
     get_cycles_scenarios,
     get_data_nodes,
     get_entities_by_config_id,
+    get_job_execution_metrics,
     get_jobs,
     get_latest_job,
     get_parents,
@@ -51,9 +52,11 @@ from .taipy import (
     is_promotable,
     is_readable,
     is_submittable,
+    plan,
     set,
     set_primary,
     submit,
+    submit_many,
     subscribe_scenario,
     subscribe_sequence,
     tag,
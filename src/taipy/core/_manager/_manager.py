@@ -11,7 +11,7 @@
 
 import pathlib
 from importlib import metadata
-from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar, Union
 
 from taipy.logger._taipy_logger import _TaipyLogger
 
@@ -97,6 +97,28 @@ class _Manager(Generic[EntityType]):
         """
         cls._repository._save(entity)
 
+    @classmethod
+    def _set_many(cls, entities: Iterable[EntityType]):
+        """
+        Save or update several entities at once.
+        """
+        cls._repository._save_many(entities)
+
+    @classmethod
+    def _bulk_edit(cls, entities: Iterable[EntityType], edit: Callable[[EntityType], None]):
+        """
+        Edit each entity as within a `with` block, then save all the entities at once and publish their events.
+        """
+        entities = list(entities)
+        events = []
+        for entity in entities:
+            entity.__enter__()  # type: ignore
+            edit(entity)
+            events.extend(entity._leave_context())  # type: ignore
+        cls._set_many(entities)
+        for event in events:
+            Notifier.publish(event)
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
         """
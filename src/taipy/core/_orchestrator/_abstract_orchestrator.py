@@ -33,9 +33,27 @@ class _AbstractOrchestrator:
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+        targets: Optional[Iterable] = None,
+        stale_only: bool = False,
     ) -> List[Job]:
         raise NotImplementedError
 
+    @classmethod
+    @abstractmethod
+    def submit_many(
+        cls,
+        entities: List,
+        callbacks: Optional[List[Iterable[Callable]]] = None,
+        force: bool = False,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+    ):
+        raise NotImplementedError
+
     @classmethod
     @abstractmethod
     def submit_task(
@@ -45,6 +63,8 @@ class _AbstractOrchestrator:
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ) -> Job:
         raise NotImplementedError
 
@@ -52,3 +72,18 @@ class _AbstractOrchestrator:
     @abstractmethod
     def cancel_job(cls, job):
         raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def plan(cls, submittable, force: bool = False, targets: Optional[Iterable] = None):
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def get_metrics(cls):
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def wait_jobs(cls, jobs: Iterable[Job], timeout: Optional[Union[float, int]] = None) -> bool:
+        raise NotImplementedError
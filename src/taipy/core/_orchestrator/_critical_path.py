@@ -0,0 +1,168 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import bisect
+import inspect
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from taipy.config.config import Config
+
+from .._entity.submittable import Submittable
+from ..config.job_config import JobConfig
+from ..config.task_config import TaskConfig
+from ..data.data_node import DataNode
+from ..submission.execution_plan import ExecutionPlan, PlannedTask
+from ..task.task import Task
+from ._dispatcher._job_dispatcher import _JobDispatcher
+from ._task_durations import _TaskDurations
+
+
+class _CriticalPath:
+    """Critical path scheduling of the tasks of a submission, HEFT style.
+
+    The remaining duration of a task is its estimated duration plus the longest remaining duration of the tasks
+    reading its outputs, which is the upward rank of the task in the HEFT heuristic. Dispatching first the jobs
+    with the longest remaining duration starts the tasks of the critical path as soon as possible, which shortens
+    the makespan of the submission when the workers are limited.
+    """
+
+    @staticmethod
+    def _get_remaining_durations(nodes: Iterable[Tuple[str, float, Iterable[str], Iterable[str]]]) -> Dict[str, float]:
+        """Returns the remaining durations of the given tasks or jobs of a submission.
+
+        Parameters:
+            nodes (Iterable[Tuple[str, float, Iterable[str], Iterable[str]]]): The identifier, the estimated
+                duration, the input data node ids and the output data node ids of each task or job.
+        Returns:
+            The remaining durations in seconds, by identifier.
+        """
+        durations: Dict[str, float] = {}
+        output_dn_ids: Dict[str, Iterable[str]] = {}
+        readers: Dict[str, List[str]] = {}
+        for node_id, duration, node_input_dn_ids, node_output_dn_ids in nodes:
+            durations[node_id] = duration
+            output_dn_ids[node_id] = node_output_dn_ids
+            for dn_id in node_input_dn_ids:
+                readers.setdefault(dn_id, []).append(node_id)
+        successors = {
+            node_id: {reader for dn_id in dn_ids for reader in readers.get(dn_id, ()) if reader != node_id}
+            for node_id, dn_ids in output_dn_ids.items()
+        }
+
+        remaining_durations: Dict[str, float] = {}
+        for root in durations:
+            # Iterative post-order traversal, so that long chains of tasks do not exhaust the recursion limit.
+            stack = [(root, False)]
+            while stack:
+                node_id, visited = stack.pop()
+                if node_id in remaining_durations:
+                    continue
+                if visited:
+                    remaining_durations[node_id] = durations[node_id] + max(
+                        (remaining_durations.get(successor, 0.0) for successor in successors[node_id]), default=0.0
+                    )
+                else:
+                    stack.append((node_id, True))
+                    stack.extend((s, False) for s in successors[node_id] if s not in remaining_durations)
+        return remaining_durations
+
+    @classmethod
+    def _plan(
+        cls, submittable: Submittable, force: bool = False, targets: Optional[Iterable[Union[DataNode, str]]] = None
+    ) -> ExecutionPlan:
+        """Returns the estimated schedule of the submission of the given scenario or sequence.
+
+        A skippable task is planned as skipped if its outputs are up to date and none of the tasks writing its
+        inputs runs. The other tasks are scheduled, in decreasing order of remaining duration, on a worker of their
+        pool, as soon as the worker is available and the tasks writing their inputs are planned to end.
+        """
+        tasks = [task for tasks in submittable._get_sorted_tasks(targets) for task in tasks]
+        writers: Dict[str, List[Task]] = {}
+        for task in tasks:
+            for dn in task.output.values():
+                writers.setdefault(dn.id, []).append(task)
+        predecessors = {
+            task.id: {writer.id for dn in task.input.values() for writer in writers.get(dn.id, ()) if writer != task}
+            for task in tasks
+        }
+
+        # The tasks are sorted topologically, so the predecessors of a task are decided before the task.
+        skipped_task_ids: Set[str] = set()
+        for task in tasks:
+            if force or not task.skippable or not predecessors[task.id] <= skipped_task_ids:
+                continue
+            if not _JobDispatcher._needs_to_run(task):
+                skipped_task_ids.add(task.id)
+
+        durations = {
+            task.id: 0.0 if task.id in skipped_task_ids else _TaskDurations._estimate(task.config_id) for task in tasks
+        }
+        remaining_durations = cls._get_remaining_durations(
+            (
+                task.id,
+                durations[task.id],
+                [dn.id for dn in task.input.values()],
+                [dn.id for dn in task.output.values()],
+            )
+            for task in tasks
+        )
+
+        # A task has a longer remaining duration than the tasks reading its outputs, unless it is skipped, hence the
+        # topological index to break ties.
+        order = sorted(range(len(tasks)), key=lambda i: (-remaining_durations[tasks[i].id], i))
+        workers: Dict[Optional[str], List[float]] = {}
+        ends: Dict[str, float] = {}
+        planned_tasks: Dict[str, PlannedTask] = {}
+        for i in order:
+            task = tasks[i]
+            ready = max((ends[predecessor] for predecessor in predecessors[task.id]), default=0.0)
+            if task.id in skipped_task_ids:
+                start = ready
+            else:
+                pool, nb_of_workers = cls.__get_pool(task)
+                available_times = workers.setdefault(pool, [0.0] * nb_of_workers)
+                # The worker available the latest before the task is ready, or else the worker available first.
+                index = max(bisect.bisect_right(available_times, ready) - 1, 0)
+                start = max(available_times.pop(index), ready)
+                bisect.insort(available_times, start + durations[task.id])
+            ends[task.id] = start + durations[task.id]
+            planned_tasks[task.id] = PlannedTask(task, start, ends[task.id], task.id in skipped_task_ids)
+
+        # The critical path goes from the entry task with the longest remaining duration to the exit tasks, through
+        # the successors with the longest remaining durations.
+        successors: Dict[str, List[str]] = {task.id: [] for task in tasks}
+        for task_id, task_predecessors in predecessors.items():
+            for predecessor in task_predecessors:
+                successors[predecessor].append(task_id)
+        entries = [task.id for task in tasks if not predecessors[task.id]]
+        task_id = max(entries, key=lambda t: remaining_durations[t], default=None)
+        while task_id is not None:
+            planned_tasks[task_id].critical = True
+            task_id = max(successors[task_id], key=lambda t: remaining_durations[t], default=None)
+
+        return ExecutionPlan(sorted(planned_tasks.values(), key=lambda p: (p.start, p.end)))
+
+    @staticmethod
+    def __get_pool(task: Task) -> Tuple[Optional[str], int]:
+        """Returns the pool executing the jobs of the task, None for the event loop, and its number of workers."""
+        job_config = Config.job_config
+        if not job_config.is_standalone:
+            # The jobs are executed one after the other.
+            return JobConfig._DEFAULT_POOL, 1
+        if inspect.iscoroutinefunction(task.function):
+            return None, int(job_config.max_nb_of_coroutines or JobConfig._DEFAULT_MAX_NB_OF_COROUTINES)
+        task_config = Config.tasks.get(task.config_id)
+        pools = job_config.pools or {}
+        if task_config is not None and task_config.pool in pools:
+            return task_config.pool, int(pools[task_config.pool].get(JobConfig._MAX_NB_OF_WORKERS_KEY) or 1)
+        if task_config is not None and task_config.executor == TaskConfig._THREAD_EXECUTOR:
+            return JobConfig._THREAD_POOL, int(job_config.max_nb_of_threads or job_config.max_nb_of_workers or 1)
+        return JobConfig._DEFAULT_POOL, int(job_config.max_nb_of_workers or 1)
@@ -8,7 +8,7 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
-from typing import Optional
+from typing import List, Optional
 
 from ...job.job import Job
 from .._abstract_orchestrator import _AbstractOrchestrator
@@ -41,3 +41,25 @@ class _DevelopmentJobDispatcher(_JobDispatcher):
         """
         rs = self._wrapped_function(job.id, job.task)
         self._update_job_status(job, rs)
+
+    def _dispatch_fused_jobs(self, jobs: List[Job]):
+        """Dispatches the given chain of fused `Job^`s for execution, one job after the other.
+
+        The intermediate data nodes of the chain are passed in memory from one job to the next, and are also written
+        unless their *persist* property is False.
+
+        Parameters:
+            jobs (List[Job^]): The jobs of the chain, in execution order.
+        """
+        chain_exceptions = self._wrapped_chain(
+            self._get_chain_steps(jobs), self._get_unwritten_dn_ids([job.task for job in jobs])
+        )
+        for i, (job, exceptions) in enumerate(zip(jobs, chain_exceptions)):
+            if i > 0:
+                self.orchestrator._remove_fused_job(job)  # type: ignore
+            if exceptions is None:
+                # Not executed, the job has been abandoned after the failure of a previous job of the chain.
+                break
+            self._update_job_status(job, exceptions)
+            if exceptions:
+                break
@@ -0,0 +1,133 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import ctypes
+import os
+import signal
+import threading
+from contextlib import contextmanager, suppress
+from typing import Any, Dict, Iterable, Optional
+
+
+class _JobInterrupted(Exception):
+    """Raised in the task function of a job interrupted while running."""
+
+
+class _Interruption:
+    """Interrupts the task functions of running jobs.
+
+    Only the reading of the inputs and the task function are interrupted: the writing of the outputs always runs
+    to completion, so that a job is either interrupted before writing anything or completed. A worker process
+    reports when a job starts writing its outputs, so that the outputs a killed process may have partially written
+    are known.
+
+    In a worker process, the dispatcher requests the interruption of a job by creating a file named after the job
+    in its requests folder, then sends `_SIGNAL` to the process. The signal handler only raises `_JobInterrupted` in
+    the task function if the interruption of the job the process is running is requested, so that a signal received
+    once the process has moved on to another job is ignored. Each worker process reports the jobs it starts with its
+    process id on the queue of its pool. In a worker thread, `_JobInterrupted` is raised asynchronously in the
+    thread, which only happens when the task function executes Python code.
+    """
+
+    _SIGNAL = getattr(signal, "SIGUSR1", None)
+    # Report of a job starting to write its outputs, in place of a peak memory, see `_report_writing()`.
+    _WRITING = "writing"
+
+    # Queue the current worker process reports the jobs it starts on.
+    __reports: Optional[Any] = None
+    # Folder of the interruption requests sent to the current worker process.
+    __requests_folder: Optional[str] = None
+    # Job whose task function runs in the main thread of the current worker process.
+    __running_job_id: Optional[str] = None
+    # Threads running the task functions of the jobs executed by the thread pools of the current process, by job id.
+    __thread_ids: Dict[str, int] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def _initialize_worker(cls, reports: Optional[Any], requests_folder: Optional[str] = None):
+        """Prepare a new worker process to report the jobs it starts on the given queue, and to be interrupted.
+
+        Parameters:
+            reports (Optional[SimpleQueue]): The queue to report the started jobs on.
+            requests_folder (Optional[str]): The folder of the interruption requests. If None, any job the process
+                runs is interrupted on `_SIGNAL`.
+        """
+        cls.__reports = reports
+        cls.__requests_folder = requests_folder
+        if cls._SIGNAL is not None:
+            signal.signal(cls._SIGNAL, cls.__on_signal)
+
+    @staticmethod
+    def _request(requests_folder: str, job_ids: Iterable[str]):
+        """Request the interruption of the given jobs, before `_SIGNAL` is sent to the process running them."""
+        os.makedirs(requests_folder, exist_ok=True)
+        for job_id in job_ids:
+            with open(os.path.join(requests_folder, job_id), "w"):
+                pass
+
+    @staticmethod
+    def _discard_requests(requests_folder: str, job_ids: Iterable[str]):
+        """Discard the interruption requests of the given finished jobs, if any."""
+        for job_id in job_ids:
+            with suppress(FileNotFoundError):
+                os.remove(os.path.join(requests_folder, job_id))
+        with suppress(OSError):  # Not created, or still holding the requests of other jobs.
+            os.rmdir(requests_folder)
+
+    @classmethod
+    @contextmanager
+    def _interruptible(cls, job_id: str):
+        """Context in which the task function of the given job can be interrupted."""
+        if threading.current_thread() is not threading.main_thread():
+            with cls.__lock:
+                cls.__thread_ids[job_id] = threading.get_ident()
+            try:
+                yield
+            finally:
+                with cls.__lock:
+                    if (thread_id := cls.__thread_ids.pop(job_id, None)) is not None:
+                        # Discard an interruption requested but not raised yet.
+                        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), None)
+            return
+
+        cls.__running_job_id = job_id
+        if cls.__reports is not None:
+            cls.__reports.put((job_id, os.getpid(), None))
+        try:
+            yield
+        finally:
+            cls.__running_job_id = None
+
+    @classmethod
+    def _report_writing(cls, job_id: str):
+        """Report that the given job, running in the current worker process, starts writing its outputs."""
+        if cls.__reports is not None:
+            cls.__reports.put((job_id, os.getpid(), cls._WRITING))
+
+    @classmethod
+    def _interrupt_thread(cls, job_id: str) -> bool:
+        """Interrupt the task function of the given job, running in a thread of the current process.
+
+        Returns:
+            True if the task function of the job was running.
+        """
+        with cls.__lock:
+            if (thread_id := cls.__thread_ids.get(job_id)) is None:
+                return False
+            exception = ctypes.py_object(_JobInterrupted)
+            return ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), exception) == 1
+
+    @classmethod
+    def __on_signal(cls, signum, frame):
+        if (job_id := cls.__running_job_id) is None:
+            return
+        if cls.__requests_folder is None or os.path.exists(os.path.join(cls.__requests_folder, job_id)):
+            raise _JobInterrupted(f"Job {job_id} interrupted.")
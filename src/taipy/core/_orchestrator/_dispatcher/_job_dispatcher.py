@@ -11,32 +11,50 @@
 
 import threading
 from abc import abstractmethod
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from taipy.config.config import Config
 from taipy.logger._taipy_logger import _TaipyLogger
 
+from ...config.data_node_config import DataNodeConfig
 from ...data._data_manager_factory import _DataManagerFactory
 from ...job._job_manager_factory import _JobManagerFactory
 from ...job.job import Job
 from ...task.task import Task
 from .._abstract_orchestrator import _AbstractOrchestrator
+from .._task_durations import _TaskDurations
+from ._memory_usage import _MemoryUsage
 from ._task_function_wrapper import _TaskFunctionWrapper
 
 
 class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
-    """Manages job dispatching (instances of `Job^` class) on executors."""
+    """Manages job dispatching (instances of `Job^` class) on executors.
+
+    If `JobConfig^`.memory_budget is set, a job is only dispatched if its estimated memory, see `_MemoryUsage`,
+    fits in the budget along with the estimated memory of the running jobs, or if no job is running. The jobs
+    waiting after a job that does not fit are dispatched meanwhile if they fit themselves.
+    """
 
     _STOP_FLAG = False
     _dispatched_processes: Dict = {}
     __logger = _TaipyLogger._get_logger()
     _nb_available_workers: int = 1
+    # Number of seconds between two resizings of the worker pools, None if they are not autoscaled.
+    _scaling_period: Optional[float] = None
 
     def __init__(self, orchestrator: Optional[_AbstractOrchestrator]):
         threading.Thread.__init__(self, name="Thread-Taipy-JobDispatcher")
         self.daemon = True
         self.orchestrator = orchestrator
         self.lock = self.orchestrator.lock  # type: ignore
+        # Wakes the dispatcher up when a job becomes runnable, a worker is released or the dispatcher is stopped.
+        self._condition = threading.Condition()
+        memory_budget = Config.job_config.memory_budget
+        self._memory_budget: Optional[float] = float(memory_budget) if memory_budget is not None else None
+        # Estimated memory of the running jobs, with the task configuration ids of the jobs executed with them, by
+        # id of the first job dispatched.
+        self._memory_reservations: Dict[str, Tuple[float, Tuple[Optional[str], ...]]] = {}
+        self._memory_in_use = 0.0
         Config.block_update()
 
     def start(self):
@@ -50,28 +68,111 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
     def stop(self):
         """Stop the dispatcher"""
         self._STOP_FLAG = True
+        self._notify()
+        _TaskDurations._flush()
 
     def run(self):
         _TaipyLogger._get_logger().info("Start job dispatcher...")
         while not self._STOP_FLAG:
             try:
-                if self._can_execute():
-                    with self.lock:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
-                    self._execute_job(job)
+                with self._condition:
+                    can_dispatch = self._condition.wait_for(self.__can_dispatch, self._scaling_period)
+                if self._STOP_FLAG:
+                    break
+                self._scale_pools()
+                if not can_dispatch:
+                    continue
+                with self.lock:
+                    job_handle = self.orchestrator.jobs_to_run.get(self._can_execute_job)
+                    fused_jobs = self.orchestrator._get_fused_jobs(job_handle)  # type: ignore
+                if (job := self.orchestrator._get_job(job_handle)) is None:  # type: ignore
+                    continue  # Deleted while it was queued.
+                fused_jobs = [self.orchestrator._get_job(fused_job) for fused_job in fused_jobs]  # type: ignore
+                self._execute_job(job, [fused_job for fused_job in fused_jobs if fused_job is not None])
             except Exception:  # In case the last job of the queue has been removed.
                 pass
 
+    def _notify(self):
+        """Wake the dispatcher up so that it checks whether a job can be dispatched."""
+        with self._condition:
+            self._condition.notify()
+
+    def __can_dispatch(self) -> bool:
+        if self._STOP_FLAG:
+            return True
+        jobs_to_run = self.orchestrator.jobs_to_run  # type: ignore
+        # The queue is only searched if the jobs of one of its task configurations can run, so that waking up
+        # while no worker or memory is available does not scan the whole queue.
+        if not any(self._can_execute_task_config(t) for t in jobs_to_run.task_config_ids()):
+            return False
+        return jobs_to_run.find(self._can_execute_job) is not None
+
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to execute a new job."""
         return self._nb_available_workers > 0
 
-    def _execute_job(self, job: Job):
+    def _has_free_worker(self, task_config_id: Optional[str]) -> bool:
+        """Returns True if a worker is available for the jobs of the given task configuration."""
+        return self._can_execute()
+
+    def _can_execute_task_config(self, task_config_id: Optional[str]) -> bool:
+        """Returns True if the dispatcher have resources to execute a job of the given task configuration.
+
+        Jobs fused to the job are not accounted for, so a job may still not be executable.
+        """
+        return self._has_free_worker(task_config_id) and self.__fits_in_memory_budget([task_config_id])
+
+    def _can_execute_job(self, job_handle) -> bool:
+        """Returns True if the dispatcher have resources to execute the job of the given handle."""
+        return self._has_free_worker(job_handle.task_config_id) and self._fits_in_memory_budget(job_handle)
+
+    def _fits_in_memory_budget(self, job_handle) -> bool:
+        """Returns True if the job of the given handle, with the jobs fused to it, fits in the memory budget."""
+        return self.__fits_in_memory_budget(
+            [job_handle.task_config_id, *(fused.task_config_id for fused in job_handle.fused_jobs)]
+        )
+
+    def __fits_in_memory_budget(self, task_config_ids: Sequence[Optional[str]]) -> bool:
+        if self._memory_budget is None or not self._memory_reservations:
+            return True
+        memory = max(_MemoryUsage._estimate(task_config_id) for task_config_id in task_config_ids)
+        return self._memory_in_use + memory <= self._memory_budget
+
+    def _reserve_memory(self, job_id: str, task_config_ids: Sequence[Optional[str]]):
+        """Count the estimated memory of the given dispatched job, with the jobs executed with it, as in use.
+
+        Parameters:
+            job_id (str): The identifier of the first job dispatched.
+            task_config_ids (Sequence[Optional[str]]): The task configuration ids of the jobs executed one after
+                the other by the worker.
+        """
+        memory = max(_MemoryUsage._estimate(task_config_id) for task_config_id in task_config_ids)
+        with self._condition:
+            self._memory_reservations[job_id] = (memory, tuple(task_config_ids))
+            self._memory_in_use += memory
+
+    def _release_memory(self, job_id: str, peak_memories: Sequence[Optional[float]] = ()):
+        """Stop counting the memory of the given finished job, and record the peak memory measured for its jobs."""
+        with self._condition:
+            memory, task_config_ids = self._memory_reservations.pop(job_id, (0.0, ()))
+            # Recomputed rather than decremented, so that rounding errors do not accumulate.
+            self._memory_in_use = sum(memory for memory, _ in self._memory_reservations.values())
+            self._condition.notify()
+        for task_config_id, peak_memory in zip(task_config_ids, peak_memories):
+            if task_config_id and peak_memory is not None:
+                _MemoryUsage._record(task_config_id, peak_memory)
+
+    def _execute_job(self, job: Job, fused_jobs: Sequence[Job] = ()):
         if job.force or self._needs_to_run(job.task):
             if job.force:
                 self.__logger.info(f"job {job.id} is forced to be executed.")
             job.running()
-            self._dispatch(job)
+            if fused_jobs:
+                for fused_job in fused_jobs:
+                    fused_job.running()
+                self._dispatch_fused_jobs([job, *fused_jobs])
+            else:
+                self._dispatch(job)
         else:
             job._unlock_edit_on_outputs()
             job.skipped()
@@ -81,10 +182,11 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
         while not self.orchestrator.jobs_to_run.empty():
             with self.lock:
                 try:
-                    job = self.orchestrator.jobs_to_run.get()
+                    job_handle = self.orchestrator.jobs_to_run.get()
                 except Exception:  # In case the last job of the queue has been removed.
-                    self.__logger.warning(f"{job.id} is no longer in the list of jobs to run.")
-            self._execute_job(job)
+                    self.__logger.warning(f"{job_handle.id} is no longer in the list of jobs to run.")
+            if (job := self.orchestrator._get_job(job_handle)) is not None:  # type: ignore
+                self._execute_job(job)
 
     @staticmethod
     def _needs_to_run(task: Task) -> bool:
@@ -120,6 +222,59 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _dispatch_fused_jobs(self, jobs: List[Job]):
+        """
+        Dispatches the given chain of fused `Job^`s on a single available worker for execution.
+
+        Parameters:
+            jobs (List[Job^]): The jobs of the chain, in execution order.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _get_chain_steps(jobs: Sequence[Job]) -> Tuple[Tuple[str, Callable, Tuple[str, ...], Tuple[str, ...]], ...]:
+        """Returns the job id, the task function and the input and output data node ids of each fused job."""
+        steps = []
+        for job in jobs:
+            task = job.task
+            input_dn_ids = tuple(dn.id for dn in task.input.values())
+            output_dn_ids = tuple(dn.id for dn in task.output.values())
+            steps.append((job.id, task.function, input_dn_ids, output_dn_ids))
+        return tuple(steps)
+
+    @staticmethod
+    def _get_unwritten_dn_ids(tasks: Sequence[Task]) -> Set[str]:
+        """Returns the ids of the intermediate data nodes of a chain of fused tasks that are not persisted."""
+        unwritten_dn_ids = set()
+        for task, next_task in zip(tasks, tasks[1:]):
+            next_input_dn_ids = {dn.id for dn in next_task.input.values()}
+            for dn in task.output.values():
+                persist = dn.properties.get(DataNodeConfig._OPTIONAL_PERSIST_PROPERTY, True)
+                if dn.id in next_input_dn_ids and not persist:
+                    unwritten_dn_ids.add(dn.id)
+        return unwritten_dn_ids
+
+    def _scale_pools(self):
+        """Resize the autoscaled worker pools, according to the jobs waiting for their workers."""
+        pass
+
+    def _get_pool_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Returns the number of workers of each worker pool, by pool name."""
+        return {}
+
+    def _interrupt_job(self, job_id: str, timeout: Optional[float] = None) -> bool:
+        """Interrupt the given running job.
+
+        Returns:
+            True if the job is running and is being interrupted.
+        """
+        return False
+
+    def _on_submission_finished(self, submit_id: str):
+        """Release the resources held for the submission of the given id, all its jobs being finished."""
+        pass
+
     @staticmethod
     def _update_job_status(job: Job, exceptions):
         job.update_status(exceptions)
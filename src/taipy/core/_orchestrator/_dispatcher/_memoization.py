@@ -0,0 +1,245 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import types
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from ...config.data_node_config import DataNodeConfig
+from ...data._abstract_file import _AbstractFileDataNode
+from ...data._abstract_sql import _AbstractSQLDataNode
+from ...data._data_manager_factory import _DataManagerFactory
+from ...data.data_node import DataNode
+from ...data.data_node_id import DataNodeId
+from ...job.job_id import JobId
+from ._interruption import _Interruption
+
+
+class _Memoization:
+    """Store of the results of the memoized tasks, keyed by a fingerprint of the task and of its input data.
+
+    The key of an execution is the hash of the task configuration id, of the code of the task function, of the
+    source file of the module defining the function and of the fingerprints of the input data nodes. The fingerprint
+    of a file based data node is the hash of its file, the fingerprint of a SQL data node is the result of its
+    *checksum_query* property if any, and the fingerprint of any other data node is the hash of its data. Two
+    executions of the same task on identical data, from different scenarios or after an input was rewritten with the
+    same content, share the same key.
+
+    The results are stored in the "memoization" folder of the storage folder: the files of the file based output data
+    nodes are copied, the other results are pickled. The results of at most `_MAX_NB_OF_EXECUTIONS` executions are
+    kept: storing new results evicts the results restored or stored the longest time ago. `_clean()` removes all the
+    stored results.
+    """
+
+    _MAX_NB_OF_EXECUTIONS = 1000
+    __FOLDER = "memoization"
+    __FILE_SUFFIX = ".file"
+    __PICKLE_SUFFIX = ".p"
+    __CHUNK_SIZE = 1 << 20
+    # Hashes of the files fingerprinted by the current process, by path, size and modification time.
+    __file_hashes: Dict[Tuple[str, int, int], str] = {}
+    __logger = _TaipyLogger._get_logger()
+
+    @classmethod
+    def _get_key(
+        cls,
+        task_config_id: str,
+        function: Callable,
+        input_data_nodes: Sequence[DataNode],
+        read: Callable[[DataNodeId], Any],
+    ) -> str:
+        """Returns the key of the execution of a task function on the given input data nodes.
+
+        Parameters:
+            task_config_id (str): The identifier of the task configuration.
+            function (Callable): The task function.
+            input_data_nodes (Sequence[DataNode^]): The input data nodes, in the order of the function arguments.
+            read (Callable): The function reading the data of an input data node from its id, used when the data
+                node can only be fingerprinted from its data.
+        """
+        key = hashlib.sha256(task_config_id.encode())
+        cls.__hash_function(key, function)
+        for data_node in input_data_nodes:
+            key.update(cls._fingerprint(data_node, read).encode())
+        return key.hexdigest()
+
+    @classmethod
+    def _fingerprint(cls, data_node: DataNode, read: Callable[[DataNodeId], Any]) -> str:
+        if isinstance(data_node, _AbstractFileDataNode) and os.path.isfile(data_node.path):  # type: ignore
+            return cls.__hash_file(data_node.path)  # type: ignore
+        if isinstance(data_node, _AbstractSQLDataNode) and (
+            query := data_node.properties.get(DataNodeConfig._OPTIONAL_CHECKSUM_QUERY_SQL_PROPERTY)
+        ):
+            with data_node._get_engine().connect() as connection:
+                return hashlib.sha256(repr(connection.execute(text(query)).fetchall()).encode()).hexdigest()
+        return cls.__hash_data(read(data_node.id))
+
+    @classmethod
+    def _restore(
+        cls,
+        key: str,
+        output_data_nodes: Sequence[DataNode],
+        job_id: JobId,
+        write_results: Callable[[Iterable[Tuple[DataNodeId, Any]], JobId], List[Exception]],
+    ) -> Optional[List[Exception]]:
+        """Write the results stored for the given key to the output data nodes.
+
+        The stored files are copied to the file based data nodes, the other results are written with the
+        `write_results` function.
+
+        Returns:
+            The exceptions raised while writing the results, or None if no result is stored for the key.
+        """
+        folder = cls.__get_folder(key)
+        try:
+            # Marks the results as recently used, so that they are evicted last.
+            os.utime(folder)
+        except OSError:  # Not stored, or evicted.
+            return None
+        stored_paths: List[Tuple[str, bool]] = []
+        for i, data_node in enumerate(output_data_nodes):
+            file_path = os.path.join(folder, f"{i}{cls.__FILE_SUFFIX}")
+            pickle_path = os.path.join(folder, f"{i}{cls.__PICKLE_SUFFIX}")
+            if isinstance(data_node, _AbstractFileDataNode) and os.path.isfile(file_path):
+                stored_paths.append((file_path, True))
+            elif os.path.isfile(pickle_path):
+                stored_paths.append((pickle_path, False))
+            else:
+                return None
+
+        _Interruption._report_writing(job_id)
+        data_manager = _DataManagerFactory._build_manager()
+        results = []
+        for data_node, (path, is_file) in zip(output_data_nodes, stored_paths):
+            if is_file:
+                # The file is copied rather than linked: data nodes overwrite their files in place, which would
+                # alter the stored results.
+                shutil.copyfile(path, data_node.path)  # type: ignore
+                data_node.track_edit(job_id=job_id)
+                data_node.unlock_edit()
+                data_manager._set(data_node)
+            else:
+                with open(path, "rb") as pf:
+                    results.append((data_node.id, pickle.load(pf)))
+        return write_results(results, job_id)
+
+    @classmethod
+    def _store(cls, key: str, output_data_nodes: Sequence[DataNode], results: Sequence[Any]):
+        """Store the results of an execution under the given key, unless some results are already stored."""
+        folder = cls.__get_folder(key)
+        if os.path.isdir(folder):
+            return
+        # The results are written in a temporary folder renamed at the end, so that they are never partially read.
+        tmp_folder = f"{folder}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(tmp_folder)
+            for i, (data_node, result) in enumerate(zip(output_data_nodes, results)):
+                if isinstance(data_node, _AbstractFileDataNode) and os.path.isfile(data_node.path):  # type: ignore
+                    shutil.copyfile(data_node.path, os.path.join(tmp_folder, f"{i}{cls.__FILE_SUFFIX}"))  # type: ignore
+                else:
+                    with open(os.path.join(tmp_folder, f"{i}{cls.__PICKLE_SUFFIX}"), "wb") as pf:
+                        pickle.dump(result, pf)
+            os.rename(tmp_folder, folder)
+        except Exception as e:
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+            if not os.path.isdir(folder):
+                cls.__logger.warning(f"Results of key {key} could not be memoized: {e}")
+            return
+        cls.__evict()
+
+    @classmethod
+    def _clean(cls):
+        """Remove all the stored results."""
+        shutil.rmtree(cls.__get_folder(), ignore_errors=True)
+
+    @classmethod
+    def __evict(cls):
+        """Remove the results of the least recently used executions beyond `_MAX_NB_OF_EXECUTIONS`."""
+        executions = []
+        with os.scandir(cls.__get_folder()) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    executions.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:  # Evicted by another process in the meantime.
+                    continue
+        executions.sort()
+        for _, folder in executions[: max(len(executions) - cls._MAX_NB_OF_EXECUTIONS, 0)]:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    @classmethod
+    def __get_folder(cls, key: str = "") -> str:
+        return os.path.join(Config.core.storage_folder, cls.__FOLDER, key)
+
+    @classmethod
+    def __hash_file(cls, path: str) -> str:
+        stat = os.stat(path)
+        file_key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if (file_hash := cls.__file_hashes.get(file_key)) is None:
+            digest = hashlib.blake2b(digest_size=32)
+            with open(path, "rb") as f:
+                while chunk := f.read(cls.__CHUNK_SIZE):
+                    digest.update(chunk)
+            file_hash = cls.__file_hashes[file_key] = digest.hexdigest()
+        return file_hash
+
+    @staticmethod
+    def __hash_data(data: Any) -> str:
+        digest = hashlib.blake2b(digest_size=32)
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            try:
+                hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+            except TypeError:  # Unhashable values, such as lists.
+                hashes = None
+            if hashes is not None:
+                digest.update(repr(data.dtypes.to_dict() if isinstance(data, pd.DataFrame) else data.dtype).encode())
+                digest.update(hashes.tobytes())
+                return digest.hexdigest()
+        elif isinstance(data, np.ndarray) and data.dtype != object:
+            digest.update(f"{data.dtype}{data.shape}".encode())
+            digest.update(np.ascontiguousarray(data).data)
+            return digest.hexdigest()
+        digest.update(pickle.dumps(data, protocol=4))
+        return digest.hexdigest()
+
+    @classmethod
+    def __hash_function(cls, key, function: Callable):
+        key.update(f"{getattr(function, '__module__', None)}.{getattr(function, '__qualname__', None)}".encode())
+        if (code := getattr(function, "__code__", None)) is not None:
+            cls.__hash_code(key, code)
+        # The source of the module also covers the helper functions and the global variables defined next to the
+        # task function.
+        module = sys.modules.get(getattr(function, "__module__", None) or "")
+        if (path := getattr(module, "__file__", None)) and os.path.isfile(path):
+            key.update(cls.__hash_file(path).encode())
+
+    @classmethod
+    def __hash_code(cls, key, code: types.CodeType):
+        key.update(code.co_code)
+        key.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                cls.__hash_code(key, const)
+            else:
+                key.update(repr(const).encode())
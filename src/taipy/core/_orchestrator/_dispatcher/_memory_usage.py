@@ -0,0 +1,103 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional
+
+from taipy.config.config import Config
+
+
+class _MemoryUsage:
+    """Memory of the jobs, in megabytes, by task configuration id.
+
+    The memory of a job is the *memory* of its task configuration, or else the largest peak resident memory
+    measured on the jobs of the task configuration executed in a worker process. On Linux, the peak of the worker
+    process is reset before each job, so that it is measured job by job. Elsewhere, the peak of the worker process
+    since it started is measured instead, which overestimates the memory of the jobs following a larger one. The
+    memory of the task configurations without any measured job is unknown, estimated as 0.
+    """
+
+    _MB = 1 << 20
+
+    # Queue the current worker process reports the peak memory of the jobs it executes on.
+    __reports: Optional[Any] = None
+    __peaks: Dict[str, float] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def _initialize_worker(cls, reports: Optional[Any]):
+        """Prepare a new worker process to report the peak memory of the jobs it executes on the given queue."""
+        cls.__reports = reports
+
+    @classmethod
+    @contextmanager
+    def _measured(cls, job_ids: Iterable[str]):
+        """Context in which the peak memory of the current worker process is measured for the given jobs."""
+        if cls.__reports is None:
+            yield
+            return
+        cls.__reset_peak()
+        try:
+            yield
+        finally:
+            if (peak := cls.__get_peak()) is not None:
+                for job_id in job_ids:
+                    cls.__reports.put((job_id, os.getpid(), peak))
+
+    @staticmethod
+    def __reset_peak():
+        try:
+            with open("/proc/self/clear_refs", "w") as clear_refs:
+                clear_refs.write("5")
+        except OSError:
+            pass
+
+    @classmethod
+    def __get_peak(cls) -> Optional[float]:
+        try:
+            with open("/proc/self/status") as status:
+                for line in status:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) * 1024 / cls._MB
+        except (OSError, ValueError):
+            pass
+        try:
+            import resource
+        except ImportError:  # Windows.
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # In bytes on macOS, in kilobytes elsewhere.
+        return peak / cls._MB if sys.platform == "darwin" else peak * 1024 / cls._MB
+
+    @classmethod
+    def _record(cls, task_config_id: str, peak: float):
+        with cls.__lock:
+            cls.__peaks[task_config_id] = max(peak, cls.__peaks.get(task_config_id, 0.0))
+
+    @classmethod
+    def _get_peak(cls, task_config_id: Optional[str]) -> Optional[float]:
+        return cls.__peaks.get(task_config_id) if task_config_id else None
+
+    @classmethod
+    def _estimate(cls, task_config_id: Optional[str]) -> float:
+        """Returns the estimated memory of a job of the given task configuration, in megabytes."""
+        task_config = Config.tasks.get(task_config_id) if task_config_id else None
+        if task_config is not None and (memory := task_config.memory) is not None:
+            return memory
+        return cls._get_peak(task_config_id) or 0.0
+
+    @classmethod
+    def _clean(cls):
+        with cls.__lock:
+            cls.__peaks.clear()
@@ -0,0 +1,102 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import process as _process
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional
+
+
+def _retire():
+    """Work item submitted to a `_ResizableProcessPoolExecutor` to retire the worker process executing it."""
+
+
+class _RetirableQueues:
+    """Call and result queues of a worker process, making the process exit when it receives a `_retire` work item.
+
+    The work item is handed to the worker loop as the None sentinel the loop exits on. The process id the loop
+    reports when exiting is reported as the result of the work item instead, with the process id as the id of the
+    exiting process, as the loop does when a process reaches its maximum number of tasks. The executor thus completes
+    the work item and forgets the process without considering the executor broken.
+    """
+
+    def __init__(self, call_queue, result_queue):
+        self._call_queue = call_queue
+        self._result_queue = result_queue
+        self._retire_work_id: Optional[int] = None
+
+    def get(self, block: bool = True):
+        call_item = self._call_queue.get(block=block)
+        if call_item is not None and call_item.fn is _retire:
+            self._retire_work_id = call_item.work_id
+            return None
+        return call_item
+
+    def put(self, obj: Any):
+        if isinstance(obj, int) and self._retire_work_id is not None:
+            obj = _process._ResultItem(self._retire_work_id, exit_pid=obj)  # type: ignore
+        self._result_queue.put(obj)
+
+
+def _run_retirable_worker(call_queue, result_queue, *args):
+    queues = _RetirableQueues(call_queue, result_queue)
+    _process._process_worker(queues, queues, *args)  # type: ignore
+
+
+class _ResizableProcessPoolExecutor(ProcessPoolExecutor):
+    """Process pool executor whose maximum number of worker processes can change while it runs.
+
+    Growing the executor spawns the missing worker processes at once, if the executor has started its processes.
+    Shrinking it retires as many idle worker processes as needed, by submitting a `_retire` work item per process
+    to retire: the first worker processes free to execute them exit, so that no running job is disturbed.
+
+    The executor relies on private internals of `concurrent.futures.process`, so it is only used with the Python
+    versions it was checked against, see `_is_supported()`. With the other versions, an executor is resized by
+    replacing it with a new one.
+    """
+
+    _CHECKED_VERSIONS = ((3, 11),)
+
+    @classmethod
+    def _is_supported(cls) -> bool:
+        """Returns True if the executor can be used with the running Python version."""
+        return sys.version_info[:2] in cls._CHECKED_VERSIONS
+
+    def _resize(self, max_workers: int):
+        """Change the maximum number of worker processes of the executor."""
+        with self._shutdown_lock:  # type: ignore
+            if self._broken or self._shutdown_thread:  # type: ignore
+                return
+            self._max_workers = max_workers  # type: ignore
+            nb_of_processes = len(self._processes)  # type: ignore
+            if 0 < nb_of_processes < max_workers:
+                while len(self._processes) < max_workers:  # type: ignore
+                    self._spawn_process()
+        for _ in range(nb_of_processes - max_workers):
+            try:
+                self.submit(_retire)
+            except (BrokenProcessPool, RuntimeError):  # Broken or shut down in the meantime.
+                return
+
+    def _spawn_process(self):
+        process = self._mp_context.Process(  # type: ignore
+            target=_run_retirable_worker,
+            args=(
+                self._call_queue,  # type: ignore
+                self._result_queue,  # type: ignore
+                self._initializer,  # type: ignore
+                self._initargs,  # type: ignore
+                self._max_tasks_per_child,  # type: ignore
+            ),
+        )
+        process.start()
+        self._processes[process.pid] = process  # type: ignore
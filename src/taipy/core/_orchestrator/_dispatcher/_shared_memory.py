@@ -0,0 +1,140 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Union
+
+from ...config.data_node_config import DataNodeConfig
+
+
+class _SharedMemory:
+    """Hands data over between jobs executed in different worker processes through shared memory segments.
+
+    The data is pickled with protocol 5. The out-of-band buffers of NumPy arrays, pandas DataFrames or Arrow tables
+    are copied once in the segment, and the processes reading the data map them copy-on-write, without copying: a
+    process modifying the data in place only modifies its private copy of the modified pages. A segment is named
+    after a submission and a data node, and lives until it is unlinked when the submission is finished.
+
+    A segment is made of the size of its header, its header (the sizes of the pickled data and of its buffers), the
+    pickled data and the buffers.
+    """
+
+    # Storage types of the data nodes whose data is handed over.
+    _STORAGE_TYPES = {DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY, DataNodeConfig._STORAGE_TYPE_VALUE_PICKLE}
+
+    __PREFIX = "taipy_"
+    __SIZE = struct.Struct("<Q")
+    __ALIGNMENT = 64
+    # Segments read by the current process, kept open as long as their buffers are in use.
+    __mapped_segments: List[Union[SharedMemory, mmap.mmap]] = []
+
+    @staticmethod
+    def _is_available() -> bool:
+        # On Windows, a segment is destroyed as soon as the process that published it closes it.
+        return os.name == "posix"
+
+    @classmethod
+    def _segment_name(cls, submit_id: str, dn_id: str) -> str:
+        # Segment names are limited to 30 characters on some platforms.
+        return cls.__PREFIX + hashlib.sha1(f"{submit_id}/{dn_id}".encode()).hexdigest()[:20]
+
+    @classmethod
+    def _publish(cls, name: str, data: Any):
+        """Publish the given data in the segment of the given name, replacing the previous one if any."""
+        buffers: List[pickle.PickleBuffer] = []
+        payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        try:
+            chunks = [memoryview(payload), *(buffer.raw() for buffer in buffers)]
+        except BufferError:  # Non-contiguous buffers cannot be copied as is, they are pickled in-band.
+            chunks = [memoryview(pickle.dumps(data, protocol=5))]
+        header = pickle.dumps([chunk.nbytes for chunk in chunks])
+        offsets = cls.__get_offsets(len(header), [chunk.nbytes for chunk in chunks])
+
+        cls._unlink(name)
+        segment = SharedMemory(name, create=True, size=offsets[-1] + chunks[-1].nbytes)
+        try:
+            cls.__SIZE.pack_into(segment.buf, 0, len(header))
+            segment.buf[cls.__SIZE.size : cls.__SIZE.size + len(header)] = header
+            for chunk, offset in zip(chunks, offsets):
+                segment.buf[offset : offset + chunk.nbytes] = chunk
+        finally:
+            segment.close()
+
+    @classmethod
+    def _read(cls, name: str, copy: bool = False) -> Any:
+        """Read the data published in the segment of the given name.
+
+        Parameters:
+            name (str): The name of the segment.
+            copy (bool): If True, the buffers are copied and the segment is closed. Otherwise, the data references
+                a copy-on-write mapping of the buffers of the segment, which stays mapped until
+                `_release_mapped_segments()` is called once the data is no longer used.
+        Raises:
+            FileNotFoundError: If no data is published under the given name.
+        """
+        segment = SharedMemory(name)
+        if copy:
+            try:
+                data = cls.__load(segment.buf, copy=True)
+            except Exception:
+                cls.__mapped_segments.append(segment)
+                raise
+            segment.close()
+            return data
+        try:
+            # A private mapping: its pages are shared with the segment until they are modified.
+            mapping = mmap.mmap(segment._fd, segment.size, access=mmap.ACCESS_COPY)  # type: ignore
+        finally:
+            segment.close()
+        cls.__mapped_segments.append(mapping)
+        return cls.__load(memoryview(mapping), copy=False)
+
+    @classmethod
+    def __load(cls, buffer: memoryview, copy: bool) -> Any:
+        (header_size,) = cls.__SIZE.unpack_from(buffer, 0)
+        sizes = pickle.loads(buffer[cls.__SIZE.size : cls.__SIZE.size + header_size])
+        chunks = [buffer[offset : offset + size] for offset, size in zip(cls.__get_offsets(header_size, sizes), sizes)]
+        buffers = [bytearray(chunk) if copy else chunk for chunk in chunks[1:]]
+        return pickle.loads(chunks[0], buffers=buffers)
+
+    @classmethod
+    def _release_mapped_segments(cls):
+        """Close the segments mapped by the current process whose buffers are no longer in use."""
+        segments, cls.__mapped_segments = cls.__mapped_segments, []
+        for segment in segments:
+            try:
+                segment.close()
+            except BufferError:
+                cls.__mapped_segments.append(segment)
+
+    @staticmethod
+    def _unlink(name: str):
+        try:
+            segment = SharedMemory(name)
+        except FileNotFoundError:
+            return
+        segment.close()
+        segment.unlink()
+
+    @classmethod
+    def __get_offsets(cls, header_size: int, sizes: List[int]) -> List[int]:
+        offsets = []
+        offset = cls.__SIZE.size + header_size
+        for size in sizes:
+            offset += -offset % cls.__ALIGNMENT
+            offsets.append(offset)
+            offset += size
+        return offsets
@@ -9,25 +9,210 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import inspect
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import threading
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import partial
-from typing import Optional
+from time import monotonic
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
 
 from taipy.config._serializer._toml_serializer import _TomlSerializer
 from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
 
+from ...config.data_node_config import DataNodeConfig
+from ...config.job_config import JobConfig
+from ...config.task_config import TaskConfig
+from ...data._data_manager_factory import _DataManagerFactory
+from ...data.in_memory import InMemoryDataNode
 from ...job.job import Job
+from ...job.job_id import JobId
+from ...task.task import Task
 from .._abstract_orchestrator import _AbstractOrchestrator
+from ._interruption import _Interruption
 from ._job_dispatcher import _JobDispatcher
+from ._resizable_process_pool_executor import _ResizableProcessPoolExecutor
+from ._shared_memory import _SharedMemory
+from ._worker_pool import _WorkerPool
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
-    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor.
+
+    The jobs of the tasks configured with the "thread" executor are dispatched on a ThreadPoolExecutor instead,
+    the jobs of the tasks configured with a pool are dispatched on the executor of this named pool, and the jobs
+    of the tasks whose function is a coroutine function run on the event loop of the dispatcher. The jobs of a
+    chain fused by the orchestrator are executed one after the other by a single worker. If `JobConfig^`
+    .use_shared_memory is set, the worker processes hand the data of the "in_memory" and "pickle" data nodes over
+    through shared memory.
+
+    A running job can be interrupted, when it is canceled or when it exceeds the timeout of its task configuration.
+    Its task function is interrupted, see `_Interruption`. If the job is still running in a worker process after
+    `_INTERRUPTION_GRACE_PERIOD` seconds, the process is killed: its pool executor is replaced by a new one, and the
+    other jobs the broken executor was running are queued again. The outputs the killed or aborted jobs may have
+    partially written are invalidated, see `__invalidate_partial_outputs()`.
+
+    The process pools configured with a minimum number of workers are autoscaled, see `_WorkerPool`. Every
+    `_SCALING_PERIOD` seconds, a pool grows to run all the jobs waiting for its workers, up to its maximum number
+    of workers, or shrinks to its busy workers, down to its minimum number of workers, if some of its workers have
+    been idle for `JobConfig^`.worker_idle_timeout seconds.
+    """
+
+    _INTERRUPTION_GRACE_PERIOD = 5.0
+    _SCALING_PERIOD = 1.0
+    __logger = _TaipyLogger._get_logger()
 
     def __init__(self, orchestrator: Optional[_AbstractOrchestrator]):
         super().__init__(orchestrator)
-        self._executor = ProcessPoolExecutor(Config.job_config.max_nb_of_workers or 1)  # type: ignore
-        self._nb_available_workers = self._executor._max_workers  # type: ignore
+        # The config is blocked as long as the dispatcher lives, so it is serialized once for all the jobs.
+        self._config_as_string = _TomlSerializer()._serialize(Config._applied_config)
+        self._config_fingerprint = hashlib.sha256(self._config_as_string.encode()).hexdigest()
+        job_config = Config.job_config
+        # Folder the interruptions of the jobs running in worker processes are requested in, see `_Interruption`.
+        self._interruption_requests_folder = os.path.join(tempfile.gettempdir(), f"taipy_{uuid.uuid4().hex}")
+        if job_config.max_tasks_per_child and sys.version_info < (3, 11):
+            self.__logger.warning(
+                f"{JobConfig._MAX_TASKS_PER_CHILD_KEY} is only supported from Python 3.11. The worker processes are"
+                f" not replaced."
+            )
+        self._pools: Dict[str, _WorkerPool] = {
+            JobConfig._DEFAULT_POOL: self.__create_process_pool(
+                JobConfig._DEFAULT_POOL,
+                job_config.max_nb_of_workers,
+                job_config.min_nb_of_workers,
+                job_config.start_method,
+            ),
+            JobConfig._THREAD_POOL: self.__create_thread_pool(
+                JobConfig._THREAD_POOL, job_config.max_nb_of_threads or job_config.max_nb_of_workers
+            ),
+        }
+        for name, pool in (job_config.pools or {}).items():
+            self._pools[name] = self.__create_pool(name, pool)
+        if any(pool.is_autoscaled for pool in self._pools.values()):
+            self._scaling_period = self._SCALING_PERIOD
+        self._worker_idle_timeout = float(
+            job_config.worker_idle_timeout or JobConfig._DEFAULT_WORKER_IDLE_TIMEOUT  # type: ignore
+        )
+        self._last_scaling_time = monotonic()
+        self._nb_available_coroutines = int(
+            job_config.max_nb_of_coroutines or JobConfig._DEFAULT_MAX_NB_OF_COROUTINES  # type: ignore
+        )
+        self._use_shared_memory = bool(job_config.use_shared_memory) and _SharedMemory._is_available()
+        # Names of the shared memory segments of the unfinished submissions.
+        self._shared_memory_segments: Dict[str, Set[str]] = {}
+        self._shared_memory_lock = threading.Lock()
+        # Pools running the jobs that can be interrupted, None for the event loop, with the ids of the jobs their
+        # worker executes and the executor of the worker, by job id.
+        self._running_jobs: Dict[str, Tuple[Optional[_WorkerPool], Tuple[str, ...], Optional[Executor]]] = {}
+        # Running jobs being interrupted, with their timeout if they exceeded it, by job id.
+        self._interrupted_jobs: Dict[str, Optional[float]] = {}
+        # Jobs whose execution is aborted, because their worker process is killed or because their executor broke
+        # when the worker process of another job was killed, with whether they started writing their outputs, by
+        # job id.
+        self._aborted_jobs: Dict[str, bool] = {}
+        # First jobs of the executions aborted when the worker process of another job was killed, to queue again.
+        self._jobs_to_requeue: Set[str] = set()
+
+    @property
+    def _executor(self) -> Executor:
+        return self._pools[JobConfig._DEFAULT_POOL].executor
+
+    @property
+    def _thread_executor(self) -> Executor:
+        return self._pools[JobConfig._THREAD_POOL].executor
+
+    @property  # type: ignore
+    def _nb_available_workers(self) -> int:
+        return self._pools[JobConfig._DEFAULT_POOL].nb_available_workers
+
+    @_nb_available_workers.setter
+    def _nb_available_workers(self, nb_available_workers: int):
+        self._pools[JobConfig._DEFAULT_POOL].nb_available_workers = nb_available_workers
+
+    @property
+    def _nb_available_threads(self) -> int:
+        return self._pools[JobConfig._THREAD_POOL].nb_available_workers
+
+    def __create_pool(self, name: str, pool: Dict[str, Any]) -> _WorkerPool:
+        max_nb_of_workers = pool.get(JobConfig._MAX_NB_OF_WORKERS_KEY)
+        if pool.get(JobConfig._EXECUTOR_KEY) == TaskConfig._THREAD_EXECUTOR:
+            return self.__create_thread_pool(name, max_nb_of_workers)
+        return self.__create_process_pool(
+            name,
+            max_nb_of_workers,
+            pool.get(JobConfig._MIN_NB_OF_WORKERS_KEY),
+            pool.get(JobConfig._START_METHOD_KEY),
+        )
+
+    def __create_process_pool(
+        self, name: str, max_nb_of_workers, min_nb_of_workers, start_method: Optional[str]
+    ) -> _WorkerPool:
+        reports = multiprocessing.get_context(start_method).SimpleQueue()
+        create_executor = partial(self.__create_process_executor, start_method=start_method, reports=reports)
+        return _WorkerPool(
+            name,
+            create_executor,
+            int(max_nb_of_workers or 1),
+            int(min_nb_of_workers) if min_nb_of_workers else None,
+            reports,
+        )
+
+    def __create_process_executor(self, nb_of_workers: int, start_method: Optional[str], reports) -> Executor:
+        if _ResizableProcessPoolExecutor._is_supported():
+            executor_class: Type[ProcessPoolExecutor] = _ResizableProcessPoolExecutor
+        else:
+            executor_class = ProcessPoolExecutor
+        return executor_class(
+            nb_of_workers,
+            initializer=self._initialize_worker,
+            initargs=(self._config_as_string, self._config_fingerprint, reports, self._interruption_requests_folder),
+            **self.__get_executor_options(start_method),
+        )
+
+    @staticmethod
+    def __create_thread_pool(name: str, max_nb_of_workers) -> _WorkerPool:
+        return _WorkerPool(
+            name,
+            partial(ThreadPoolExecutor, thread_name_prefix="Thread-Taipy-Job"),
+            int(max_nb_of_workers or 1),
+        )
+
+    @staticmethod
+    def __get_executor_options(start_method: Optional[str]) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+        if start_method:
+            options["mp_context"] = multiprocessing.get_context(start_method)
+        if (max_tasks_per_child := Config.job_config.max_tasks_per_child) and sys.version_info >= (3, 11):
+            options["max_tasks_per_child"] = int(max_tasks_per_child)
+        return options
+
+    def _has_free_worker(self, task_config_id: Optional[str]) -> bool:
+        if self.__runs_in_event_loop(task_config_id):
+            return self._nb_available_coroutines > 0
+        return self._pools[self.__get_pool(task_config_id)].nb_available_workers > 0
+
+    @staticmethod
+    def __runs_in_event_loop(task_config_id: Optional[str]) -> bool:
+        task_config = Config.tasks.get(task_config_id) if task_config_id else None
+        return task_config is not None and inspect.iscoroutinefunction(task_config.function)
+
+    def __get_pool(self, task_config_id: Optional[str]) -> str:
+        task_config = Config.tasks.get(task_config_id) if task_config_id else None
+        if task_config is None:
+            return JobConfig._DEFAULT_POOL
+        if task_config.pool in self._pools:
+            return task_config.pool  # type: ignore
+        if task_config.executor == TaskConfig._THREAD_EXECUTOR:
+            return JobConfig._THREAD_POOL
+        return JobConfig._DEFAULT_POOL
 
     def _dispatch(self, job: Job):
         """Dispatches the given `Job^` on an available worker for execution.
@@ -35,18 +220,402 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         Parameters:
             job (Job^): The job to submit on an executor with an available worker.
         """
-        self._nb_available_workers -= 1
+        if self.__runs_in_event_loop(job.task.config_id):
+            self.__dispatch_in_event_loop(job)
+            return
 
-        config_as_string = _TomlSerializer()._serialize(Config._applied_config)
-        future = self._executor.submit(self._wrapped_function_with_config_load, config_as_string, job.id, job.task)
+        pool = self._pools[self.__get_pool(job.task.config_id)]
+        with self._condition:
+            pool.nb_available_workers -= 1
+        task = job.task
+        self._reserve_memory(job.id, [task.config_id])
+
+        submit_id = None
+        executor = pool.executor
+        if pool.is_thread_pool:
+            # Threads share the applied config and the managers of the dispatcher, so nothing needs to be sent.
+            future = executor.submit(self._wrapped_function, job.id, task)
+        else:
+            submit_id = self.__prepare_shared_memory(job.submit_id, [task]) if self._use_shared_memory else None
+            # Only identifiers and the task function reference are sent to the worker, which reads and writes the
+            # data nodes from the repositories anyway. Pickling the task would also pickle its data nodes.
+            future = executor.submit(
+                self._wrapped_function_with_config_load,
+                self._config_as_string,
+                self._config_fingerprint,
+                job.id,
+                task.function,
+                tuple(dn.id for dn in task.input.values()),
+                tuple(dn.id for dn in task.output.values()),
+                submit_id,
+                task.config_id,
+            )
 
         self._set_dispatched_processes(job.id, future)  # type: ignore
-        future.add_done_callback(self._release_worker)
+        self.__track_running_jobs(future, pool, executor, (job.id,), self.__get_timeout(task.config_id))
+        future.add_done_callback(partial(self._release_worker, pool))
+        if submit_id:
+            future.add_done_callback(partial(self._collect_in_memory_outputs, submit_id, [task]))
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
-    def _release_worker(self, _):
-        self._nb_available_workers += 1
+    def _dispatch_fused_jobs(self, jobs: List[Job]):
+        """Dispatches the given chain of fused `Job^`s on a single available worker for execution.
+
+        The chain runs on the pool of its first job. The intermediate data nodes of the chain are passed in memory
+        from one job to the next, and are also written unless their *persist* property is False.
+
+        Parameters:
+            jobs (List[Job^]): The jobs of the chain, in execution order.
+        """
+        pool = self._pools[self.__get_pool(jobs[0].task.config_id)]
+        with self._condition:
+            pool.nb_available_workers -= 1
+        tasks = [job.task for job in jobs]
+        self._reserve_memory(jobs[0].id, [task.config_id for task in tasks])
+        steps = self._get_chain_steps(jobs)
+        unwritten_dn_ids = self._get_unwritten_dn_ids(tasks)
+        submit_id = None
+        executor = pool.executor
+        if pool.is_thread_pool:
+            future = executor.submit(self._wrapped_chain, steps, unwritten_dn_ids)
+        else:
+            if self._use_shared_memory:
+                submit_id = self.__prepare_shared_memory(jobs[0].submit_id, tasks, unwritten_dn_ids)
+            future = executor.submit(
+                self._wrapped_chain_with_config_load,
+                self._config_as_string,
+                self._config_fingerprint,
+                steps,
+                unwritten_dn_ids,
+                submit_id,
+            )
+
+        for job in jobs:
+            self._set_dispatched_processes(job.id, future)  # type: ignore
+        self.__track_running_jobs(future, pool, executor, tuple(job.id for job in jobs))
+        future.add_done_callback(partial(self._release_worker, pool))
+        if submit_id:
+            future.add_done_callback(partial(self._collect_in_memory_outputs, submit_id, tasks))
+        future.add_done_callback(partial(self._update_fused_job_statuses_from_future, jobs))
+
+    def __prepare_shared_memory(
+        self, submit_id: str, tasks: Sequence[Task], unwritten_dn_ids: Set[str] = frozenset()  # type: ignore
+    ) -> str:
+        """Register the shared memory segments the given tasks read and write for the given submission.
+
+        The data of the "in_memory" input data nodes that no job of the submission wrote in a worker process is
+        published from the memory of the dispatcher process.
+        """
+        with self._shared_memory_lock:
+            segment_names = self._shared_memory_segments.setdefault(submit_id, set())
+            for task in tasks:
+                for dn in task.input.values():
+                    if dn.id in unwritten_dn_ids or dn.storage_type() != DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
+                        continue
+                    segment_name = _SharedMemory._segment_name(submit_id, dn.id)
+                    if segment_name not in segment_names and dn.last_edit_date:
+                        _SharedMemory._publish(segment_name, dn._read())
+                        segment_names.add(segment_name)
+                for dn in task.output.values():
+                    if dn.id not in unwritten_dn_ids and dn.storage_type() in _SharedMemory._STORAGE_TYPES:
+                        segment_names.add(_SharedMemory._segment_name(submit_id, dn.id))
+        return submit_id
+
+    def _collect_in_memory_outputs(self, submit_id: str, tasks: Sequence[Task], _):
+        """Copy the data written by a worker process to "in_memory" data nodes into the dispatcher process memory."""
+        for task in tasks:
+            for dn in task.output.values():
+                if dn.storage_type() != DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
+                    continue
+                try:
+                    dn._write(_SharedMemory._read(_SharedMemory._segment_name(submit_id, dn.id), copy=True))
+                except FileNotFoundError:  # Not written by the job.
+                    pass
+
+    def _on_submission_finished(self, submit_id: str):
+        with self._shared_memory_lock:
+            segment_names = self._shared_memory_segments.pop(submit_id, ())
+        for segment_name in segment_names:
+            _SharedMemory._unlink(segment_name)
+
+    def __dispatch_in_event_loop(self, job: Job):
+        with self._condition:
+            self._nb_available_coroutines -= 1
+
+        task = job.task
+        self._reserve_memory(job.id, [task.config_id])
+        future = self._wrapped_coroutine(job.id, task)
+
+        self._set_dispatched_processes(job.id, future)  # type: ignore
+        self.__track_running_jobs(future, None, None, (job.id,), self.__get_timeout(task.config_id))
+        future.add_done_callback(self._release_coroutine)
+        future.add_done_callback(partial(self._update_job_status_from_future, job))
+
+    def _release_worker(self, pool: _WorkerPool, _):
+        with self._condition:
+            pool.nb_available_workers += 1
+            self._condition.notify()
+
+    def _release_coroutine(self, _):
+        with self._condition:
+            self._nb_available_coroutines += 1
+            self._condition.notify()
 
     def _update_job_status_from_future(self, job: Job, ft):
         self._pop_dispatched_process(job.id)  # type: ignore
-        self._update_job_status(job, ft.result())
+        interrupted, timeout = job.id in self._interrupted_jobs, self._interrupted_jobs.pop(job.id, None)
+        aborted_jobs = self.__pop_aborted_jobs([job])
+        try:
+            exceptions = ft.result()
+        except Exception as e:  # Canceled before it started or killed worker process.
+            if self.__requeue(job, aborted_jobs, e):
+                return
+            exceptions = [e]
+        if interrupted and exceptions:
+            self.__on_job_interrupted(job, timeout, aborted_jobs=aborted_jobs)
+        else:
+            self._update_job_status(job, exceptions)
+
+    def _update_fused_job_statuses_from_future(self, jobs: List[Job], ft):
+        for job in jobs:
+            self._pop_dispatched_process(job.id)  # type: ignore
+        interrupted = {job.id for job in jobs if job.id in self._interrupted_jobs}
+        for job_id in interrupted:
+            self._interrupted_jobs.pop(job_id, None)
+        aborted_jobs = self.__pop_aborted_jobs(jobs)
+        try:
+            chain_exceptions = ft.result()
+        except Exception as e:  # Killed worker process.
+            if self.__requeue(jobs[0], aborted_jobs, e, jobs[1:]):
+                return
+            chain_exceptions = [[e]]
+        for i, (job, exceptions) in enumerate(zip(jobs, chain_exceptions)):
+            if i > 0:
+                self.orchestrator._remove_fused_job(job)  # type: ignore
+            if exceptions is None:
+                # Not executed, the job has been abandoned after the failure of a previous job of the chain.
+                break
+            if interrupted and exceptions:
+                # The whole chain is interrupted, the jobs not canceled themselves are abandoned.
+                self.__on_job_interrupted(job, None, canceled=job.id in interrupted, aborted_jobs=aborted_jobs)
+            else:
+                self._update_job_status(job, exceptions)
+            if exceptions:
+                break
+
+    def _scale_pools(self):
+        now = monotonic()
+        if self._scaling_period is None or now - self._last_scaling_time < self._scaling_period:
+            return
+        self._last_scaling_time = now
+        backlogs: Dict[str, int] = {}
+        for job_handle in self.orchestrator.jobs_to_run:  # type: ignore
+            # The jobs waiting for memory would not run on additional workers.
+            if self.__runs_in_event_loop(job_handle.task_config_id) or not self._fits_in_memory_budget(job_handle):
+                continue
+            pool_name = self.__get_pool(job_handle.task_config_id)
+            backlogs[pool_name] = backlogs.get(pool_name, 0) + 1
+        with self._condition:
+            for pool in self._pools.values():
+                if pool.is_autoscaled:
+                    self.__scale_pool(pool, backlogs.get(pool.name, 0), now)
+
+    def __scale_pool(self, pool: _WorkerPool, backlog: int, now: float):
+        if backlog > pool.nb_available_workers:
+            pool.idle_since = None
+            if pool.nb_of_workers < pool.max_nb_of_workers:
+                nb_of_workers = min(pool.nb_of_busy_workers + backlog, pool.max_nb_of_workers)
+                self.__logger.info(f"Worker pool {pool.name} scales up to {nb_of_workers} workers.")
+                pool._resize(nb_of_workers)
+        elif backlog == 0 and pool.nb_available_workers > 0:
+            if pool.idle_since is None:
+                pool.idle_since = now
+            elif now - pool.idle_since >= self._worker_idle_timeout:
+                nb_of_workers = max(pool.nb_of_busy_workers, pool.min_nb_of_workers)
+                if nb_of_workers < pool.nb_of_workers:
+                    self.__logger.info(f"Worker pool {pool.name} scales down to {nb_of_workers} workers.")
+                    pool._resize(nb_of_workers)
+        else:
+            pool.idle_since = None
+
+    def _get_pool_metrics(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name: {
+                "nb_of_workers": pool.nb_of_workers,
+                "nb_of_busy_workers": pool.nb_of_busy_workers,
+                "min_nb_of_workers": pool.min_nb_of_workers,
+                "max_nb_of_workers": pool.max_nb_of_workers,
+            }
+            for name, pool in self._pools.items()
+        }
+
+    def _interrupt_job(self, job_id: JobId, timeout: Optional[float] = None) -> bool:
+        """Interrupt the given running job.
+
+        The job is canceled once its execution stops, unless it completes in the meantime. A job interrupted
+        because it exceeded its timeout fails instead.
+
+        Parameters:
+            job_id (JobId): The identifier of the job to interrupt.
+            timeout (Optional[float]): The timeout exceeded by the job, if any.
+        Returns:
+            True if the job is running and is being interrupted.
+        """
+        running_job = self._running_jobs.get(job_id)
+        future = self._dispatched_processes.get(job_id)
+        if running_job is None or future is None or future.done():
+            return False
+        pool, job_ids, executor = running_job
+        self._interrupted_jobs[job_id] = timeout
+        if future.cancel() or pool is None:
+            # Not started yet, or a coroutine, canceled at its next await.
+            return True
+        if pool.is_thread_pool:
+            if not any(_Interruption._interrupt_thread(running_job_id) for running_job_id in job_ids):
+                self.__logger.info(f"{job_id} is not running its task function and cannot be interrupted.")
+            return True
+        if _Interruption._SIGNAL is None:
+            self.__kill_worker(pool, job_ids, executor, future)
+            return True
+        if (pid := self.__get_worker_pid(pool, job_ids)) is not None:
+            # The worker process only raises the interruption if the job it runs is requested to stop.
+            _Interruption._request(self._interruption_requests_folder, job_ids)
+            os.kill(pid, _Interruption._SIGNAL)
+        timer = threading.Timer(self._INTERRUPTION_GRACE_PERIOD, self.__kill_worker, (pool, job_ids, executor, future))
+        timer.daemon = True
+        timer.start()
+        return True
+
+    def __track_running_jobs(
+        self,
+        future: Future,
+        pool: Optional[_WorkerPool],
+        executor: Optional[Executor],
+        job_ids: Tuple[str, ...],
+        timeout: Optional[float] = None,
+    ):
+        for job_id in job_ids:
+            self._running_jobs[job_id] = (pool, job_ids, executor)
+        future.add_done_callback(partial(self.__forget_running_jobs, pool, job_ids))
+        if timeout:
+            timer = threading.Timer(timeout, self._interrupt_job, (job_ids[0], timeout))
+            timer.daemon = True
+            timer.start()
+            future.add_done_callback(lambda _: timer.cancel())
+
+    def __forget_running_jobs(self, pool: Optional[_WorkerPool], job_ids: Tuple[str, ...], _):
+        for job_id in job_ids:
+            self._running_jobs.pop(job_id, None)
+        if pool is not None and not pool.is_thread_pool and any(job_id in self._interrupted_jobs for job_id in job_ids):
+            _Interruption._discard_requests(self._interruption_requests_folder, job_ids)
+        if pool is not None and (aborted_job_ids := [job_id for job_id in job_ids if job_id in self._aborted_jobs]):
+            # The reports of the dead worker processes are collected before the pool forgets the jobs.
+            writing_job_ids = pool._get_writing_jobs(*aborted_job_ids)
+            for job_id in aborted_job_ids:
+                self._aborted_jobs[job_id] = job_id in writing_job_ids
+        peak_memories = pool._forget_jobs(*job_ids) if pool is not None else ()
+        self._release_memory(job_ids[0], peak_memories)
+
+    @staticmethod
+    def __get_timeout(task_config_id: str) -> Optional[float]:
+        task_config = Config.tasks.get(task_config_id)
+        return task_config.timeout if task_config else None
+
+    @staticmethod
+    def __get_worker_pid(pool: _WorkerPool, job_ids: Tuple[str, ...]) -> Optional[int]:
+        return next((pid for job_id in job_ids if (pid := pool._get_worker_pid(job_id)) is not None), None)
+
+    def __kill_worker(self, pool: _WorkerPool, job_ids: Tuple[str, ...], executor: Executor, future: Future):
+        if future.done():
+            return
+        if (pid := self.__get_worker_pid(pool, job_ids)) is None:
+            self.__logger.warning(f"The worker process running {job_ids[0]} cannot be found.")
+            return
+        if pool._get_running_job_id(pid) not in job_ids:
+            # The job stopped in the meantime and its worker process runs another job.
+            return
+        self.__logger.warning(f"{job_ids[0]} does not stop, its worker process is killed.")
+        with self._condition:
+            if executor is pool.executor:
+                # The executor is replaced before it breaks, so that no job is dispatched on the broken executor.
+                pool.executor = pool.create_executor(pool.nb_of_workers)
+            # All the jobs submitted to the executor fail when it breaks. The ones of the other workers are queued
+            # again.
+            for job_id, (_, other_job_ids, other_executor) in list(self._running_jobs.items()):
+                if other_executor is executor:
+                    self._aborted_jobs[job_id] = False
+                    if job_id == other_job_ids[0] and other_job_ids != job_ids:
+                        self._jobs_to_requeue.add(job_id)
+        # The process id is the one the worker process reported when starting the job.
+        os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        executor.shutdown(wait=False)
+
+    def __pop_aborted_jobs(self, jobs: Sequence[Job]) -> Dict[str, bool]:
+        return {job.id: self._aborted_jobs.pop(job.id) for job in jobs if job.id in self._aborted_jobs}
+
+    def __requeue(self, job: Job, aborted_jobs: Dict[str, bool], e: Exception, fused_jobs: Sequence[Job] = ()) -> bool:
+        if job.id not in self._jobs_to_requeue:
+            return False
+        self._jobs_to_requeue.discard(job.id)
+        if not isinstance(e, BrokenProcessPool):
+            return False
+        self.__logger.warning(f"The worker process of another job was killed, {job.id} is queued again.")
+        for aborted_job in (job, *fused_jobs):
+            if aborted_jobs.get(aborted_job.id):
+                # The job keeps the lock on its outputs until it is executed again.
+                self.__invalidate_partial_outputs(aborted_job)
+        self.orchestrator._requeue_job(job)  # type: ignore
+        return True
+
+    def __on_job_interrupted(
+        self, job: Job, timeout: Optional[float], canceled: bool = True, aborted_jobs: Optional[Dict[str, bool]] = None
+    ):
+        invalidated_dn_ids = self.__invalidate_partial_outputs(job) if (aborted_jobs or {}).get(job.id) else set()
+        self.__unlock_outputs(job, invalidated_dn_ids)
+        if timeout is not None:
+            self._update_job_status(job, [TimeoutError(f"Job {job.id} exceeded its timeout of {timeout} seconds.")])
+        elif not job._is_finished():
+            if canceled:
+                job.canceled()
+                self.__logger.info(f"{job.id} has been interrupted and canceled.")
+            else:
+                job.abandoned()
+
+    @classmethod
+    def __invalidate_partial_outputs(cls, job: Job) -> Set[str]:
+        """Invalidate the outputs the given aborted job may have partially written, having started writing them.
+
+        Only the metadata of the data nodes is changed, their data is left as is. The outputs not written to the end
+        by the job lose their last edit date and stay locked, so that they are not read until they are written
+        again. The outputs the job wrote to the end are kept, as well as the "in_memory" data nodes, whose data is
+        only written in the memory of the worker process.
+
+        Returns:
+            The ids of the invalidated data nodes.
+        """
+        data_manager = _DataManagerFactory._build_manager()
+        invalidated_dn_ids = set()
+        for dn in job.task.output.values():
+            dn = data_manager._get(dn.id)
+            if dn.storage_type() == InMemoryDataNode.storage_type():
+                continue
+            if any(edit.get("job_id") == job.id for edit in dn._edits):
+                continue
+            dn._last_edit_date = None
+            dn._edit_in_progress = True
+            data_manager._set(dn)
+            invalidated_dn_ids.add(dn.id)
+            cls.__logger.warning(f"{dn.id} may be partially written by {job.id}. It stays locked until written again.")
+        return invalidated_dn_ids
+
+    @staticmethod
+    def __unlock_outputs(job: Job, invalidated_dn_ids: Set[str]):
+        data_manager = _DataManagerFactory._build_manager()
+        for dn in job.task.output.values():
+            if dn.id in invalidated_dn_ids:
+                continue
+            dn = data_manager._get(dn.id)
+            dn._edit_in_progress = False
+            dn._editor_id = None
+            dn._editor_expiration_date = None
+            data_manager._set(dn)
@@ -9,64 +9,313 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+import asyncio
+import importlib
+import inspect
+import os
+import threading
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple
 
 from taipy.config._serializer._toml_serializer import _TomlSerializer
 from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
 
+from ...config.data_node_config import DataNodeConfig
 from ...data._data_manager_factory import _DataManagerFactory
-from ...data.data_node import DataNode
+from ...data.data_node_id import DataNodeId
 from ...exceptions import DataNodeWritingError
+from ...job._job_manager_factory import _JobManagerFactory
 from ...job.job_id import JobId
+from ...task._task_manager_factory import _TaskManagerFactory
 from ...task.task import Task
+from ._interruption import _Interruption
+from ._memoization import _Memoization
+from ._memory_usage import _MemoryUsage
+from ._shared_memory import _SharedMemory
 
 
 class _TaskFunctionWrapper:
+    # Fingerprint of the config applied in the current worker process.
+    __config_fingerprint: Optional[str] = None
+    # Event loop running the coroutine task functions of the current process, started on first use. A forked
+    # process inherits the loop but not its thread, hence the process id.
+    __event_loop: Optional[asyncio.AbstractEventLoop] = None
+    __event_loop_pid: Optional[int] = None
+    __event_loop_lock = threading.Lock()
+    __logger = _TaipyLogger._get_logger()
+
     @classmethod
-    def _wrapped_function_with_config_load(cls, config_as_string, job_id: JobId, task: Task):
-        Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-        Config.block_update()
-        return cls._wrapped_function(job_id, task)
+    def _initialize_worker(cls, config_as_string, config_fingerprint: str, reports=None, requests_folder=None):
+        """Prepare a new worker process before it executes its first job.
+
+        The config is applied, the managers are built and the modules of the task functions are imported ahead
+        of time, so that jobs do not pay for it. The process reports on the `reports` queue the jobs it starts,
+        so that they can be interrupted, and the peak memory of the jobs it executes. The interruptions of its
+        jobs are requested in the `requests_folder` folder.
+        """
+        _Interruption._initialize_worker(reports, requests_folder)
+        _MemoryUsage._initialize_worker(reports)
+        try:
+            cls.__load_config(config_as_string, config_fingerprint)
+            for manager_factory in [_DataManagerFactory, _TaskManagerFactory, _JobManagerFactory]:
+                manager_factory._build_manager()
+            for task_config in Config.tasks.values():
+                if module := getattr(task_config.function, "__module__", None):
+                    importlib.import_module(module)
+        except Exception as e:
+            # A failing initializer would break the whole pool. Jobs load what they need by themselves instead.
+            cls.__logger.warning(f"Worker process could not be initialized: {e}")
 
     @classmethod
-    def _wrapped_function(cls, job_id: JobId, task: Task):
+    def _wrapped_function_with_config_load(
+        cls,
+        config_as_string,
+        config_fingerprint: str,
+        job_id: JobId,
+        function: Callable,
+        input_dn_ids: Tuple[DataNodeId, ...],
+        output_dn_ids: Tuple[DataNodeId, ...],
+        submit_id: Optional[str] = None,
+        task_config_id: Optional[str] = None,
+    ):
+        """Execute a job in a worker process.
+
+        If a submission id is given, the data of the "in_memory" and "pickle" data nodes are handed over through
+        the shared memory segments of the submission. If the configuration of the task is memoized, the stored
+        results are reused when the input data is unchanged.
+        """
+        cls.__load_config(config_as_string, config_fingerprint)
         try:
-            inputs: List[DataNode] = list(task.input.values())
-            outputs: List[DataNode] = list(task.output.values())
+            with _MemoryUsage._measured((job_id,)):
+                return cls.__execute(job_id, function, input_dn_ids, output_dn_ids, submit_id, task_config_id)
+        finally:
+            _SharedMemory._release_mapped_segments()
 
-            fct = task.function
+    @staticmethod
+    def __load_config(config_as_string, config_fingerprint: str):
+        if config_fingerprint != _TaskFunctionWrapper.__config_fingerprint:
+            Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+            Config.block_update()
+            _TaskFunctionWrapper.__config_fingerprint = config_fingerprint
 
-            results = fct(*cls.__read_inputs(inputs))
-            return cls.__write_data(outputs, results, job_id)
+    @classmethod
+    def _wrapped_function(cls, job_id: JobId, task: Task):
+        try:
+            input_dn_ids = tuple(dn.id for dn in task.input.values())
+            output_dn_ids = tuple(dn.id for dn in task.output.values())
+            return cls.__execute(job_id, task.function, input_dn_ids, output_dn_ids, task_config_id=task.config_id)
         except Exception as e:
             return [e]
 
     @classmethod
-    def __read_inputs(cls, inputs: List[DataNode]) -> List[Any]:
+    def _wrapped_chain_with_config_load(
+        cls,
+        config_as_string,
+        config_fingerprint: str,
+        steps: Tuple[Tuple[JobId, Callable, Tuple[DataNodeId, ...], Tuple[DataNodeId, ...]], ...],
+        unwritten_dn_ids: Collection[DataNodeId],
+        submit_id: Optional[str] = None,
+    ):
+        cls.__load_config(config_as_string, config_fingerprint)
+        try:
+            with _MemoryUsage._measured(tuple(job_id for job_id, _, _, _ in steps)):
+                return cls._wrapped_chain(steps, unwritten_dn_ids, submit_id)
+        finally:
+            _SharedMemory._release_mapped_segments()
+
+    @classmethod
+    def _wrapped_chain(
+        cls,
+        steps: Tuple[Tuple[JobId, Callable, Tuple[DataNodeId, ...], Tuple[DataNodeId, ...]], ...],
+        unwritten_dn_ids: Collection[DataNodeId],
+        submit_id: Optional[str] = None,
+    ) -> List[Optional[List[Exception]]]:
+        """Execute the jobs of a fused chain of tasks one after the other.
+
+        Each step is made of the job id, the task function and the input and output data node ids of a job. The
+        outputs read by the next steps are kept in memory. The data nodes of `unwritten_dn_ids` are not written,
+        they are only unlocked. The other data are handed over through shared memory if a submission id is given.
+
+        Returns:
+            The exceptions raised by each step, or None for the steps not executed because a previous step failed.
+        """
         data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        chain_input_dn_ids = {dn_id for _, _, input_dn_ids, _ in steps for dn_id in input_dn_ids}
+        in_memory_data: Dict[DataNodeId, Any] = {}
+        exceptions: List[Optional[List[Exception]]] = [None] * len(steps)
+        for i, (job_id, function, input_dn_ids, output_dn_ids) in enumerate(steps):
+            try:
+                with _Interruption._interruptible(job_id):
+                    inputs = [
+                        in_memory_data[dn_id] if dn_id in in_memory_data else cls.__read_input(dn_id, submit_id)
+                        for dn_id in input_dn_ids
+                    ]
+                    results = function(*inputs)
+                results = cls.__extract_results(output_dn_ids, results) if output_dn_ids else []
+                to_write = []
+                for dn_id, result in zip(output_dn_ids, results):
+                    if dn_id in chain_input_dn_ids:
+                        in_memory_data[dn_id] = result
+                    if dn_id in unwritten_dn_ids:
+                        data_manager._get(dn_id).unlock_edit()
+                    else:
+                        to_write.append((dn_id, result))
+                exceptions[i] = cls.__write_results(to_write, job_id, submit_id)
+            except Exception as e:
+                exceptions[i] = [e]
+            if exceptions[i]:
+                break
+        return exceptions
+
+    @classmethod
+    def _wrapped_coroutine(cls, job_id: JobId, task: Task) -> Future:
+        """Schedule the execution of a task whose function is a coroutine function on the event loop.
+
+        Returns:
+            The future of the execution results, as returned by `_wrapped_function()`.
+        """
+        input_dn_ids = tuple(dn.id for dn in task.input.values())
+        output_dn_ids = tuple(dn.id for dn in task.output.values())
+        return asyncio.run_coroutine_threadsafe(
+            cls.__execute_coroutine(job_id, task.function, input_dn_ids, output_dn_ids), cls.__get_event_loop()
+        )
+
+    @classmethod
+    def __execute(
+        cls,
+        job_id: JobId,
+        function: Callable,
+        input_dn_ids: Tuple[DataNodeId, ...],
+        output_dn_ids: Tuple[DataNodeId, ...],
+        submit_id: Optional[str] = None,
+        task_config_id: Optional[str] = None,
+    ):
+        if inspect.iscoroutinefunction(function):
+            return asyncio.run_coroutine_threadsafe(
+                cls.__execute_coroutine(job_id, function, input_dn_ids, output_dn_ids), cls.__get_event_loop()
+            ).result()
+        try:
+            if task_config_id and (task_config := Config.tasks.get(task_config_id)) and task_config.memoize:
+                return cls.__execute_memoized(task_config_id, job_id, function, input_dn_ids, output_dn_ids, submit_id)
+            with _Interruption._interruptible(job_id):
+                results = function(*cls.__read_inputs(input_dn_ids, submit_id))
+            return cls.__write_data(output_dn_ids, results, job_id, submit_id)
+        except Exception as e:
+            return [e]
 
     @classmethod
-    def __write_data(cls, outputs: List[DataNode], results, job_id: JobId):
+    def __execute_memoized(
+        cls,
+        task_config_id: str,
+        job_id: JobId,
+        function: Callable,
+        input_dn_ids: Tuple[DataNodeId, ...],
+        output_dn_ids: Tuple[DataNodeId, ...],
+        submit_id: Optional[str] = None,
+    ) -> List[Exception]:
         data_manager = _DataManagerFactory._build_manager()
+        inputs: Dict[DataNodeId, Any] = {}
+
+        def read(dn_id: DataNodeId) -> Any:
+            # The inputs fingerprinted from their data are read once, for both the key and the function.
+            if dn_id not in inputs:
+                inputs[dn_id] = cls.__read_input(dn_id, submit_id)
+            return inputs[dn_id]
+
+        input_data_nodes = [data_manager._get(dn_id) for dn_id in input_dn_ids]
+        output_data_nodes = [data_manager._get(dn_id) for dn_id in output_dn_ids]
+        key = _Memoization._get_key(task_config_id, function, input_data_nodes, read)
+        write_results = partial(cls.__write_results, submit_id=submit_id)
+        if (exceptions := _Memoization._restore(key, output_data_nodes, job_id, write_results)) is not None:
+            return exceptions
+
+        with _Interruption._interruptible(job_id):
+            results = function(*(read(dn_id) for dn_id in input_dn_ids))
+        _results = cls.__extract_results(output_dn_ids, results) if output_dn_ids else []
+        if not (exceptions := cls.__write_results(zip(output_dn_ids, _results), job_id, submit_id)):
+            _Memoization._store(key, output_data_nodes, _results)
+        return exceptions
+
+    @classmethod
+    async def __execute_coroutine(
+        cls,
+        job_id: JobId,
+        function: Callable,
+        input_dn_ids: Tuple[DataNodeId, ...],
+        output_dn_ids: Tuple[DataNodeId, ...],
+    ):
+        # The data nodes are read and written in the default executor, not to block the other coroutines.
+        loop = asyncio.get_running_loop()
         try:
-            if outputs:
-                _results = cls.__extract_results(outputs, results)
-                exceptions = []
-                for res, dn in zip(_results, outputs):
-                    try:
-                        data_node = data_manager._get(dn.id)
-                        data_node.write(res, job_id=job_id)
-                        data_manager._set(data_node)
-                    except Exception as e:
-                        exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
-                return exceptions
+            inputs = await loop.run_in_executor(None, partial(cls.__read_inputs, input_dn_ids))
+            results = await function(*inputs)
+            return await loop.run_in_executor(None, partial(cls.__write_data, output_dn_ids, results, job_id))
         except Exception as e:
             return [e]
 
+    @staticmethod
+    def __get_event_loop() -> asyncio.AbstractEventLoop:
+        with _TaskFunctionWrapper.__event_loop_lock:
+            if _TaskFunctionWrapper.__event_loop is None or _TaskFunctionWrapper.__event_loop_pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="Thread-Taipy-EventLoop", daemon=True).start()
+                _TaskFunctionWrapper.__event_loop = loop
+                _TaskFunctionWrapper.__event_loop_pid = os.getpid()
+            return _TaskFunctionWrapper.__event_loop
+
+    @classmethod
+    def __read_inputs(cls, input_dn_ids: Tuple[DataNodeId, ...], submit_id: Optional[str] = None) -> List[Any]:
+        return [cls.__read_input(dn_id, submit_id) for dn_id in input_dn_ids]
+
+    @staticmethod
+    def __read_input(dn_id: DataNodeId, submit_id: Optional[str]) -> Any:
+        data_node = _DataManagerFactory._build_manager()._get(dn_id)
+        if submit_id and data_node.storage_type() in _SharedMemory._STORAGE_TYPES:
+            try:
+                return _SharedMemory._read(_SharedMemory._segment_name(submit_id, dn_id))
+            except FileNotFoundError:  # Not written by a job of the submission.
+                pass
+        return data_node.read_or_raise()
+
+    @classmethod
+    def __write_data(
+        cls, output_dn_ids: Tuple[DataNodeId, ...], results, job_id: JobId, submit_id: Optional[str] = None
+    ):
+        try:
+            if output_dn_ids:
+                _results = cls.__extract_results(output_dn_ids, results)
+                return cls.__write_results(zip(output_dn_ids, _results), job_id, submit_id)
+        except Exception as e:
+            return [e]
+
+    @staticmethod
+    def __write_results(
+        results: Iterable[Tuple[DataNodeId, Any]], job_id: JobId, submit_id: Optional[str] = None
+    ) -> List[Exception]:
+        _Interruption._report_writing(job_id)
+        data_manager = _DataManagerFactory._build_manager()
+        exceptions: List[Exception] = []
+        for dn_id, res in results:
+            try:
+                data_node = data_manager._get(dn_id)
+                if submit_id and data_node.storage_type() in _SharedMemory._STORAGE_TYPES:
+                    _SharedMemory._publish(_SharedMemory._segment_name(submit_id, dn_id), res)
+                if submit_id and data_node.storage_type() == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
+                    # The data of the worker process memory is collected from the segment by the dispatcher.
+                    data_node.track_edit(job_id=job_id)
+                    data_node.unlock_edit()
+                else:
+                    data_node.write(res, job_id=job_id)
+                data_manager._set(data_node)
+            except Exception as e:
+                exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn_id}: {e}"))
+        return exceptions
+
     @classmethod
-    def __extract_results(cls, outputs: List[DataNode], results: Any) -> List[Any]:
-        _results: List[Any] = [results] if len(outputs) == 1 else results
-        if len(_results) != len(outputs):
+    def __extract_results(cls, output_dn_ids: Tuple[DataNodeId, ...], results: Any) -> List[Any]:
+        _results: List[Any] = [results] if len(output_dn_ids) == 1 else results
+        if len(_results) != len(output_dn_ids):
             raise DataNodeWritingError("Error: wrong number of result or task output")
         return _results
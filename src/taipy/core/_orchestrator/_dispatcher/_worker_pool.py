@@ -0,0 +1,164 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from ._interruption import _Interruption
+from ._resizable_process_pool_executor import _ResizableProcessPoolExecutor
+
+
+class _WorkerPool:
+    """Named executor of the standalone dispatcher, with the number of its workers free to execute a job.
+
+    A pool whose minimum number of workers is lower than its maximum is autoscaled. It starts with its minimum
+    number of workers, grows when jobs wait for its workers, and shrinks when some of its workers stay idle. A
+    `_ResizableProcessPoolExecutor` is resized in place: the pool grows by spawning new processes and shrinks by
+    retiring idle processes. The other executors cannot be resized, so they are replaced with a new executor of
+    the new size. In both cases, the running jobs are not disturbed: the processes of a replaced executor exit
+    once their job is over.
+
+    Attributes:
+        name (str): The name of the pool.
+        executor (Executor): The process or thread pool executor running the jobs of the pool.
+        min_nb_of_workers (int): The minimum number of workers of the pool, equal to `max_nb_of_workers` if the
+            pool is not autoscaled.
+        max_nb_of_workers (int): The maximum number of jobs able to run in parallel in the pool.
+        nb_of_workers (int): The current number of workers of the pool.
+        nb_available_workers (int): The number of workers free to execute a job.
+        create_executor (Callable[[int], Executor]): The function creating an executor of the given number of
+            workers for the pool, used to resize the pool when its executor cannot be resized in place and to replace
+            a process pool executor broken by the termination of one of its processes.
+        reports (Optional[SimpleQueue]): The queue the processes of a process pool report on, with their process
+            id, the jobs they start, the jobs starting to write their outputs and the peak memory of the jobs they
+            execute.
+        idle_since (Optional[float]): The monotonic time since which some workers of the pool are idle while no
+            job waits for them, if they are.
+    """
+
+    __slots__ = (
+        "name",
+        "executor",
+        "min_nb_of_workers",
+        "max_nb_of_workers",
+        "nb_of_workers",
+        "nb_available_workers",
+        "create_executor",
+        "reports",
+        "idle_since",
+        "_worker_pids",
+        "_running_job_ids",
+        "_writing_job_ids",
+        "_peak_memories",
+        "_worker_pids_lock",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        create_executor: Callable[[int], Executor],
+        max_nb_of_workers: int,
+        min_nb_of_workers: Optional[int] = None,
+        reports: Optional[Any] = None,
+    ):
+        self.name = name
+        self.max_nb_of_workers = max_nb_of_workers
+        self.min_nb_of_workers = min(min_nb_of_workers or max_nb_of_workers, max_nb_of_workers)
+        self.nb_of_workers = self.min_nb_of_workers
+        self.nb_available_workers = self.nb_of_workers
+        self.create_executor = create_executor
+        self.executor = create_executor(self.nb_of_workers)
+        self.reports = reports
+        self.idle_since: Optional[float] = None
+        # Processes running the jobs started in the pool, by job id.
+        self._worker_pids: Dict[str, int] = {}
+        # Last job started by each process of the pool, by process id.
+        self._running_job_ids: Dict[int, str] = {}
+        # Jobs started in the pool that started writing their outputs.
+        self._writing_job_ids: Set[str] = set()
+        # Peak memory in megabytes of the processes that executed the jobs of the pool, by job id.
+        self._peak_memories: Dict[str, float] = {}
+        self._worker_pids_lock = threading.Lock()
+
+    @property
+    def is_thread_pool(self) -> bool:
+        return isinstance(self.executor, ThreadPoolExecutor)
+
+    @property
+    def is_autoscaled(self) -> bool:
+        return self.min_nb_of_workers < self.max_nb_of_workers
+
+    @property
+    def nb_of_busy_workers(self) -> int:
+        return self.nb_of_workers - self.nb_available_workers
+
+    def _resize(self, nb_of_workers: int):
+        """Resize the executor of the pool to the given number of workers, or replace it if it cannot be resized.
+
+        The dispatcher condition must be held, so that no job is dispatched meanwhile.
+        """
+        if isinstance(self.executor, _ResizableProcessPoolExecutor):
+            self.executor._resize(nb_of_workers)
+        else:
+            executor, self.executor = self.executor, self.create_executor(nb_of_workers)
+            executor.shutdown(wait=False)
+        self.nb_available_workers += nb_of_workers - self.nb_of_workers
+        self.nb_of_workers = nb_of_workers
+        self.idle_since = None
+
+    def _get_worker_pid(self, job_id: str) -> Optional[int]:
+        """Returns the id of the process running the given job, if the job has started in a process of the pool."""
+        with self._worker_pids_lock:
+            self.__collect_reports()
+            return self._worker_pids.get(job_id)
+
+    def _get_running_job_id(self, pid: int) -> Optional[str]:
+        """Returns the id of the unfinished job the given process of the pool started last, if any."""
+        with self._worker_pids_lock:
+            self.__collect_reports()
+            return self._running_job_ids.get(pid)
+
+    def _get_writing_jobs(self, *job_ids: str) -> Set[str]:
+        """Returns the given jobs that started writing their outputs in a process of the pool."""
+        with self._worker_pids_lock:
+            self.__collect_reports()
+            return self._writing_job_ids.intersection(job_ids)
+
+    def _forget_jobs(self, *job_ids: str) -> Tuple[Optional[float], ...]:
+        """Forget the processes of the given finished jobs.
+
+        Returns:
+            The peak memory in megabytes of the processes that executed the given jobs, or None for the jobs whose
+            peak memory is unknown.
+        """
+        with self._worker_pids_lock:
+            self.__collect_reports()
+            for job_id in job_ids:
+                self._writing_job_ids.discard(job_id)
+                if (pid := self._worker_pids.pop(job_id, None)) is not None and self._running_job_ids.get(
+                    pid
+                ) == job_id:
+                    del self._running_job_ids[pid]
+            return tuple(self._peak_memories.pop(job_id, None) for job_id in job_ids)
+
+    def __collect_reports(self):
+        if self.reports is None:
+            return
+        while not self.reports.empty():
+            job_id, pid, report = self.reports.get()
+            if report is None:
+                self._worker_pids[job_id] = pid
+                self._running_job_ids[pid] = job_id
+            elif report == _Interruption._WRITING:
+                self._writing_job_ids.add(job_id)
+            else:
+                self._peak_memories[job_id] = report
@@ -0,0 +1,108 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Optional, Set, Tuple
+
+from taipy.config.config import Config
+
+from ..job.job import Job
+from ..job.job_id import JobId
+from ..task.task_id import TaskId
+
+
+class _JobHandle:
+    """Compact reference to a `Job^` waiting in the orchestrator to be dispatched.
+
+    The orchestrator only needs identifiers to block, unblock, cancel or abandon jobs, so it no longer has to
+    reload jobs, tasks and data nodes to find them. A handle does not hold the job entity, which holds its task and
+    data nodes: the job is loaded from the repository when it is dispatched, see `_Orchestrator._get_job()`.
+
+    Attributes:
+        id (JobId): The identifier of the job.
+        task_id (TaskId): The identifier of the task of the job.
+        task_config_id (str): The identifier of the configuration of the task of the job.
+        input_dn_ids (Tuple[str, ...]): The identifiers of the task input data nodes.
+        output_dn_ids (Tuple[str, ...]): The identifiers of the task output data nodes.
+        submit_id (str): The identifier of the submission the job belongs to.
+        priority (int): The scheduling priority of the job: the priority of its submission plus the priority of
+            its task configuration.
+        remaining_duration (float): The estimated number of seconds between the start of the job and the end of
+            the longest path of jobs of its submission it starts. Only estimated with the *"critical_path"*
+            scheduling policy, 0 otherwise.
+        share (Optional[str]): The share of the workers the job is dispatched on: the user of its submission, or
+            else its submission id. Only set with the *"fair_share"* scheduling policy, None otherwise.
+        share_weight (float): The weight of the share of the job.
+        blocking_dn_ids (Set[str]): The identifiers of the input data nodes the job waits for while it is blocked.
+        fused_jobs (Tuple[_JobHandle, ...]): The handles of the jobs that follow the job in a fused chain of tasks
+            and are dispatched with it.
+    """
+
+    __slots__ = (
+        "id",
+        "task_id",
+        "task_config_id",
+        "input_dn_ids",
+        "output_dn_ids",
+        "submit_id",
+        "priority",
+        "remaining_duration",
+        "share",
+        "share_weight",
+        "blocking_dn_ids",
+        "fused_jobs",
+    )
+
+    def __init__(
+        self,
+        id: JobId,
+        task_id: TaskId,
+        input_dn_ids: Tuple[str, ...],
+        output_dn_ids: Tuple[str, ...],
+        submit_id: str,
+        priority: int = 0,
+        task_config_id: Optional[str] = None,
+    ):
+        self.id = id
+        self.task_id = task_id
+        self.task_config_id = task_config_id
+        self.input_dn_ids = input_dn_ids
+        self.output_dn_ids = output_dn_ids
+        self.submit_id = submit_id
+        self.priority = priority
+        self.remaining_duration = 0.0
+        self.share: Optional[str] = None
+        self.share_weight = 1.0
+        self.blocking_dn_ids: Set[str] = set()
+        self.fused_jobs: Tuple["_JobHandle", ...] = ()
+
+    @classmethod
+    def _from_job(cls, job: Job, submission_priority: int = 0) -> "_JobHandle":
+        task = job._get_task()
+        return cls(
+            job.id,
+            task.id,
+            tuple(dn.id for dn in task.input.values()),
+            tuple(dn.id for dn in task.output.values()),
+            job.submit_id,
+            submission_priority + cls.__get_task_priority(task.config_id),
+            task.config_id,
+        )
+
+    @staticmethod
+    def __get_task_priority(task_config_id: str) -> int:
+        task_config = Config.tasks.get(task_config_id)
+        return (task_config.priority or 0) if task_config else 0
+
+    def __eq__(self, other):
+        return self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
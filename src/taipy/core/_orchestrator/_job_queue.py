@@ -0,0 +1,232 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import heapq
+import itertools
+import math
+import threading
+from queue import Empty
+from time import monotonic
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ._job_handle import _JobHandle
+from ._task_durations import _TaskDurations
+from ._wait_times import _WaitTimes
+
+_Rank = Tuple[int, float, int]
+_Heap = List[Tuple[_Rank, _JobHandle]]
+
+
+class _JobQueue:
+    """Indexed priority queue of the job handles ready to be dispatched.
+
+    Job handles are ordered by priority level, then by remaining duration, then by arrival. To prevent starvation,
+    a job handle gains one priority level for every `_AGING_PERIOD` seconds spent in the queue: the level of a job
+    handle is its priority minus the number of aging periods elapsed before its arrival. The remaining duration only
+    breaks the ties between the job handles of the same level, so that with the *"critical_path"* scheduling policy
+    the jobs starting the longest paths of their submission are dispatched first, without ever overtaking a job of
+    a higher level. The position of each job handle in the heap is
+    indexed by job id, so that a job handle can be removed in O(log n). The queued job handles are also counted by
+    task configuration id, so that the dispatcher can tell whether any queued job can run without scanning the heaps.
+
+    With the *"fair_share"* scheduling policy, the job handles are queued in one heap per share, and the shares are
+    served by stride scheduling: the virtual time of a share is the estimated duration of its dispatched jobs
+    divided by its weight, and the share with the lowest virtual time is served first. A share that gets job handles
+    again after having none starts at the lowest virtual time of the queued shares, so that it does not catch up on
+    the time it did not use. The job handles without a share are queued in a single heap, as before.
+    """
+
+    _AGING_PERIOD = 60.0
+
+    def __init__(self):
+        # The heap of the queued job handles of each share, None being the share of the job handles without one.
+        self._heaps: Dict[Optional[str], _Heap] = {}
+        # The position of each queued job handle in the heap of its share, by job id.
+        self._positions: Dict[str, int] = {}
+        self._shares: Dict[str, Optional[str]] = {}
+        self._virtual_times: Dict[Optional[str], float] = {}
+        self._arrival_times: Dict[str, float] = {}
+        # The number of queued job handles, by task configuration id.
+        self._task_config_counts: Dict[Optional[str], int] = {}
+        self._size = 0
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def put(self, job_handle: _JobHandle):
+        """Add a job handle to the queue, or reschedule it if it is already queued."""
+        with self._lock:
+            if job_handle.id in self._positions:
+                self.__remove_at(self._shares[job_handle.id], self._positions[job_handle.id])
+            arrival_time = self._arrival_times.setdefault(job_handle.id, monotonic())
+            if (heap := self._heaps.get(job_handle.share)) is None:
+                heap = self._heaps[job_handle.share] = []
+                self.__start_share(job_handle.share)
+            # Ranking a job handle by the aging periods elapsed before its arrival minus its priority makes the
+            # waiting time compensate for the priority difference, without ever having to update the ranks of the
+            # queued job handles.
+            level = math.floor(arrival_time / self._AGING_PERIOD) - job_handle.priority
+            rank = (level, -job_handle.remaining_duration, next(self._counter))
+            heap.append((rank, job_handle))
+            self._positions[job_handle.id] = len(heap) - 1
+            self._shares[job_handle.id] = job_handle.share
+            task_config_id = job_handle.task_config_id
+            self._task_config_counts[task_config_id] = self._task_config_counts.get(task_config_id, 0) + 1
+            self._size += 1
+            self.__sift_up(heap, len(heap) - 1)
+
+    def get(self, accept: Optional[Callable[[_JobHandle], bool]] = None) -> _JobHandle:
+        """Remove and return the job handle to dispatch first.
+
+        Parameters:
+            accept (Optional[Callable]): The optional predicate the job handle must satisfy, for instance to
+                skip the jobs whose executor has no free worker.
+        Raises:
+            Empty: If the queue holds no (accepted) job handle.
+        """
+        with self._lock:
+            if (found := self.__find(accept)) is None:
+                raise Empty
+            share, position = found
+            job_handle = self.__remove_at(share, position)
+            if share is not None:
+                self.__charge(job_handle)
+            if (arrival_time := self._arrival_times.pop(job_handle.id, None)) is not None:
+                _WaitTimes._record(job_handle.submit_id, monotonic() - arrival_time)
+            return job_handle
+
+    def find(self, accept: Optional[Callable[[_JobHandle], bool]] = None) -> Optional[_JobHandle]:
+        """Return the job handle to dispatch first, if any, without removing it from the queue."""
+        with self._lock:
+            if (found := self.__find(accept)) is None:
+                return None
+            share, position = found
+            return self._heaps[share][position][1]
+
+    def remove(self, job_id: str) -> Optional[_JobHandle]:
+        """Remove the job handle of the given job id from the queue, if queued."""
+        with self._lock:
+            if (position := self._positions.get(job_id)) is None:
+                return None
+            self._arrival_times.pop(job_id, None)
+            return self.__remove_at(self._shares[job_id], position)
+
+    def task_config_ids(self) -> List[Optional[str]]:
+        """Return the task configuration ids of the queued job handles."""
+        with self._lock:
+            return list(self._task_config_counts)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._positions
+
+    def __iter__(self) -> Iterator[_JobHandle]:
+        """Iterate over a snapshot of the queued job handles, in no particular order."""
+        with self._lock:
+            return iter([job_handle for heap in self._heaps.values() for _, job_handle in heap])
+
+    def __find(self, accept: Optional[Callable[[_JobHandle], bool]]) -> Optional[Tuple[Optional[str], int]]:
+        if len(self._heaps) == 1:
+            shares = list(self._heaps)
+        else:
+            # The ties are broken by the rank of the first job handle of each share.
+            shares = sorted(self._heaps, key=lambda s: (self._virtual_times.get(s, 0.0), self._heaps[s][0][0]))
+        for share in shares:
+            if (position := self.__find_in(self._heaps[share], accept)) is not None:
+                return share, position
+        return None
+
+    @staticmethod
+    def __find_in(heap: _Heap, accept: Optional[Callable[[_JobHandle], bool]]) -> Optional[int]:
+        if accept is None:
+            return 0
+        # Visit the heap in rank order, only expanding the children of the rejected job handles.
+        candidates = [(heap[0][0], 0)]
+        while candidates:
+            _, position = heapq.heappop(candidates)
+            if accept(heap[position][1]):
+                return position
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(candidates, (heap[child][0], child))
+        return None
+
+    def __start_share(self, share: Optional[str]):
+        if share is None:
+            return
+        queued_virtual_times = [self._virtual_times.get(s, 0.0) for s in self._heaps if s is not None and s != share]
+        if queued_virtual_times:
+            self._virtual_times[share] = max(self._virtual_times.get(share, 0.0), min(queued_virtual_times))
+
+    def __stop_share(self, share: Optional[str]):
+        del self._heaps[share]
+        if not self._heaps:
+            # Nothing waits anymore, so the shares start over on an equal footing.
+            self._virtual_times.clear()
+
+    def __charge(self, job_handle: _JobHandle):
+        duration = sum(_TaskDurations._estimate(j.task_config_id) for j in (job_handle, *job_handle.fused_jobs))
+        share = job_handle.share
+        self._virtual_times[share] = self._virtual_times.get(share, 0.0) + duration / job_handle.share_weight
+
+    def __remove_at(self, share: Optional[str], position: int) -> _JobHandle:
+        heap = self._heaps[share]
+        _, job_handle = heap[position]
+        last = heap.pop()
+        del self._positions[job_handle.id]
+        del self._shares[job_handle.id]
+        if (count := self._task_config_counts[job_handle.task_config_id] - 1) > 0:
+            self._task_config_counts[job_handle.task_config_id] = count
+        else:
+            del self._task_config_counts[job_handle.task_config_id]
+        self._size -= 1
+        if position < len(heap):
+            heap[position] = last
+            self._positions[last[1].id] = position
+            self.__sift_up(heap, position)
+            self.__sift_down(heap, self._positions[last[1].id])
+        elif not heap:
+            self.__stop_share(share)
+        return job_handle
+
+    def __sift_up(self, heap: _Heap, position: int):
+        item = heap[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if heap[parent][0] <= item[0]:
+                break
+            self.__move(heap, parent, position)
+            position = parent
+        self.__place(heap, item, position)
+
+    def __sift_down(self, heap: _Heap, position: int):
+        item = heap[position]
+        size = len(heap)
+        while (child := 2 * position + 1) < size:
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if item[0] <= heap[child][0]:
+                break
+            self.__move(heap, child, position)
+            position = child
+        self.__place(heap, item, position)
+
+    def __move(self, heap: _Heap, source: int, destination: int):
+        heap[destination] = heap[source]
+        self._positions[heap[destination][1].id] = destination
+
+    def __place(self, heap: _Heap, item: Tuple[_Rank, _JobHandle], position: int):
+        heap[position] = item
+        self._positions[item[1].id] = position
@@ -9,35 +9,77 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import inspect
 import itertools
+import threading
 import uuid
-from datetime import datetime
 from multiprocessing import Lock
-from queue import Queue
-from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+from taipy.config.common.scope import Scope
 from taipy.config.config import Config
 from taipy.logger._taipy_logger import _TaipyLogger
 
 from .._entity.submittable import Submittable
+from ..config.job_config import JobConfig
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data.data_node import DataNode
 from ..job._job_manager_factory import _JobManagerFactory
 from ..job.job import Job
 from ..job.job_id import JobId
+from ..job.status import Status
 from ..submission._submission_manager_factory import _SubmissionManagerFactory
+from ..submission.execution_plan import ExecutionPlan
+from ..submission.submission_batch import SubmissionBatch
+from ..task._task_manager_factory import _TaskManagerFactory
 from ..task.task import Task
 from ._abstract_orchestrator import _AbstractOrchestrator
+from ._critical_path import _CriticalPath
+from ._job_handle import _JobHandle
+from ._job_queue import _JobQueue
+from ._task_durations import _TaskDurations
+from ._wait_times import _WaitTimes
 
 
 class _Orchestrator(_AbstractOrchestrator):
     """
     Handles the functional orchestrating.
+
+    Blocked jobs and jobs to run are held as compact `_JobHandle` references, so that blocking, unblocking,
+    canceling and abandoning jobs only rely on identifiers. The jobs are loaded from the repository when they are
+    dispatched, only the parts of the jobs that cannot be reloaded being kept in memory. Blocked jobs are indexed by
+    the identifiers of their input data nodes: when a job completes, only the jobs waiting for its outputs are
+    checked. Jobs to run are dispatched by priority. The durations of the completed jobs are recorded by task
+    configuration, see `_TaskDurations`: with the *"critical_path"* scheduling policy of `JobConfig^`, jobs of the
+    same priority are dispatched by decreasing estimated duration of the longest path of jobs they start in their
+    submission.
+
+    When `JobConfig^`.fuse_task_chains is set, the linear chains of tasks of a submission are fused: the jobs
+    following the first job of a chain stay blocked until the whole chain is dispatched on a single worker.
     """
 
-    jobs_to_run: Queue = Queue()
+    jobs_to_run: _JobQueue = _JobQueue()
     blocked_jobs: List = []
+    blocked_jobs_by_input_dn_id: Dict[str, Set[_JobHandle]] = {}
+    # Blocked jobs dispatched with the first job of their fused chain, by job id.
+    fused_jobs: Dict[str, _JobHandle] = {}
+    # Parts of the unfinished jobs that cannot be reloaded from the repositories, by job id: the subscribers of the
+    # job, whose callbacks may be bound methods or closures, the task of the job if the task is not saved, and the
+    # handle of the job, to queue the job again if its execution is aborted.
+    __in_memory_job_parts: Dict[str, Tuple[List[Callable], Optional[Task], _JobHandle]] = {}
     lock = Lock()
+    # Events of the unfinished jobs someone waits for, set when the job is finished.
+    __finished_job_events: Dict[str, threading.Event] = {}
+    __finished_job_events_lock = threading.Lock()
+    # Number of unfinished jobs of each submission, to release the resources of a submission once it is finished.
+    __nb_unfinished_jobs_by_submit_id: Dict[str, int] = {}
+    # Unfinished jobs of the tasks shared by several scenarios, by task id, and the submissions waiting for them
+    # without having created them, by job id. Guarded by the lock of the unfinished jobs counts.
+    __shared_jobs_by_task_id: Dict[str, Job] = {}
+    __shared_task_ids_by_job_id: Dict[str, str] = {}
+    __attached_submit_ids_by_job_id: Dict[str, List[str]] = {}
+    __nb_unfinished_jobs_lock = threading.Lock()
     __logger = _TaipyLogger._get_logger()
 
     @classmethod
@@ -52,6 +94,10 @@ class _Orchestrator(_AbstractOrchestrator):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+        targets: Optional[Iterable[Union[DataNode, str]]] = None,
+        stale_only: bool = False,
     ) -> List[Job]:
         """Submit the given `Scenario^` or `Sequence^` for an execution.
 
@@ -64,37 +110,151 @@ class _Orchestrator(_AbstractOrchestrator):
                 finished in asynchronous mode.
              timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be finished
                 before returning.
+             priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are
+                dispatched first. The default value is 0.
+             user (Optional[str]): The user the submission is made for. With the *"fair_share"* scheduling policy, the
+                 submissions of a user share the workers with the other users and submissions, in proportion to the
+                 weight of the user. The default value is None, meaning that each submission has its own share.
+             targets (Optional[Iterable[Union[DataNode^, str]]]): The data nodes, data node ids or data node
+                config ids to compute. If given, jobs are only created for the tasks they depend on.
+             stale_only (bool): If True, jobs are only created for the stale tasks, whose outputs are not up to
+                date with their inputs.
         Returns:
             The created Jobs.
         """
-        submission = _SubmissionManagerFactory._build_manager()._create(submittable.id)  # type: ignore
+        tasks = submittable._get_sorted_tasks(targets, stale_only)
+        submission = _SubmissionManagerFactory._build_manager()._create(submittable.id, priority, user)  # type: ignore
+        job_callbacks = [submission._update_submission_status, *(callbacks or [])]
         jobs = []
-        tasks = submittable._get_sorted_tasks()
+        created_jobs = []
         with cls.lock:
             for ts in tasks:
                 for task in ts:
-                    jobs.append(
-                        cls._lock_dn_output_and_create_job(
+                    if (job := cls.__get_shared_job(task, force)) is None:
+                        job = cls._lock_dn_output_and_create_job(
                             task,
                             submission.id,
                             submission.entity_id,
-                            callbacks=itertools.chain([submission._update_submission_status], callbacks or []),
+                            callbacks=job_callbacks,
                             force=force,  # type: ignore
                         )
-                    )
+                        cls.__register_shared_job(task, job)
+                        created_jobs.append(job)
+                    jobs.append(job)
 
         submission.jobs = jobs  # type: ignore
+        cls.__attach_submission(submission.id, jobs, created_jobs, job_callbacks)
 
-        cls._orchestrate_job_to_run_or_block(jobs)
+        cls._orchestrate_job_to_run_or_block(created_jobs, submission.priority, submission.user)
 
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         else:
             if wait:
-                cls.__wait_until_job_finished(jobs, timeout=timeout)
+                cls.wait_jobs(jobs, timeout=timeout)
 
         return jobs
 
+    @classmethod
+    def submit_many(
+        cls,
+        entities: List[Union[Submittable, Task]],
+        callbacks: Optional[List[Iterable[Callable]]] = None,
+        force: bool = False,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+    ) -> SubmissionBatch:
+        """Submit many `Scenario^`s, `Sequence^`s or `Task^`s at once, creating one submission for each.
+
+        The submissions, the jobs and the locks on the output data nodes are saved with bulk repository writes, and
+        the jobs of all the submissions are created and orchestrated while holding the lock once.
+
+        Parameters:
+             entities (List[Union[Scenario^, Sequence^, Task^]]): The entities to submit for execution.
+             callbacks: The optional lists of functions that should be executed on jobs status change, one list
+                for each entity.
+             force (bool): Enforce execution of the tasks even if their output data nodes are cached.
+             wait (bool): Wait for the orchestrated jobs of all the submissions to be finished in asynchronous
+                mode.
+             timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be finished
+                before returning.
+             priority (Optional[int]): The priority of the submissions. Jobs of higher priority submissions are
+                dispatched first. The default value is 0.
+             user (Optional[str]): The user the submissions are made for. With the *"fair_share"* scheduling policy, the
+                 submissions of a user share the workers with the other users and submissions, in proportion to the
+                 weight of the user. The default value is None, meaning that each submission has its own share.
+        Returns:
+            The batch of the created submissions.
+        """
+        submission_manager = _SubmissionManagerFactory._build_manager()
+        submissions = submission_manager._bulk_create([entity.id for entity in entities], priority, user)
+        callbacks_by_submit_id: Dict[str, List[Callable]] = {}
+        # The jobs of each submission, as existing shared jobs or as indexes of the jobs to create.
+        job_refs_by_submit_id: Dict[str, List[Union[Job, int]]] = {}
+        jobs_to_create = []
+        output_dns = {}
+        with cls.lock:
+            created_job_indexes_by_task_id: Dict[str, int] = {}
+            for entity, submission, entity_callbacks in zip(entities, submissions, callbacks or itertools.repeat(())):
+                job_callbacks = callbacks_by_submit_id[submission.id] = [
+                    submission._update_submission_status,
+                    *entity_callbacks,
+                ]
+                job_refs = job_refs_by_submit_id[submission.id] = []
+                tasks = [entity] if isinstance(entity, Task) else itertools.chain(*entity._get_sorted_tasks())
+                for task in tasks:
+                    if (job := cls.__get_shared_job(task, force)) is not None:
+                        job_refs.append(job)
+                    elif task.id in created_job_indexes_by_task_id:
+                        job_refs.append(created_job_indexes_by_task_id[task.id])
+                    else:
+                        if cls.__is_shared(task):
+                            created_job_indexes_by_task_id[task.id] = len(jobs_to_create)
+                        job_refs.append(len(jobs_to_create))
+                        jobs_to_create.append(
+                            (task, [cls._on_status_change, *job_callbacks], submission.id, submission.entity_id)
+                        )
+                        output_dns.update((dn.id, dn) for dn in task.output.values())
+
+            _DataManagerFactory._build_manager()._bulk_edit(output_dns.values(), lambda dn: dn.lock_edit())
+            created_jobs = _JobManagerFactory._build_manager()._bulk_create(jobs_to_create, force=force)
+            for job, (task, *_) in zip(created_jobs, jobs_to_create):
+                cls.__register_shared_job(task, job)
+            jobs_by_submit_id = {
+                submit_id: [created_jobs[ref] if isinstance(ref, int) else ref for ref in job_refs]
+                for submit_id, job_refs in job_refs_by_submit_id.items()
+            }
+            created_jobs_by_submit_id: Dict[str, List[Job]] = {submission.id: [] for submission in submissions}
+            for job in created_jobs:
+                created_jobs_by_submit_id[job.submit_id].append(job)
+            submission_manager._bulk_edit(
+                submissions, lambda submission: setattr(submission, "jobs", jobs_by_submit_id[submission.id])
+            )
+            for submission in submissions:
+                cls.__attach_submission(
+                    submission.id,
+                    jobs_by_submit_id[submission.id],
+                    created_jobs_by_submit_id[submission.id],
+                    callbacks_by_submit_id[submission.id],
+                )
+            pending_jobs = []
+            for submission in submissions:
+                pending_jobs.extend(
+                    cls.__block_or_pend_jobs(
+                        created_jobs_by_submit_id[submission.id], submission.priority, submission.user
+                    )
+                )
+        cls.__put_jobs_to_run(pending_jobs)
+
+        submission_batch = SubmissionBatch(submissions, [jobs_by_submit_id[s.id] for s in submissions])
+        if Config.job_config.is_development:
+            cls._check_and_execute_jobs_if_development_mode()
+        elif wait:
+            submission_batch.wait(timeout)
+        return submission_batch
+
     @classmethod
     def submit_task(
         cls,
@@ -103,6 +263,8 @@ class _Orchestrator(_AbstractOrchestrator):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ) -> Job:
         """Submit the given `Task^` for an execution.
 
@@ -115,30 +277,35 @@ class _Orchestrator(_AbstractOrchestrator):
                 in asynchronous mode.
              timeout (Union[float, int]): The optional maximum number of seconds to wait for the job
                 to be finished before returning.
+             priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are
+                dispatched first. The default value is 0.
+             user (Optional[str]): The user the submission is made for. With the *"fair_share"* scheduling policy, the
+                 submissions of a user share the workers with the other users and submissions, in proportion to the
+                 weight of the user. The default value is None, meaning that each submission has its own share.
         Returns:
             The created `Job^`.
         """
-        submission = _SubmissionManagerFactory._build_manager()._create(task.id)
+        submission = _SubmissionManagerFactory._build_manager()._create(task.id, priority, user)
         submit_id = submission.id
+        job_callbacks = [submission._update_submission_status, *(callbacks or [])]
+        created_jobs = []
         with cls.lock:
-            job = cls._lock_dn_output_and_create_job(
-                task,
-                submit_id,
-                submission.entity_id,
-                itertools.chain([submission._update_submission_status], callbacks or []),
-                force,
-            )
+            if (job := cls.__get_shared_job(task, force)) is None:
+                job = cls._lock_dn_output_and_create_job(task, submit_id, submission.entity_id, job_callbacks, force)
+                cls.__register_shared_job(task, job)
+                created_jobs.append(job)
 
         jobs = [job]
         submission.jobs = jobs  # type: ignore
+        cls.__attach_submission(submit_id, jobs, created_jobs, job_callbacks)
 
-        cls._orchestrate_job_to_run_or_block(jobs)
+        cls._orchestrate_job_to_run_or_block(created_jobs, submission.priority, submission.user)
 
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         else:
             if wait:
-                cls.__wait_until_job_finished(job, timeout=timeout)
+                cls.wait_jobs([job], timeout=timeout)
 
         return job
 
@@ -160,56 +327,348 @@ class _Orchestrator(_AbstractOrchestrator):
         return job
 
     @classmethod
-    def _orchestrate_job_to_run_or_block(cls, jobs: List[Job]):
+    def _orchestrate_job_to_run_or_block(cls, jobs: List[Job], priority: int = 0, user: Optional[str] = None):
+        # Holding the lock guarantees that a job cannot be blocked by an input data node that becomes ready before
+        # the job is indexed as waiting for it.
+        with cls.lock:
+            pending_jobs = cls.__block_or_pend_jobs(jobs, priority, user)
+        cls.__put_jobs_to_run(pending_jobs)
+
+    @classmethod
+    def __block_or_pend_jobs(cls, jobs: List[Job], priority: int = 0, user: Optional[str] = None) -> List[_JobHandle]:
+        """Block the given jobs of a submission or return them as pending, the lock being held."""
         blocked_jobs = []
         pending_jobs = []
-
-        for job in jobs:
-            if cls._is_blocked(job):
+        if jobs:
+            with cls.__nb_unfinished_jobs_lock:
+                # Already counted if the submission also waits for shared jobs.
+                cls.__nb_unfinished_jobs_by_submit_id.setdefault(jobs[0].submit_id, len(jobs))
+
+        job_handles = [_JobHandle._from_job(job, priority) for job in jobs]
+        cls.__keep_in_memory_job_parts(jobs, job_handles)
+        for job_handle in job_handles:
+            job_handle.blocking_dn_ids = cls.__get_blocking_dn_ids(job_handle.input_dn_ids)
+        if Config.job_config.scheduling_policy == JobConfig._CRITICAL_PATH_POLICY:
+            cls.__estimate_remaining_durations(job_handles)
+        elif Config.job_config.scheduling_policy == JobConfig._FAIR_SHARE_POLICY:
+            cls.__set_shares(job_handles, user)
+        if Config.job_config.is_standalone and Config.job_config.fuse_task_chains:
+            cls.__fuse_task_chains(job_handles)
+        for job, job_handle in zip(jobs, job_handles):
+            if job_handle.blocking_dn_ids:
                 job.blocked()
-                blocked_jobs.append(job)
+                blocked_jobs.append(job_handle)
             else:
                 job.pending()
-                pending_jobs.append(job)
+                pending_jobs.append(job_handle)
+
+        for job_handle in blocked_jobs:
+            cls.__add_blocked_job(job_handle)
+        return pending_jobs
 
-        cls.blocked_jobs.extend(blocked_jobs)
-        for job in pending_jobs:
-            cls.jobs_to_run.put(job)
+    @classmethod
+    def __keep_in_memory_job_parts(cls, jobs: List[Job], job_handles: List[_JobHandle]):
+        task_manager = _TaskManagerFactory._build_manager()
+        saved_task_ids: Dict[str, bool] = {}
+        for job, job_handle in zip(jobs, job_handles):
+            task = job._get_task()
+            if task.id not in saved_task_ids:
+                saved_task_ids[task.id] = task_manager._exists(task.id)
+            # The subscribers list is shared with the job, so that the callbacks added later are kept as well.
+            cls.__in_memory_job_parts[job.id] = (
+                job._subscribers,
+                None if saved_task_ids[task.id] else task,
+                job_handle,
+            )
 
     @classmethod
-    def __wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None):
-        def __check_if_timeout(start, timeout):
-            if timeout:
-                return (datetime.now() - start).seconds < timeout
-            return True
+    def _get_job(cls, job_handle: Union[_JobHandle, str]) -> Optional[Job]:
+        """Returns the job of the given handle or id, loaded from the repository with its in-memory parts.
 
-        start = datetime.now()
-        jobs = jobs if isinstance(jobs, Iterable) else [jobs]
-        index = 0
+        Returns None if the job was deleted from the repository, its in-memory parts being dropped.
+        """
+        job_id = job_handle if isinstance(job_handle, str) else job_handle.id
+        if (job := _JobManagerFactory._build_manager()._get(job_id)) is None:
+            cls.__in_memory_job_parts.pop(job_id, None)
+            cls.__logger.warning(f"{job_id} was deleted before its execution, it is dropped.")
+            return None
+        if (in_memory_parts := cls.__in_memory_job_parts.get(job_id)) is not None:
+            job._subscribers, task, _ = in_memory_parts
+            if task is not None:
+                job._task = task
+        return job
 
-        while __check_if_timeout(start, timeout) and index < len(jobs):
-            try:
-                if jobs[index]._is_finished():
-                    index = index + 1
+    @classmethod
+    def _requeue_job(cls, job: Job):
+        """Queue the given running job again, the jobs fused to it being blocked again.
+
+        Used by the dispatcher when the execution of the job is aborted through no fault of its own. The job keeps
+        the lock on its outputs.
+        """
+        if (in_memory_parts := cls.__in_memory_job_parts.get(job.id)) is None:
+            return
+        job_handle = in_memory_parts[2]
+        with cls.lock:
+            for fused_job in cls._get_fused_jobs(job_handle):
+                if (job_to_block := cls._get_job(fused_job)) is not None:
+                    job_to_block.blocked()
+            job.pending()
+        cls.__put_jobs_to_run([job_handle])
+
+    @staticmethod
+    def __estimate_remaining_durations(job_handles: List[_JobHandle]):
+        remaining_durations = _CriticalPath._get_remaining_durations(
+            (
+                job_handle.id,
+                _TaskDurations._estimate(job_handle.task_config_id),
+                job_handle.input_dn_ids,
+                job_handle.output_dn_ids,
+            )
+            for job_handle in job_handles
+        )
+        for job_handle in job_handles:
+            job_handle.remaining_duration = remaining_durations[job_handle.id]
+
+    @staticmethod
+    def __set_shares(job_handles: List[_JobHandle], user: Optional[str]):
+        fair_shares = Config.job_config.fair_shares or {}
+        weight = float(fair_shares.get(user, JobConfig._DEFAULT_FAIR_SHARE)) if user else JobConfig._DEFAULT_FAIR_SHARE
+        for job_handle in job_handles:
+            job_handle.share = user or job_handle.submit_id
+            job_handle.share_weight = weight
+
+    @classmethod
+    def __put_jobs_to_run(cls, job_handles: List[_JobHandle]):
+        for job_handle in job_handles:
+            cls.jobs_to_run.put(job_handle)
+        if job_handles:
+            cls.__notify_dispatcher()
+
+    @staticmethod
+    def __is_shared(task: Task) -> bool:
+        return task.scope >= Scope.CYCLE
+
+    @classmethod
+    def __get_shared_job(cls, task: Task, force: bool) -> Optional[Job]:
+        """Returns the unfinished job of the given task, if the task is shared by several scenarios, the lock being
+        held.
+
+        A submission of a cycle or global task waits for the unfinished job of another submission, if any, instead
+        of creating a duplicate job locking the same outputs. A forced submission does not wait for a job that is
+        not forced, which could be skipped.
+        """
+        job = cls.__shared_jobs_by_task_id.get(task.id)
+        if job is None or job._is_finished() or (force and not job._force):
+            return None
+        return job
+
+    @classmethod
+    def __register_shared_job(cls, task: Task, job: Job):
+        if cls.__is_shared(task):
+            with cls.__nb_unfinished_jobs_lock:
+                cls.__shared_jobs_by_task_id[task.id] = job
+                cls.__shared_task_ids_by_job_id[job.id] = task.id
+
+    @classmethod
+    def __attach_submission(cls, submit_id: str, jobs: List[Job], created_jobs: List[Job], callbacks: List[Callable]):
+        """Count the unfinished jobs of a submission, and make the submission wait for the shared jobs created by
+        other submissions."""
+        created_job_ids = {job.id for job in created_jobs}
+        attached_jobs = [job for job in jobs if job.id not in created_job_ids]
+        finished_jobs = []
+        with cls.__nb_unfinished_jobs_lock:
+            cls.__nb_unfinished_jobs_by_submit_id[submit_id] = len(jobs)
+            for job in attached_jobs:
+                if job._is_finished():
+                    finished_jobs.append(job)
                 else:
-                    sleep(0.5)  # Limit CPU usage
+                    cls.__attached_submit_ids_by_job_id.setdefault(job.id, []).append(submit_id)
+        for job in attached_jobs:
+            job._on_status_change(*callbacks)
+        for _ in finished_jobs:
+            cls.__count_finished_job(submit_id)
+
+    @classmethod
+    def __fuse_task_chains(cls, job_handles: List[_JobHandle]):
+        """Fuse the linear chains of the given jobs of a submission.
+
+        A job is followed in a chain by another job if this other job is the only one of the submission to read the
+        outputs of the job, and if it only waits for these outputs to run. Both tasks must be non-skippable and
+        non-coroutine tasks executed on the same pool.
+        """
+        fusion_keys = {job_handle.id: cls.__get_fusion_key(job_handle) for job_handle in job_handles}
+        producers = {dn_id: job_handle for job_handle in job_handles for dn_id in job_handle.output_dn_ids}
+        consumers: Dict[str, List[_JobHandle]] = {}
+        for job_handle in job_handles:
+            for dn_id in job_handle.input_dn_ids:
+                consumers.setdefault(dn_id, []).append(job_handle)
+
+        next_jobs: Dict[str, _JobHandle] = {}
+        for job_handle in job_handles:
+            if fusion_keys[job_handle.id] is None:
+                continue
+            consuming_jobs = {consumer for dn_id in job_handle.output_dn_ids for consumer in consumers.get(dn_id, [])}
+            if len(consuming_jobs) != 1:
+                continue
+            next_job = consuming_jobs.pop()
+            if (
+                fusion_keys[next_job.id] == fusion_keys[job_handle.id]
+                and next_job.blocking_dn_ids
+                and next_job.blocking_dn_ids.issubset(job_handle.output_dn_ids)
+                and all(producers.get(dn_id, job_handle) is job_handle for dn_id in next_job.input_dn_ids)
+            ):
+                next_jobs[job_handle.id] = next_job
+
+        following_job_ids = {next_job.id for next_job in next_jobs.values()}
+        for job_handle in job_handles:
+            if job_handle.id in following_job_ids or job_handle.id not in next_jobs:
+                continue
+            fused_jobs = []
+            next_job = next_jobs[job_handle.id]
+            while next_job is not None:
+                fused_jobs.append(next_job)
+                cls.fused_jobs[next_job.id] = next_job
+                next_job = next_jobs.get(next_job.id)
+            job_handle.fused_jobs = tuple(fused_jobs)
+
+    @staticmethod
+    def __get_fusion_key(job_handle: _JobHandle) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        task_config = Config.tasks.get(job_handle.task_config_id) if job_handle.task_config_id else None
+        if (
+            task_config is None
+            or task_config.skippable
+            or task_config.memoize
+            or task_config.timeout
+            or inspect.iscoroutinefunction(task_config.function)
+        ):
+            return None
+        return task_config.pool, task_config.executor
+
+    @classmethod
+    def _get_fused_jobs(cls, job_handle: _JobHandle) -> List[_JobHandle]:
+        """Returns the handles of the jobs to dispatch with the job of the given handle, the lock being held.
 
-            except Exception:
-                pass
+        The chain stops at the first job that is no longer fused, for instance because it has been canceled.
+        """
+        fused_jobs = []
+        for fused_job in job_handle.fused_jobs:
+            if fused_job.id not in cls.fused_jobs:
+                break
+            fused_jobs.append(fused_job)
+        return fused_jobs
 
     @classmethod
-    def _is_blocked(cls, obj: Union[Task, Job]) -> bool:
+    def _remove_fused_job(cls, job: Job):
+        """Stop blocking a fused job whose execution is over, before its status is updated."""
+        with cls.lock:
+            if job.id in cls.fused_jobs:
+                cls.__remove_blocked_job(job)
+
+    @classmethod
+    def plan(
+        cls,
+        submittable: Submittable,
+        force: bool = False,
+        targets: Optional[Iterable[Union[DataNode, str]]] = None,
+    ) -> ExecutionPlan:
+        """Returns the estimated schedule of the submission of the given `Scenario^` or `Sequence^`.
+
+        Parameters:
+             submittable (Union[Scenario^, Sequence^]): The scenario or sequence to plan the submission of.
+             force (bool): If True, no task is planned as skipped.
+             targets (Optional[Iterable[Union[DataNode^, str]]]): The data nodes, data node ids or data node
+                config ids to compute. If given, only the tasks they depend on are planned.
+        Returns:
+            The estimated execution plan.
+        """
+        return _CriticalPath._plan(submittable, force, targets)
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """Returns the current metrics of the job executions.
+
+        Returns:
+            The number of jobs ready to run and of blocked jobs, the estimated memory of the running jobs, the
+            number of workers of each worker pool and the percentiles of the times the jobs of the latest
+            submissions waited for a worker.
+        """
+        from ._orchestrator_factory import _OrchestratorFactory
+
+        dispatcher = _OrchestratorFactory._dispatcher
+        return {
+            "nb_of_jobs_to_run": cls.jobs_to_run.qsize(),
+            "nb_of_blocked_jobs": len(cls.blocked_jobs),
+            "memory_in_use": dispatcher._memory_in_use if dispatcher else 0.0,
+            "pools": dispatcher._get_pool_metrics() if dispatcher else {},
+            "wait_times": _WaitTimes._get_all_percentiles(),
+        }
+
+    @classmethod
+    def wait_jobs(cls, jobs: Iterable[Job], timeout: Optional[Union[float, int]] = None) -> bool:
+        """Wait for the given jobs to be finished.
+
+        Parameters:
+             jobs (Iterable[Job^]): The jobs to wait for.
+             timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs.
+        Returns:
+             True if all the jobs are finished, False if the timeout expired before.
+        """
+        deadline = monotonic() + timeout if timeout else None
+        for job in jobs:
+            # The event is registered before checking the status, so that the job cannot finish in between unnoticed.
+            event = cls.__get_finished_job_event(job.id)
+            if job.is_finished():
+                continue
+            if not event.wait(None if deadline is None else max(0.0, deadline - monotonic())):
+                return False
+        return True
+
+    @classmethod
+    def __get_finished_job_event(cls, job_id: JobId) -> threading.Event:
+        with cls.__finished_job_events_lock:
+            return cls.__finished_job_events.setdefault(job_id, threading.Event())
+
+    @classmethod
+    def __set_job_finished(cls, job_id: JobId):
+        with cls.__finished_job_events_lock:
+            event = cls.__finished_job_events.pop(job_id, None)
+        if event:
+            event.set()
+
+    @classmethod
+    def __count_finished_job(cls, submit_id: str):
+        with cls.__nb_unfinished_jobs_lock:
+            if (nb_unfinished_jobs := cls.__nb_unfinished_jobs_by_submit_id.get(submit_id)) is None:
+                return
+            if nb_unfinished_jobs > 1:
+                cls.__nb_unfinished_jobs_by_submit_id[submit_id] = nb_unfinished_jobs - 1
+                return
+            del cls.__nb_unfinished_jobs_by_submit_id[submit_id]
+        cls.__notify_dispatcher_of_finished_submission(submit_id)
+
+    @classmethod
+    def _is_blocked(cls, obj: Union[Task, Job, _JobHandle]) -> bool:
         """Returns True if the execution of the `Job^` or the `Task^` is blocked by the execution of another `Job^`.
 
         Parameters:
-             obj (Union[Task^, Job^]): The job or task entity to run.
+             obj (Union[Task^, Job^, _JobHandle]): The job or task entity to run, or the handle of the job.
 
         Returns:
              True if one of its input data nodes is blocked.
         """
-        input_data_nodes = obj.task.input.values() if isinstance(obj, Job) else obj.input.values()
+        return len(cls.__get_blocking_dn_ids(cls.__get_input_dn_ids(obj))) > 0
+
+    @staticmethod
+    def __get_blocking_dn_ids(input_dn_ids: Iterable[str]) -> Set[str]:
         data_manager = _DataManagerFactory._build_manager()
-        return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
+        return {dn_id for dn_id in input_dn_ids if not data_manager._get(dn_id).is_ready_for_reading}
+
+    @staticmethod
+    def __get_input_dn_ids(obj: Union[Task, Job, _JobHandle]) -> Iterable[str]:
+        if isinstance(obj, _JobHandle):
+            return obj.input_dn_ids
+        task = obj.task if isinstance(obj, Job) else obj
+        return [dn.id for dn in task.input.values()]
 
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]):
@@ -219,27 +678,74 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def _on_status_change(cls, job: Job):
+        if job._status == Status.RUNNING:
+            _TaskDurations._on_running(job)
+            return
         if job.is_completed() or job.is_skipped():
-            cls.__unblock_jobs()
+            cls.__unblock_jobs(job)
         elif job.is_failed():
             print(f"\nJob {job.id} failed, abandoning subsequent jobs.\n")
             cls._fail_subsequent_jobs(job)
+        if job._is_finished():
+            _TaskDurations._on_finished(job)
+            cls.__in_memory_job_parts.pop(job.id, None)
+            cls.__set_job_finished(job.id)
+            with cls.__nb_unfinished_jobs_lock:
+                if (task_id := cls.__shared_task_ids_by_job_id.pop(job.id, None)) is not None:
+                    if (shared_job := cls.__shared_jobs_by_task_id.get(task_id)) and shared_job.id == job.id:
+                        del cls.__shared_jobs_by_task_id[task_id]
+                attached_submit_ids = cls.__attached_submit_ids_by_job_id.pop(job.id, [])
+            for submit_id in [job.submit_id, *attached_submit_ids]:
+                cls.__count_finished_job(submit_id)
 
     @classmethod
-    def __unblock_jobs(cls):
-        for job in cls.blocked_jobs:
-            if not cls._is_blocked(job):
-                with cls.lock:
+    def __unblock_jobs(cls, finished_job: Job):
+        data_manager = _DataManagerFactory._build_manager()
+        unblocked_jobs = []
+        with cls.lock:
+            for dn in finished_job._get_task().output.values():
+                waiting_jobs = cls.blocked_jobs_by_input_dn_id.get(dn.id)
+                if not waiting_jobs or not data_manager._get(dn.id).is_ready_for_reading:
+                    continue
+                for job_handle in list(waiting_jobs):
+                    if job_handle.id in cls.fused_jobs:
+                        # Executed by the worker of its chain.
+                        continue
+                    job_handle.blocking_dn_ids.discard(dn.id)
+                    if job_handle.blocking_dn_ids:
+                        continue
+                    # Another job may have locked one of the inputs in the meantime.
+                    job_handle.blocking_dn_ids = cls.__get_blocking_dn_ids(job_handle.input_dn_ids)
+                    if job_handle.blocking_dn_ids:
+                        continue
+                    cls.__remove_blocked_job(job_handle)
+                    if (job := cls._get_job(job_handle)) is None:
+                        continue
                     job.pending()
-                    cls.__remove_blocked_job(job)
-                    cls.jobs_to_run.put(job)
+                    cls.jobs_to_run.put(job_handle)
+                    unblocked_jobs.append(job_handle)
+        if unblocked_jobs:
+            cls.__notify_dispatcher()
+
+    @classmethod
+    def __add_blocked_job(cls, job_handle: _JobHandle):
+        cls.blocked_jobs.append(job_handle)
+        for dn_id in job_handle.input_dn_ids:
+            cls.blocked_jobs_by_input_dn_id.setdefault(dn_id, set()).add(job_handle)
 
     @classmethod
-    def __remove_blocked_job(cls, job):
+    def __remove_blocked_job(cls, job: Union[Job, _JobHandle]):
+        cls.fused_jobs.pop(job.id, None)
         try:  # In case the job has been removed from the list of blocked_jobs.
-            cls.blocked_jobs.remove(job)
+            job_handle = cls.blocked_jobs.pop(cls.blocked_jobs.index(job))
         except Exception:
             cls.__logger.warning(f"{job.id} is not in the blocked list anymore.")
+            return
+        for dn_id in job_handle.input_dn_ids:
+            if waiting_jobs := cls.blocked_jobs_by_input_dn_id.get(dn_id):
+                waiting_jobs.discard(job_handle)
+                if not waiting_jobs:
+                    del cls.blocked_jobs_by_input_dn_id[dn_id]
 
     @classmethod
     def cancel_job(cls, job: Job):
@@ -252,27 +758,47 @@ class _Orchestrator(_AbstractOrchestrator):
         else:
             with cls.lock:
                 to_cancel_or_abandon_jobs = set([job])
-                to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
+                to_cancel_or_abandon_jobs.update(
+                    cls.__get_jobs(cls.__find_subsequent_jobs(cls.__get_submit_ids(job), cls.__get_output_dn_ids(job)))
+                )
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
-                cls._unlock_edit_on_jobs_outputs(to_cancel_or_abandon_jobs)
-
-    @classmethod
-    def __find_subsequent_jobs(cls, submit_id, output_dn_config_ids: Set) -> Set[Job]:
-        next_output_dn_config_ids = set()
-        subsequent_jobs = set()
-        for job in cls.blocked_jobs:
-            job_input_dn_config_ids = job.task.input.keys()
-            if job.submit_id == submit_id and len(output_dn_config_ids.intersection(job_input_dn_config_ids)) > 0:
-                next_output_dn_config_ids.update(job.task.output.keys())
-                subsequent_jobs.update([job])
-        if len(next_output_dn_config_ids) > 0:
-            subsequent_jobs.update(
-                cls.__find_subsequent_jobs(submit_id, output_dn_config_ids=next_output_dn_config_ids)
-            )
+                # The outputs of an interrupted job are unlocked by the dispatcher once its execution stops.
+                cls._unlock_edit_on_jobs_outputs([job for job in to_cancel_or_abandon_jobs if job._is_finished()])
+
+    @classmethod
+    def __find_subsequent_jobs(cls, submit_ids: Set[str], output_dn_ids: Set[str]) -> Set[_JobHandle]:
+        subsequent_jobs: Set[_JobHandle] = set()
+        dn_ids_to_visit = list(output_dn_ids)
+        while dn_ids_to_visit:
+            for job_handle in cls.blocked_jobs_by_input_dn_id.get(dn_ids_to_visit.pop(), ()):
+                if job_handle.submit_id in submit_ids and job_handle not in subsequent_jobs:
+                    subsequent_jobs.add(job_handle)
+                    dn_ids_to_visit.extend(job_handle.output_dn_ids)
         return subsequent_jobs
 
+    @classmethod
+    def __get_jobs(cls, job_handles: Iterable[_JobHandle]) -> List[Job]:
+        """Returns the jobs of the given handles, the handles of the deleted jobs being dropped."""
+        jobs = []
+        for job_handle in job_handles:
+            if (job := cls._get_job(job_handle)) is None:
+                cls.__remove_blocked_job(job_handle)
+            else:
+                jobs.append(job)
+        return jobs
+
+    @classmethod
+    def __get_submit_ids(cls, job: Job) -> Set[str]:
+        """Returns the identifiers of the submissions waiting for the given job."""
+        with cls.__nb_unfinished_jobs_lock:
+            return {job.submit_id, *cls.__attached_submit_ids_by_job_id.get(job.id, ())}
+
+    @staticmethod
+    def __get_output_dn_ids(job: Job) -> Set[str]:
+        return {dn.id for dn in job.task.output.values()}
+
     @classmethod
     def __remove_blocked_jobs(cls, jobs):
         for job in jobs:
@@ -280,19 +806,17 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def __remove_jobs_to_run(cls, jobs):
-        new_jobs_to_run: Queue = Queue()
-        while not cls.jobs_to_run.empty():
-            current_job = cls.jobs_to_run.get()
-            if current_job not in jobs:
-                new_jobs_to_run.put(current_job)
-        cls.jobs_to_run = new_jobs_to_run
+        for job in jobs:
+            cls.jobs_to_run.remove(job.id)
 
     @classmethod
     def _fail_subsequent_jobs(cls, failed_job: Job):
         with cls.lock:
             to_fail_or_abandon_jobs = set()
             to_fail_or_abandon_jobs.update(
-                cls.__find_subsequent_jobs(failed_job.submit_id, set(failed_job.task.output.keys()))
+                cls.__get_jobs(
+                    cls.__find_subsequent_jobs(cls.__get_submit_ids(failed_job), cls.__get_output_dn_ids(failed_job))
+                )
             )
             for job in to_fail_or_abandon_jobs:
                 print(f"Abandoning job: {job.id}")
@@ -306,8 +830,17 @@ class _Orchestrator(_AbstractOrchestrator):
     def _cancel_jobs(cls, job_id_to_cancel: JobId, jobs: Set[Job]):
         from ._orchestrator_factory import _OrchestratorFactory
 
+        dispatcher = _OrchestratorFactory._dispatcher
+        dispatched_job_ids = dispatcher._dispatched_processes.keys()  # type: ignore
+        # A running job is interrupted, and canceled by the dispatcher once its execution stops. The subsequent
+        # jobs running with it are the jobs of its fused chain, not executed yet.
+        is_interrupted = job_id_to_cancel in dispatched_job_ids and dispatcher._interrupt_job(job_id_to_cancel)  # type: ignore
         for job in jobs:
-            if job.id in _OrchestratorFactory._dispatcher._dispatched_processes.keys():  # type: ignore
+            if job.id == job_id_to_cancel and is_interrupted:
+                cls.__logger.info(f"{job.id} is running and is being interrupted.")
+            elif job.id in dispatched_job_ids and is_interrupted:
+                job.abandoned()
+            elif job.id in dispatched_job_ids:
                 cls.__logger.info(f"{job.id} is running and cannot be canceled.")
             elif job.is_completed() or job.is_skipped():
                 cls.__logger.info(f"{job.id} has already been completed and cannot be canceled.")
@@ -319,6 +852,20 @@ class _Orchestrator(_AbstractOrchestrator):
                 else:
                     job.abandoned()
 
+    @staticmethod
+    def __notify_dispatcher():
+        from ._orchestrator_factory import _OrchestratorFactory
+
+        if dispatcher := _OrchestratorFactory._dispatcher:
+            dispatcher._notify()
+
+    @staticmethod
+    def __notify_dispatcher_of_finished_submission(submit_id: str):
+        from ._orchestrator_factory import _OrchestratorFactory
+
+        if dispatcher := _OrchestratorFactory._dispatcher:
+            dispatcher._on_submission_finished(submit_id)
+
     @staticmethod
     def _check_and_execute_jobs_if_development_mode():
         from ._orchestrator_factory import _OrchestratorFactory
@@ -0,0 +1,202 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import threading
+import uuid
+from time import monotonic
+from typing import Any, Dict, Optional
+
+from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from ..job.job import Job
+from ..job.status import Status
+
+
+class _DurationStatistics:
+    """Statistics of the durations of the completed jobs of a task configuration, in seconds.
+
+    Attributes:
+        count (int): The number of completed jobs measured.
+        mean (float): The moving average of the durations of the latest `_TaskDurations._WINDOW` jobs.
+        min (float): The shortest duration.
+        max (float): The longest duration.
+        last (float): The duration of the latest completed job.
+    """
+
+    __slots__ = ("count", "mean", "min", "max", "last")
+
+    def __init__(self, duration: float):
+        self.count = 1
+        self.mean = self.min = self.max = self.last = duration
+
+    def _add(self, duration: float, window: int):
+        self.count += 1
+        # Cumulative average over the first jobs, then exponential moving average, so that the estimate follows
+        # the changes of the data or of the code of the task.
+        self.mean += (duration - self.mean) / min(self.count, window)
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+        self.last = duration
+
+    def _to_dict(self) -> Dict[str, Any]:
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+    @classmethod
+    def _from_dict(cls, statistics: Dict[str, Any]) -> "_DurationStatistics":
+        duration_statistics = cls(0.0)
+        for attribute in cls.__slots__:
+            setattr(duration_statistics, attribute, statistics[attribute])
+        return duration_statistics
+
+
+class _TaskDurations:
+    """Durations of the completed jobs, by task configuration id.
+
+    The duration of a job is measured from its running status to its completion, so the jobs executed after the
+    first job of a fused chain of tasks are measured with the jobs preceding them in the chain. The jobs that do
+    not complete are not measured. The duration of the task configurations without any completed job is estimated
+    as the average of the estimates of the others, or `_DEFAULT_DURATION` seconds when no job completed yet.
+
+    The statistics are saved in the `_FILE` file of the storage folder, next to the repositories of the entities, and
+    loaded the first time they are needed, so that the estimates survive restarts. Measuring a job only marks the
+    statistics as changed: they are saved at most once every `_SAVING_PERIOD` seconds, when a job is measured, and
+    when the job dispatcher stops, see `_flush()`.
+    """
+
+    _WINDOW = 20
+    _DEFAULT_DURATION = 1.0
+    _FILE = "task_durations.json"
+    _SAVING_PERIOD = 10.0
+
+    __statistics: Dict[str, _DurationStatistics] = {}
+    # Path of the file the statistics were loaded from, None if they are not loaded yet.
+    __path: Optional[str] = None
+    # Whether the statistics changed since they were loaded or saved.
+    __changed = False
+    # Monotonic time of the latest saving of the statistics.
+    __saved_at = 0.0
+    # Times at which the running jobs started, by job id.
+    __start_times: Dict[str, float] = {}
+    __lock = threading.Lock()
+    # Held while saving, so that the statistics are saved in the order of their snapshots.
+    __saving_lock = threading.Lock()
+    __logger = _TaipyLogger._get_logger()
+
+    @classmethod
+    def _on_running(cls, job: Job):
+        with cls.__lock:
+            cls.__start_times[job.id] = monotonic()
+
+    @classmethod
+    def _on_finished(cls, job: Job):
+        with cls.__lock:
+            start_time = cls.__start_times.pop(job.id, None)
+        if start_time is None or job._status != Status.COMPLETED:
+            return
+        cls._record(job._get_task().config_id, monotonic() - start_time)
+
+    @classmethod
+    def _record(cls, task_config_id: str, duration: float):
+        with cls.__lock:
+            cls.__load()
+            if (statistics := cls.__statistics.get(task_config_id)) is None:
+                cls.__statistics[task_config_id] = _DurationStatistics(duration)
+            else:
+                statistics._add(duration, cls._WINDOW)
+            cls.__changed = True
+            saving_is_due = monotonic() - cls.__saved_at >= cls._SAVING_PERIOD
+        if saving_is_due:
+            cls._flush()
+
+    @classmethod
+    def _flush(cls):
+        """Save the statistics if they changed since they were loaded or saved."""
+        with cls.__saving_lock:
+            with cls.__lock:
+                if not cls.__changed or cls.__path is None:
+                    return
+                path = cls.__path
+                statistics = {id: statistics._to_dict() for id, statistics in cls.__statistics.items()}
+                cls.__changed = False
+                cls.__saved_at = monotonic()
+            cls.__save(path, statistics)
+
+    @classmethod
+    def _get_statistics(cls, task_config_id: Optional[str]) -> Optional[_DurationStatistics]:
+        if not task_config_id:
+            return None
+        with cls.__lock:
+            cls.__load()
+            return cls.__statistics.get(task_config_id)
+
+    @classmethod
+    def _estimate(cls, task_config_id: Optional[str]) -> float:
+        """Returns the estimated duration of a job of the given task configuration, in seconds."""
+        if statistics := cls._get_statistics(task_config_id):
+            return statistics.mean
+        with cls.__lock:
+            means = [statistics.mean for statistics in cls.__statistics.values()]
+        return sum(means) / len(means) if means else cls._DEFAULT_DURATION
+
+    @classmethod
+    def _clean(cls):
+        with cls.__lock:
+            cls.__statistics.clear()
+            cls.__start_times.clear()
+            if os.path.exists(path := cls.__get_path()):
+                os.remove(path)
+            cls.__path = None
+            cls.__changed = False
+            cls.__saved_at = 0.0
+
+    @classmethod
+    def __get_path(cls) -> str:
+        return os.path.join(Config.core.storage_folder, cls._FILE)
+
+    @classmethod
+    def __load(cls):
+        """Load the saved statistics if not loaded yet, or if the storage folder changed, the lock being held."""
+        if (path := cls.__get_path()) == cls.__path:
+            return
+        if cls.__changed and cls.__path is not None:
+            # The statistics measured with the previous storage folder are saved there first.
+            cls.__save(cls.__path, {id: statistics._to_dict() for id, statistics in cls.__statistics.items()})
+        cls.__path = path
+        cls.__changed = False
+        cls.__statistics.clear()
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path) as f:
+                statistics = json.load(f)
+            for task_config_id, task_statistics in statistics.items():
+                cls.__statistics[task_config_id] = _DurationStatistics._from_dict(task_statistics)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            cls.__statistics.clear()
+            cls.__logger.warning(f"The durations of the tasks could not be loaded from {path}: {e}")
+
+    @classmethod
+    def __save(cls, path: str, statistics: Dict[str, Dict[str, Any]]):
+        """Save the given statistics to the given file."""
+        # The statistics are written in a temporary file renamed at the end, so that they are never partially read.
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(statistics, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            cls.__logger.warning(f"The durations of the tasks could not be saved to {path}: {e}")
@@ -0,0 +1,67 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import bisect
+import math
+import threading
+from typing import Dict, List, Optional
+
+
+class _WaitTimes:
+    """Times the jobs dispatched by the current process waited for a worker, in seconds, by submission id.
+
+    The wait time of a job is measured from the time it is ready to run to the time it is dispatched, so the time it
+    is blocked by its input data nodes is not included. The wait times of the latest `_MAX_NB_OF_SUBMISSIONS`
+    submissions with a dispatched job are kept.
+    """
+
+    _MAX_NB_OF_SUBMISSIONS = 100
+    _PERCENTILES = (50, 90, 99)
+
+    # Sorted wait times, by submission id in the order of their first dispatched job.
+    __wait_times: Dict[str, List[float]] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def _record(cls, submit_id: str, wait_time: float):
+        with cls.__lock:
+            if (wait_times := cls.__wait_times.get(submit_id)) is None:
+                if len(cls.__wait_times) >= cls._MAX_NB_OF_SUBMISSIONS:
+                    del cls.__wait_times[next(iter(cls.__wait_times))]
+                wait_times = cls.__wait_times[submit_id] = []
+            bisect.insort(wait_times, wait_time)
+
+    @classmethod
+    def _get_percentiles(cls, submit_id: str) -> Optional[Dict[str, float]]:
+        """Returns the percentiles, the maximum and the number of the wait times of the given submission, if any."""
+        with cls.__lock:
+            if not (wait_times := cls.__wait_times.get(submit_id)):
+                return None
+            return cls.__get_percentiles(wait_times)
+
+    @classmethod
+    def _get_all_percentiles(cls) -> Dict[str, Dict[str, float]]:
+        with cls.__lock:
+            return {submit_id: cls.__get_percentiles(wait_times) for submit_id, wait_times in cls.__wait_times.items()}
+
+    @classmethod
+    def __get_percentiles(cls, wait_times: List[float]) -> Dict[str, float]:
+        # Nearest-rank percentiles.
+        percentiles = {
+            f"p{percentile}": wait_times[max(math.ceil(percentile * len(wait_times) / 100) - 1, 0)]
+            for percentile in cls._PERCENTILES
+        }
+        return {**percentiles, "max": wait_times[-1], "count": len(wait_times)}
+
+    @classmethod
+    def _clean(cls):
+        with cls.__lock:
+            cls.__wait_times.clear()
@@ -28,6 +28,16 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _save_many(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository at once.
+
+        Parameters:
+            entities: The data from the objects.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
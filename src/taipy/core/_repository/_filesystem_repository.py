@@ -11,8 +11,10 @@
 
 import copy
 import json
+import os
 import pathlib
 import shutil
+import uuid
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
 
 from taipy.config.config import Config
@@ -40,6 +42,7 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     """
 
     __EXCEPTIONS_TO_RETRY = (FileCannotBeRead,)
+    __TMP_SUFFIX = ".tmp"
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
@@ -60,11 +63,12 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
     def _save(self, entity: Entity):
         self.__create_directory_if_not_exists()
-        model = self.converter._entity_to_model(entity)  # type: ignore
-        self.__get_path(model.id).write_text(
-            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
-            encoding="UTF-8",
-        )
+        self.__write_entity(entity)
+
+    def _save_many(self, entities: Iterable[Entity]):
+        self.__create_directory_if_not_exists()
+        for entity in entities:
+            self.__write_entity(entity)
 
     def _exists(self, entity_id: str) -> bool:
         return self.__get_path(entity_id).exists()
@@ -213,6 +217,17 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
         return None, None, None
 
+    def __write_entity(self, entity: Entity):
+        model = self.converter._entity_to_model(entity)  # type: ignore
+        path = self.__get_path(model.id)
+        # Written aside then moved in place, so that a concurrent reader never reads a partially written file.
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}{self.__TMP_SUFFIX}")
+        tmp_path.write_text(
+            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
+            encoding="UTF-8",
+        )
+        os.replace(tmp_path, path)
+
     def __create_directory_if_not_exists(self):
         self.dir_path.mkdir(parents=True, exist_ok=True)
 
@@ -232,6 +247,8 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         return entity
 
     def __filter_by(self, filepath: pathlib.Path, filters: Optional[List[Dict]]) -> Optional[Json]:
+        if filepath.suffix == self.__TMP_SUFFIX:
+            return None
         if not filters:
             filters = [{}]
 
@@ -256,6 +273,8 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         try:
             with filepath.open("r", encoding="UTF-8") as f:
                 file_content = f.read()
-            return file_content
         except Exception:
             raise FileCannotBeRead(str(filepath))
+        if not file_content:  # The file is being written by another thread or process.
+            raise FileCannotBeRead(str(filepath))
+        return file_content
@@ -51,6 +51,15 @@ class _SQLRepository(_AbstractRepository[ModelType, Entity]):
             return
         self.__insert_model(obj)
 
+    def _save_many(self, entities: Iterable[Entity]):
+        # A single statement and a single commit for all the entities, whether they are new or not.
+        models = [self.converter._entity_to_model(entity) for entity in entities]
+        if not models:
+            return
+        query = self.table.insert().prefix_with("OR REPLACE")
+        self.db.executemany(str(query.compile(dialect=sqlite.dialect())), [model.to_list() for model in models])
+        self.db.commit()
+
     def _exists(self, entity_id: str):
         query = self.table.select().filter_by(id=entity_id)
         return bool(self.db.execute(str(query), [entity_id]).fetchone())
@@ -47,30 +47,34 @@ class _SQLConnection:
         from ...submission._submission_model import _SubmissionModel
         from ...task._task_model import _TaskModel
 
-        cls._connection.execute(
-            str(CreateTable(_CycleModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
-        cls._connection.execute(
-            str(CreateTable(_DataNodeModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
-        cls._connection.execute(
-            str(CreateTable(_JobModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
-        cls._connection.execute(
-            str(CreateTable(_ScenarioModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
-        cls._connection.execute(
-            str(CreateTable(_TaskModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
-        cls._connection.execute(
-            str(CreateTable(_VersionModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
-        cls._connection.execute(
-            str(CreateTable(_SubmissionModel.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
-        )
+        for model in (
+            _CycleModel,
+            _DataNodeModel,
+            _JobModel,
+            _ScenarioModel,
+            _TaskModel,
+            _VersionModel,
+            _SubmissionModel,
+        ):
+            cls._connection.execute(
+                str(CreateTable(model.__table__, if_not_exists=True).compile(dialect=sqlite.dialect()))
+            )
+            cls.__add_missing_columns(model.__table__)
 
         return cls._connection
 
+    @classmethod
+    def __add_missing_columns(cls, table):
+        """Add the columns of the given table missing from the existing database table, created by a previous version.
+
+        The rows already stored get a NULL value for the added columns.
+        """
+        existing_columns = {row["name"] for row in cls._connection.execute(f'PRAGMA table_info("{table.name}")')}
+        for column in table.columns:
+            if column.name not in existing_columns:
+                column_type = column.type.compile(dialect=sqlite.dialect())
+                cls._connection.execute(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+
 
 def _build_connection() -> Connection:
     # Set SQLite threading mode to Serialized, means that threads may share the module, connections and cursors
@@ -14,7 +14,7 @@ import time
 from collections import namedtuple
 from importlib import import_module
 from operator import attrgetter
-from typing import Callable, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
 
 from taipy.config import Config
 
@@ -80,4 +80,12 @@ def _fcts_to_dict(objs):
     return [d for obj in objs if (d := _fct_to_dict(obj)) is not None]
 
 
+def _is_positive_number(value: Any) -> bool:
+    """Returns True if the given value, possibly a string, is a number strictly greater than 0."""
+    try:
+        return float(value) > 0
+    except (TypeError, ValueError):
+        return False
+
+
 _Subscriber = namedtuple("_Subscriber", "callback params")
@@ -9,14 +9,19 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict
+import multiprocessing
+import os
+import sys
+from typing import Any, Dict
 
 from taipy.config._config import _Config
 from taipy.config.checker._checkers._config_checker import _ConfigChecker
 from taipy.config.checker.issue_collector import IssueCollector
 
+from ...common._utils import _is_positive_number
 from ..data_node_config import DataNodeConfig
 from ..job_config import JobConfig
+from ..task_config import TaskConfig
 
 
 class _JobConfigChecker(_ConfigChecker):
@@ -27,15 +32,211 @@ class _JobConfigChecker(_ConfigChecker):
         if job_config := self._config._unique_sections.get(JobConfig.name):
             data_node_configs = self._config._sections[DataNodeConfig.name]
             self._check_multiprocess_mode(job_config, data_node_configs)
+            self._check_worker_processes(job_config)
+            self._check_pools(job_config, self._config._sections.get(TaskConfig.name, {}))
+            self._check_scheduling_policy(job_config)
+            self._check_memory_budget(job_config)
+            self._check_autoscaling(job_config)
+            self._check_fair_shares(job_config)
         return self._collector
 
     def _check_multiprocess_mode(self, job_config: JobConfig, data_node_configs: Dict[str, DataNodeConfig]):
-        if job_config.is_standalone:
-            for cfg_id, data_node_config in data_node_configs.items():
-                if data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
-                    self._error(
-                        DataNodeConfig._STORAGE_TYPE_KEY,
-                        data_node_config.storage_type,
-                        f"DataNode `{cfg_id}`: In-memory storage type can ONLY be used in "
-                        f"{JobConfig._DEVELOPMENT_MODE} mode.",
-                    )
+        if not job_config.is_standalone:
+            return
+        if job_config.use_shared_memory:
+            if os.name == "posix":
+                # In-memory data are handed over between the processes through shared memory.
+                return
+            self._warning(
+                JobConfig._USE_SHARED_MEMORY_KEY,
+                job_config.use_shared_memory,
+                f"{JobConfig._USE_SHARED_MEMORY_KEY} field of JobConfig is only supported on POSIX systems. It is"
+                f" ignored.",
+            )
+        for cfg_id, data_node_config in data_node_configs.items():
+            if data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
+                self._error(
+                    DataNodeConfig._STORAGE_TYPE_KEY,
+                    data_node_config.storage_type,
+                    f"DataNode `{cfg_id}`: In-memory storage type can ONLY be used in "
+                    f"{JobConfig._DEVELOPMENT_MODE} mode.",
+                )
+
+    def _check_worker_processes(self, job_config: JobConfig):
+        start_method = job_config.start_method
+        if start_method and start_method not in multiprocessing.get_all_start_methods():
+            self._error(
+                JobConfig._START_METHOD_KEY,
+                start_method,
+                f"{JobConfig._START_METHOD_KEY} field of JobConfig must be populated with one of the start methods"
+                f" available on this platform: {multiprocessing.get_all_start_methods()}.",
+            )
+        for key in [JobConfig._MAX_NB_OF_THREADS_KEY, JobConfig._MAX_NB_OF_COROUTINES_KEY]:
+            value = getattr(job_config, key)
+            if value is not None and (not str(value).isdigit() or int(value) < 1):
+                self._error(key, value, f"{key} field of JobConfig must be populated with a positive integer value.")
+        max_tasks_per_child = job_config.max_tasks_per_child
+        if max_tasks_per_child is None:
+            return
+        if not str(max_tasks_per_child).isdigit() or int(max_tasks_per_child) < 1:
+            self._error(
+                JobConfig._MAX_TASKS_PER_CHILD_KEY,
+                max_tasks_per_child,
+                f"{JobConfig._MAX_TASKS_PER_CHILD_KEY} field of JobConfig must be populated with a positive integer"
+                f" value.",
+            )
+        elif sys.version_info < (3, 11):
+            self._warning(
+                JobConfig._MAX_TASKS_PER_CHILD_KEY,
+                max_tasks_per_child,
+                f"{JobConfig._MAX_TASKS_PER_CHILD_KEY} field of JobConfig is only supported from Python 3.11. It is"
+                f" ignored.",
+            )
+        elif start_method == "fork":
+            self.__check_max_tasks_per_child_with_fork(job_config, "JobConfig")
+
+    def __check_max_tasks_per_child_with_fork(self, job_config: JobConfig, owner: str):
+        max_tasks_per_child = job_config.max_tasks_per_child
+        if max_tasks_per_child is None or not str(max_tasks_per_child).isdigit() or sys.version_info < (3, 11):
+            # Either not set, already reported as invalid, or ignored.
+            return
+        self._error(
+            JobConfig._MAX_TASKS_PER_CHILD_KEY,
+            max_tasks_per_child,
+            f"{JobConfig._MAX_TASKS_PER_CHILD_KEY} field of JobConfig cannot be used with the `fork`"
+            f" {JobConfig._START_METHOD_KEY} of {owner}.",
+        )
+
+    def _check_pools(self, job_config: JobConfig, task_configs: Dict[str, TaskConfig]):
+        pools = job_config.pools or {}
+        if not isinstance(pools, dict):
+            self._error(
+                JobConfig._POOLS_KEY,
+                pools,
+                f"{JobConfig._POOLS_KEY} field of JobConfig must be populated with a dictionary of pools.",
+            )
+            return
+        for name, pool in pools.items():
+            if name in JobConfig._RESERVED_POOLS:
+                self._error(
+                    JobConfig._POOLS_KEY,
+                    name,
+                    f"Pool `{name}` of JobConfig cannot use one of the reserved names {JobConfig._RESERVED_POOLS}.",
+                )
+            if not isinstance(pool, dict):
+                self._error(JobConfig._POOLS_KEY, pool, f"Pool `{name}` of JobConfig must be a dictionary.")
+                continue
+            max_nb_of_workers = pool.get(JobConfig._MAX_NB_OF_WORKERS_KEY)
+            if max_nb_of_workers is not None and (not str(max_nb_of_workers).isdigit() or int(max_nb_of_workers) < 1):
+                self._error(
+                    JobConfig._MAX_NB_OF_WORKERS_KEY,
+                    max_nb_of_workers,
+                    f"{JobConfig._MAX_NB_OF_WORKERS_KEY} field of pool `{name}` must be populated with a positive"
+                    f" integer value.",
+                )
+            self.__check_min_nb_of_workers(
+                pool.get(JobConfig._MIN_NB_OF_WORKERS_KEY), max_nb_of_workers, f"pool `{name}`"
+            )
+            if (executor := pool.get(JobConfig._EXECUTOR_KEY)) and executor not in TaskConfig._EXECUTORS:
+                self._error(
+                    JobConfig._EXECUTOR_KEY,
+                    executor,
+                    f"{JobConfig._EXECUTOR_KEY} field of pool `{name}` must be populated with one of"
+                    f" {TaskConfig._EXECUTORS}.",
+                )
+            start_method = pool.get(JobConfig._START_METHOD_KEY)
+            if start_method and start_method not in multiprocessing.get_all_start_methods():
+                self._error(
+                    JobConfig._START_METHOD_KEY,
+                    start_method,
+                    f"{JobConfig._START_METHOD_KEY} field of pool `{name}` must be populated with one of the start"
+                    f" methods available on this platform: {multiprocessing.get_all_start_methods()}.",
+                )
+            elif start_method == "fork" and executor != TaskConfig._THREAD_EXECUTOR:
+                self.__check_max_tasks_per_child_with_fork(job_config, f"pool `{name}`")
+        for task_config_id, task_config in task_configs.items():
+            if task_config.pool and task_config.pool not in pools and task_config.pool not in JobConfig._RESERVED_POOLS:
+                self._error(
+                    TaskConfig._POOL_KEY,
+                    task_config.pool,
+                    f"{TaskConfig._POOL_KEY} field of TaskConfig `{task_config_id}` must be populated with a pool"
+                    f" defined in JobConfig.",
+                )
+            elif task_config.pool and task_config.executor:
+                self.__check_executor_of_pool(task_config_id, task_config, pools)
+
+    def __check_executor_of_pool(self, task_config_id: str, task_config: TaskConfig, pools: Dict[str, Any]):
+        if task_config.pool == JobConfig._THREAD_POOL:
+            pool_executor = TaskConfig._THREAD_EXECUTOR
+        elif isinstance(pool := pools.get(task_config.pool), dict):
+            pool_executor = pool.get(JobConfig._EXECUTOR_KEY) or TaskConfig._PROCESS_EXECUTOR
+        else:
+            pool_executor = TaskConfig._PROCESS_EXECUTOR
+        if task_config.executor != pool_executor:
+            self._warning(
+                TaskConfig._EXECUTOR_KEY,
+                task_config.executor,
+                f"{TaskConfig._EXECUTOR_KEY} field of TaskConfig `{task_config_id}` is ignored. The task runs on the"
+                f" {pool_executor} executor of its pool `{task_config.pool}`.",
+            )
+
+    def _check_scheduling_policy(self, job_config: JobConfig):
+        scheduling_policy = job_config.scheduling_policy
+        if scheduling_policy is not None and scheduling_policy not in JobConfig._SCHEDULING_POLICIES:
+            self._error(
+                JobConfig._SCHEDULING_POLICY_KEY,
+                scheduling_policy,
+                f"{JobConfig._SCHEDULING_POLICY_KEY} field of JobConfig must be populated with one of"
+                f" {JobConfig._SCHEDULING_POLICIES}.",
+            )
+
+    def _check_memory_budget(self, job_config: JobConfig):
+        memory_budget = job_config.memory_budget
+        if memory_budget is None:
+            return
+        if not _is_positive_number(memory_budget):
+            self._error(
+                JobConfig._MEMORY_BUDGET_KEY,
+                memory_budget,
+                f"{JobConfig._MEMORY_BUDGET_KEY} field of JobConfig must be populated with a positive number.",
+            )
+
+    def _check_autoscaling(self, job_config: JobConfig):
+        self.__check_min_nb_of_workers(job_config.min_nb_of_workers, job_config.max_nb_of_workers, "JobConfig")
+        worker_idle_timeout = job_config.worker_idle_timeout
+        if worker_idle_timeout is None:
+            return
+        if not _is_positive_number(worker_idle_timeout):
+            self._error(
+                JobConfig._WORKER_IDLE_TIMEOUT_KEY,
+                worker_idle_timeout,
+                f"{JobConfig._WORKER_IDLE_TIMEOUT_KEY} field of JobConfig must be populated with a positive number.",
+            )
+
+    def _check_fair_shares(self, job_config: JobConfig):
+        for user, weight in (job_config.fair_shares or {}).items():
+            if not _is_positive_number(weight):
+                self._error(
+                    JobConfig._FAIR_SHARES_KEY,
+                    weight,
+                    f"{JobConfig._FAIR_SHARES_KEY} field of JobConfig must be populated with a positive number for"
+                    f" user `{user}`.",
+                )
+
+    def __check_min_nb_of_workers(self, min_nb_of_workers, max_nb_of_workers, owner: str):
+        if min_nb_of_workers is None:
+            return
+        if not str(min_nb_of_workers).isdigit() or int(min_nb_of_workers) < 1:
+            self._error(
+                JobConfig._MIN_NB_OF_WORKERS_KEY,
+                min_nb_of_workers,
+                f"{JobConfig._MIN_NB_OF_WORKERS_KEY} field of {owner} must be populated with a positive integer"
+                f" value.",
+            )
+        elif str(max_nb_of_workers or 1).isdigit() and int(min_nb_of_workers) > int(max_nb_of_workers or 1):
+            self._error(
+                JobConfig._MIN_NB_OF_WORKERS_KEY,
+                min_nb_of_workers,
+                f"{JobConfig._MIN_NB_OF_WORKERS_KEY} field of {owner} must not be greater than its"
+                f" {JobConfig._MAX_NB_OF_WORKERS_KEY}.",
+            )
@@ -9,10 +9,13 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import inspect
+
 from taipy.config._config import _Config
 from taipy.config.checker._checkers._config_checker import _ConfigChecker
 from taipy.config.checker.issue_collector import IssueCollector
 
+from ...common._utils import _is_positive_number
 from ..data_node_config import DataNodeConfig
 from ..task_config import TaskConfig
 
@@ -30,6 +33,12 @@ class _TaskConfigChecker(_ConfigChecker):
                 self._check_existing_function(task_config_id, task_config)
                 self._check_inputs(task_config_id, task_config)
                 self._check_outputs(task_config_id, task_config)
+                self._check_priority(task_config_id, task_config)
+                self._check_executor(task_config_id, task_config)
+                self._check_coroutine_function(task_config_id, task_config)
+                self._check_memoize(task_config_id, task_config)
+                self._check_timeout(task_config_id, task_config)
+                self._check_memory(task_config_id, task_config)
         return self._collector
 
     def _check_inputs(self, task_config_id: str, task_config: TaskConfig):
@@ -57,3 +66,67 @@ class _TaskConfigChecker(_ConfigChecker):
                     f"{task_config._FUNCTION} field of TaskConfig `{task_config_id}` must be"
                     f" populated with Callable value.",
                 )
+
+    def _check_priority(self, task_config_id: str, task_config: TaskConfig):
+        if task_config._priority is not None and not isinstance(task_config.priority, int):
+            self._error(
+                task_config._PRIORITY_KEY,
+                task_config._priority,
+                f"{task_config._PRIORITY_KEY} field of TaskConfig `{task_config_id}` must be populated with an"
+                f" integer value.",
+            )
+
+    def _check_executor(self, task_config_id: str, task_config: TaskConfig):
+        if task_config._executor is not None and task_config.executor not in TaskConfig._EXECUTORS:
+            self._error(
+                task_config._EXECUTOR_KEY,
+                task_config._executor,
+                f"{task_config._EXECUTOR_KEY} field of TaskConfig `{task_config_id}` must be populated with one of"
+                f" {TaskConfig._EXECUTORS}.",
+            )
+
+    def _check_memoize(self, task_config_id: str, task_config: TaskConfig):
+        if task_config._memoize is not None and not isinstance(task_config.memoize, bool):
+            self._error(
+                task_config._MEMOIZE_KEY,
+                task_config._memoize,
+                f"{task_config._MEMOIZE_KEY} field of TaskConfig `{task_config_id}` must be populated with a Boolean"
+                f" value.",
+            )
+
+    def _check_timeout(self, task_config_id: str, task_config: TaskConfig):
+        if task_config._timeout is None:
+            return
+        if not _is_positive_number(task_config.timeout):
+            self._error(
+                task_config._TIMEOUT_KEY,
+                task_config._timeout,
+                f"{task_config._TIMEOUT_KEY} field of TaskConfig `{task_config_id}` must be populated with a positive"
+                f" number of seconds.",
+            )
+
+    def _check_memory(self, task_config_id: str, task_config: TaskConfig):
+        if task_config._memory is None:
+            return
+        if not _is_positive_number(task_config.memory):
+            self._error(
+                task_config._MEMORY_KEY,
+                task_config._memory,
+                f"{task_config._MEMORY_KEY} field of TaskConfig `{task_config_id}` must be populated with a positive"
+                f" number of megabytes.",
+            )
+
+    def _check_coroutine_function(self, task_config_id: str, task_config: TaskConfig):
+        if not inspect.iscoroutinefunction(task_config.function):
+            return
+        for key, value in [
+            (TaskConfig._EXECUTOR_KEY, task_config._executor),
+            (TaskConfig._POOL_KEY, task_config._pool),
+        ]:
+            if value is not None:
+                self._warning(
+                    key,
+                    value,
+                    f"{key} field of TaskConfig `{task_config_id}` is ignored. The function of the task is a coroutine"
+                    f" function, run on the event loop of the dispatcher.",
+                )
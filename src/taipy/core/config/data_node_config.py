@@ -86,6 +86,11 @@ class DataNodeConfig(Section):
     _OPTIONAL_ENCODING_PROPERTY = "encoding"
     _DEFAULT_ENCODING_VALUE = "utf-8"
 
+    # Set to False for an intermediate data node of a fused chain of tasks to only be passed in memory, not written
+    _OPTIONAL_PERSIST_PROPERTY = "persist"
+    # Query returning a checksum of the data of a SQL data node, used to fingerprint the inputs of memoized tasks
+    _OPTIONAL_CHECKSUM_QUERY_SQL_PROPERTY = "checksum_query"
+
     # Generic
     _OPTIONAL_READ_FUNCTION_GENERIC_PROPERTY = "read_fct"
     _OPTIONAL_READ_FUNCTION_ARGS_GENERIC_PROPERTY = "read_fct_args"
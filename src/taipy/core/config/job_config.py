@@ -37,6 +37,37 @@ class JobConfig(UniqueSection):
     _DEFAULT_MODE = _DEVELOPMENT_MODE
     _MODES = [_STANDALONE_MODE, _DEVELOPMENT_MODE]
 
+    _MAX_NB_OF_WORKERS_KEY = "max_nb_of_workers"
+    _MIN_NB_OF_WORKERS_KEY = "min_nb_of_workers"
+    _WORKER_IDLE_TIMEOUT_KEY = "worker_idle_timeout"
+    _DEFAULT_WORKER_IDLE_TIMEOUT = 60.0
+    _START_METHOD_KEY = "start_method"
+    _MAX_TASKS_PER_CHILD_KEY = "max_tasks_per_child"
+    _MAX_NB_OF_THREADS_KEY = "max_nb_of_threads"
+    _MAX_NB_OF_COROUTINES_KEY = "max_nb_of_coroutines"
+    _DEFAULT_MAX_NB_OF_COROUTINES = 100
+
+    _POOLS_KEY = "pools"
+    _EXECUTOR_KEY = "executor"
+    _DEFAULT_POOL = "default"
+    _THREAD_POOL = "thread"
+    _RESERVED_POOLS = [_DEFAULT_POOL, _THREAD_POOL]
+
+    _FUSE_TASK_CHAINS_KEY = "fuse_task_chains"
+
+    _USE_SHARED_MEMORY_KEY = "use_shared_memory"
+
+    _SCHEDULING_POLICY_KEY = "scheduling_policy"
+    _PRIORITY_POLICY = "priority"
+    _CRITICAL_PATH_POLICY = "critical_path"
+    _FAIR_SHARE_POLICY = "fair_share"
+    _SCHEDULING_POLICIES = [_PRIORITY_POLICY, _CRITICAL_PATH_POLICY, _FAIR_SHARE_POLICY]
+
+    _FAIR_SHARES_KEY = "fair_shares"
+    _DEFAULT_FAIR_SHARE = 1.0
+
+    _MEMORY_BUDGET_KEY = "memory_budget"
+
     def __init__(self, mode: Optional[str] = None, **properties):
         self.mode = mode or self._DEFAULT_MODE
         self._config = self._create_config(self.mode, **properties)
@@ -79,7 +110,21 @@ class JobConfig(UniqueSection):
 
     @staticmethod
     def _configure(
-        mode: Optional[str] = None, max_nb_of_workers: Optional[Union[int, str]] = None, **properties
+        mode: Optional[str] = None,
+        max_nb_of_workers: Optional[Union[int, str]] = None,
+        start_method: Optional[str] = None,
+        max_tasks_per_child: Optional[Union[int, str]] = None,
+        max_nb_of_threads: Optional[Union[int, str]] = None,
+        max_nb_of_coroutines: Optional[Union[int, str]] = None,
+        pools: Optional[Dict[str, Dict[str, Any]]] = None,
+        fuse_task_chains: Optional[bool] = None,
+        use_shared_memory: Optional[bool] = None,
+        scheduling_policy: Optional[str] = None,
+        memory_budget: Optional[Union[float, str]] = None,
+        min_nb_of_workers: Optional[Union[int, str]] = None,
+        worker_idle_timeout: Optional[Union[float, str]] = None,
+        fair_shares: Optional[Dict[str, Union[float, str]]] = None,
+        **properties,
     ) -> "JobConfig":
         """Configure job execution.
 
@@ -92,12 +137,117 @@ class JobConfig(UniqueSection):
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
+            start_method (Optional[str]): Parameter used only in default *"standalone"* mode.
+                This indicates the method used to start the worker processes.<br/>
+                Possible values are: *"fork"*, *"forkserver"* or *"spawn"*, depending on the platform.<br/>
+                The default value is the default start method of the platform.
+            max_tasks_per_child (Optional[int, str]): Parameter used only in default *"standalone"* mode.
+                This indicates the maximum number of jobs a worker process executes before being replaced
+                by a fresh one. It is only supported from Python 3.11, and not with the *"fork"* start method.<br/>
+                The default value is None, meaning that worker processes live as long as the pool.<br/>
+                A string can be provided to dynamically set the value using an environment
+                variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
+                `&lt;env_var&gt;` is the name of an environment variable.
+            max_nb_of_threads (Optional[int, str]): Parameter used only in default *"standalone"* mode.
+                This indicates the maximum number of jobs able to run in parallel on the thread pool, used by
+                the tasks configured with the *"thread"* executor.<br/>
+                The default value is the value of *max_nb_of_workers*.<br/>
+                A string can be provided to dynamically set the value using an environment
+                variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
+                `&lt;env_var&gt;` is the name of an environment variable.
+            max_nb_of_coroutines (Optional[int, str]): Parameter used only in default *"standalone"* mode.
+                This indicates the maximum number of jobs able to run concurrently on the event loop, used
+                by the tasks whose function is a coroutine function (`async def`).<br/>
+                The default value is 100.<br/>
+                A string can be provided to dynamically set the value using an environment
+                variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
+                `&lt;env_var&gt;` is the name of an environment variable.
+            pools (Optional[Dict[str, Dict[str, any]]]): Parameter used only in default *"standalone"* mode.
+                This defines additional named worker pools, in which the tasks configured with the
+                corresponding *pool* run. Each pool is a dictionary with the *"max_nb_of_workers"* (default
+                1), *"min_nb_of_workers"* (see *min_nb_of_workers*, default *"max_nb_of_workers"*),
+                *"executor"* (*"process"* or *"thread"*, default *"process"*) and *"start_method"* keys.
+                The names *"default"* and *"thread"* are reserved for the pools built from the other parameters.
+                <br/>
+                The default value is None.
+            fuse_task_chains (Optional[bool]): Parameter used only in default *"standalone"* mode.
+                If True, the linear chains of non-skippable tasks of a submission, whose intermediate data nodes
+                are only read by the next task of the chain, run in a single worker of the pool of their first
+                task. The intermediate data are passed in memory from one task to the next. They are also written,
+                unless the data node is configured with the *persist* property set to False: the data node then
+                keeps its previous data. A job is still created for each task.<br/>
+                The default value is False.
+            use_shared_memory (Optional[bool]): Parameter used only in default *"standalone"* mode, on POSIX
+                systems. If True, the data written by a job executed in a worker process to an *"in_memory"* or
+                *"pickle"* data node is also published in shared memory. The jobs of the same submission map it
+                instead of reading it from the storage, without copying NumPy arrays, DataFrames or Arrow tables.
+                The mapping is copy-on-write: a task function modifying its input in place only modifies its own
+                copy of the modified data. The shared memory is released when the submission is finished. It also
+                allows *"in_memory"* data nodes to be used in *"standalone"* mode.<br/>
+                The default value is False.
+            scheduling_policy (Optional[str]): The order in which the jobs ready to run are dispatched.<br/>
+                Possible values are: *"priority"* (the default value), where the jobs are dispatched by priority,
+                then by arrival, or *"critical_path"*, where the jobs of the same priority starting the longest
+                path of tasks of their submission are dispatched first. The durations of the tasks are estimated
+                from the durations of the jobs completed by the application, saved in the storage folder. See
+                `taipy.plan()^` for the resulting estimated schedule.<br/>
+                With the *"fair_share"* policy, the workers are shared between the submissions, or between the
+                users for the submissions made for a *user*, instead of being taken by the first submissions.
+                The share whose dispatched jobs have the lowest estimated duration, relative to its weight, is
+                served first. Within a share, the jobs are dispatched by priority, then by arrival.
+            memory_budget (Optional[float, str]): Parameter used only in default *"standalone"* mode.
+                This indicates the memory, in megabytes, the jobs running in parallel can use. A job is only
+                dispatched if its estimated memory, added to the estimated memory of the running jobs, fits in
+                the budget. Meanwhile, the smaller jobs waiting after it are dispatched. The memory of a job is
+                the *memory* of its task configuration, or else the peak memory measured on the previous jobs
+                of its task configuration executed in a worker process, or else 0. A job larger than the budget
+                only runs when no other job runs.<br/>
+                The default value is None, meaning no budget.<br/>
+                A string can be provided to dynamically set the value using an environment
+                variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
+                `&lt;env_var&gt;` is the name of an environment variable.
+            min_nb_of_workers (Optional[int, str]): Parameter used only in default *"standalone"* mode.
+                If lower than *max_nb_of_workers*, the worker process pool is autoscaled: it starts with
+                *min_nb_of_workers* workers, grows up to *max_nb_of_workers* workers when jobs wait for a
+                worker, and shrinks back when workers stay idle for *worker_idle_timeout* seconds.<br/>
+                The default value is None, meaning that the pool always has *max_nb_of_workers* workers.<br/>
+                A string can be provided to dynamically set the value using an environment
+                variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
+                `&lt;env_var&gt;` is the name of an environment variable.
+            worker_idle_timeout (Optional[float, str]): Parameter used only in default *"standalone"* mode.
+                This indicates the number of seconds the workers of an autoscaled pool stay idle before the
+                pool shrinks.<br/>
+                The default value is 60.<br/>
+                A string can be provided to dynamically set the value using an environment
+                variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
+                `&lt;env_var&gt;` is the name of an environment variable.
+            fair_shares (Optional[Dict[str, Union[float, str]]]): Parameter used only with the *"fair_share"*
+                scheduling policy. This indicates the weight of the share of each user. A user with a weight
+                of 2 has twice the share of a user with a weight of 1.<br/>
+                The default value is None, meaning that all the users and the submissions made for no user
+                have a weight of 1.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
             The new job execution configuration.
         """
-        section = JobConfig(mode, max_nb_of_workers=max_nb_of_workers, **properties)
+        section = JobConfig(
+            mode,
+            max_nb_of_workers=max_nb_of_workers,
+            start_method=start_method,
+            max_tasks_per_child=max_tasks_per_child,
+            max_nb_of_threads=max_nb_of_threads,
+            max_nb_of_coroutines=max_nb_of_coroutines,
+            pools=pools,
+            fuse_task_chains=fuse_task_chains,
+            use_shared_memory=use_shared_memory,
+            scheduling_policy=scheduling_policy,
+            memory_budget=memory_budget,
+            min_nb_of_workers=min_nb_of_workers,
+            worker_idle_timeout=worker_idle_timeout,
+            fair_shares=fair_shares,
+            **properties,
+        )
         Config._register(section)
         return Config.unique_sections[JobConfig.name]
 
@@ -36,6 +36,28 @@ class TaskConfig(Section):
         skippable (bool): If True, indicates that the task can be skipped if no change has
             been made on inputs.<br/>
             The default value is False.
+        priority (Optional[int]): The priority of the jobs created from the task. Jobs with a higher
+            priority are dispatched first.<br/>
+            The default value is None, equivalent to a priority of 0.
+        executor (Optional[str]): The kind of executor the jobs created from the task run on in *"standalone"*
+            mode. Possible values are *"process"* for CPU-bound tasks or *"thread"* for I/O-bound tasks.<br/>
+            The default value is None, equivalent to *"process"*.
+        pool (Optional[str]): The name of the worker pool, defined in the job configuration, the jobs created
+            from the task run in, in *"standalone"* mode.<br/>
+            The default value is None, meaning the pool of the *executor*.
+        memoize (Optional[bool]): If True, the results of the jobs created from the task are stored, keyed by a
+            fingerprint of the task function and of the input data. A job whose key is already stored does not run
+            the function: the stored results are copied to its output data nodes instead. The fingerprint of the
+            function covers its code and the source file of its module, but not the other modules it calls, nor
+            the values of global variables modified at runtime.<br/>
+            The default value is None, equivalent to False.
+        timeout (Optional[float]): The maximum number of seconds the jobs created from the task can run in
+            *"standalone"* mode. A job still running after this delay is interrupted and fails.<br/>
+            The default value is None, meaning no timeout.
+        memory (Optional[float]): The estimated peak memory, in megabytes, of the jobs created from the task. In
+            *"standalone"* mode, with a *memory_budget* set in the job configuration, a job is only dispatched if
+            its memory fits in the budget.<br/>
+            The default value is None, meaning the peak memory measured on the previous jobs of the task.
         function (Callable): User function taking as inputs some parameters compatible with the
             exposed types (*exposed_type* field) of the input data nodes and returning results
             compatible with the exposed types (*exposed_type* field) of the outputs list.<br/>
@@ -49,6 +71,15 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _PRIORITY_KEY = "priority"
+    _EXECUTOR_KEY = "executor"
+    _PROCESS_EXECUTOR = "process"
+    _THREAD_EXECUTOR = "thread"
+    _EXECUTORS = [_PROCESS_EXECUTOR, _THREAD_EXECUTOR]
+    _POOL_KEY = "pool"
+    _MEMOIZE_KEY = "memoize"
+    _TIMEOUT_KEY = "timeout"
+    _MEMORY_KEY = "memory"
 
     def __init__(
         self,
@@ -57,6 +88,12 @@ class TaskConfig(Section):
         inputs: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         outputs: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: Optional[bool] = False,
+        priority: Optional[int] = None,
+        executor: Optional[str] = None,
+        pool: Optional[str] = None,
+        memoize: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        memory: Optional[float] = None,
         **properties,
     ):
         if inputs:
@@ -72,12 +109,29 @@ class TaskConfig(Section):
         else:
             self._outputs = []
         self._skippable = skippable
+        self._priority = priority
+        self._executor = executor
+        self._pool = pool
+        self._memoize = memoize
+        self._timeout = timeout
+        self._memory = memory
         self.function = function
         super().__init__(id, **properties)
 
     def __copy__(self):
         return TaskConfig(
-            self.id, self.function, copy(self._inputs), copy(self._outputs), self.skippable, **copy(self._properties)
+            self.id,
+            self.function,
+            copy(self._inputs),
+            copy(self._outputs),
+            self.skippable,
+            self._priority,
+            self._executor,
+            self._pool,
+            self._memoize,
+            self._timeout,
+            self._memory,
+            **copy(self._properties),
         )
 
     def __getattr__(self, item: str) -> Optional[Any]:
@@ -103,6 +157,30 @@ class TaskConfig(Section):
     def skippable(self):
         return _tpl._replace_templates(self._skippable)
 
+    @property
+    def priority(self) -> Optional[int]:
+        return _tpl._replace_templates(self._priority, int)
+
+    @property
+    def executor(self) -> Optional[str]:
+        return _tpl._replace_templates(self._executor)
+
+    @property
+    def pool(self) -> Optional[str]:
+        return _tpl._replace_templates(self._pool)
+
+    @property
+    def memoize(self) -> Optional[bool]:
+        return _tpl._replace_templates(self._memoize, bool)
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return _tpl._replace_templates(self._timeout, float)
+
+    @property
+    def memory(self) -> Optional[float]:
+        return _tpl._replace_templates(self._memory, float)
+
     @classmethod
     def default_config(cls):
         return TaskConfig(cls._DEFAULT_KEY, None, [], [], False)
@@ -112,16 +190,35 @@ class TaskConfig(Section):
         self._inputs = []
         self._outputs = []
         self._skippable = False
+        self._priority = None
+        self._executor = None
+        self._pool = None
+        self._memoize = None
+        self._timeout = None
+        self._memory = None
         self._properties.clear()
 
     def _to_dict(self):
-        return {
+        as_dict = {
             self._FUNCTION: self.function,
             self._INPUT_KEY: self._inputs,
             self._OUTPUT_KEY: self._outputs,
             self._IS_SKIPPABLE_KEY: self._skippable,
-            **self._properties,
         }
+        if self._priority is not None:
+            as_dict[self._PRIORITY_KEY] = self._priority
+        if self._executor is not None:
+            as_dict[self._EXECUTOR_KEY] = self._executor
+        if self._pool is not None:
+            as_dict[self._POOL_KEY] = self._pool
+        if self._memoize is not None:
+            as_dict[self._MEMOIZE_KEY] = self._memoize
+        if self._timeout is not None:
+            as_dict[self._TIMEOUT_KEY] = self._timeout
+        if self._memory is not None:
+            as_dict[self._MEMORY_KEY] = self._memory
+        as_dict.update(self._properties)
+        return as_dict
 
     @classmethod
     def _from_dict(cls, as_dict: Dict[str, Any], id: str, config: Optional[_Config]):
@@ -135,7 +232,26 @@ class TaskConfig(Section):
         if outputs_as_str := as_dict.pop(cls._OUTPUT_KEY, None):
             outputs = [dn_configs[ds_id] for ds_id in outputs_as_str if ds_id in dn_configs]
         skippable = as_dict.pop(cls._IS_SKIPPABLE_KEY, False)
-        return TaskConfig(id=id, function=funct, inputs=inputs, outputs=outputs, skippable=skippable, **as_dict)
+        priority = as_dict.pop(cls._PRIORITY_KEY, None)
+        executor = as_dict.pop(cls._EXECUTOR_KEY, None)
+        pool = as_dict.pop(cls._POOL_KEY, None)
+        memoize = as_dict.pop(cls._MEMOIZE_KEY, None)
+        timeout = as_dict.pop(cls._TIMEOUT_KEY, None)
+        memory = as_dict.pop(cls._MEMORY_KEY, None)
+        return TaskConfig(
+            id=id,
+            function=funct,
+            inputs=inputs,
+            outputs=outputs,
+            skippable=skippable,
+            priority=priority,
+            executor=executor,
+            pool=pool,
+            memoize=memoize,
+            timeout=timeout,
+            memory=memory,
+            **as_dict,
+        )
 
     def _update(self, as_dict, default_section=None):
         function = as_dict.pop(self._FUNCTION, None)
@@ -148,6 +264,24 @@ class TaskConfig(Section):
         if self._outputs is None and default_section:
             self._outputs = default_section._outputs
         self._skippable = as_dict.pop(self._IS_SKIPPABLE_KEY, self._skippable)
+        self._priority = as_dict.pop(self._PRIORITY_KEY, self._priority)
+        if self._priority is None and default_section:
+            self._priority = default_section._priority
+        self._executor = as_dict.pop(self._EXECUTOR_KEY, self._executor)
+        if self._executor is None and default_section:
+            self._executor = default_section._executor
+        self._pool = as_dict.pop(self._POOL_KEY, self._pool)
+        if self._pool is None and default_section:
+            self._pool = default_section._pool
+        self._memoize = as_dict.pop(self._MEMOIZE_KEY, self._memoize)
+        if self._memoize is None and default_section:
+            self._memoize = default_section._memoize
+        self._timeout = as_dict.pop(self._TIMEOUT_KEY, self._timeout)
+        if self._timeout is None and default_section:
+            self._timeout = default_section._timeout
+        self._memory = as_dict.pop(self._MEMORY_KEY, self._memory)
+        if self._memory is None and default_section:
+            self._memory = default_section._memory
         self._properties.update(as_dict)
         if default_section:
             self._properties = {**default_section.properties, **self._properties}
@@ -159,6 +293,12 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: Optional[bool] = False,
+        priority: Optional[int] = None,
+        executor: Optional[str] = None,
+        pool: Optional[str] = None,
+        memoize: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        memory: Optional[float] = None,
         **properties,
     ) -> "TaskConfig":
         """Configure a new task configuration.
@@ -175,12 +315,40 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            priority (Optional[int]): The priority of the jobs created from the task. Jobs with a
+                higher priority are dispatched first.<br/>
+                The default value is None, equivalent to a priority of 0.
+            executor (Optional[str]): The kind of executor the jobs created from the task run on in
+                *"standalone"* mode. Possible values are *"process"* for CPU-bound tasks or *"thread"*
+                for I/O-bound tasks.<br/>
+                The default value is None, equivalent to *"process"*.
+            pool (Optional[str]): The name of the worker pool, defined in the job configuration, the
+                jobs created from the task run in, in *"standalone"* mode.<br/>
+                The default value is None, meaning the pool of the *executor*.
+            memoize (Optional[bool]): If True, the results of the jobs created from the task are stored,
+                keyed by a fingerprint of the task function and of the input data. A job whose key is
+                already stored does not run the function: the stored results are copied to its output
+                data nodes instead. The fingerprint of the function covers its code and the source file of
+                its module, but not the other modules it calls, nor the values of global variables
+                modified at runtime.<br/>
+                The default value is None, equivalent to False.
+            timeout (Optional[float]): The maximum number of seconds the jobs created from the task can
+                run in *"standalone"* mode. A job still running after this delay is interrupted and
+                fails.<br/>
+                The default value is None, meaning no timeout.
+            memory (Optional[float]): The estimated peak memory, in megabytes, of the jobs created from
+                the task. In *"standalone"* mode, with a *memory_budget* set in the job configuration, a
+                job is only dispatched if its memory fits in the budget.<br/>
+                The default value is None, meaning the peak memory measured on the previous jobs of the
+                task.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
             The new task configuration.
         """
-        section = TaskConfig(id, function, input, output, skippable, **properties)
+        section = TaskConfig(
+            id, function, input, output, skippable, priority, executor, pool, memoize, timeout, memory, **properties
+        )
         Config._register(section)
         return Config.sections[TaskConfig.name][id]
 
@@ -190,6 +358,12 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: Optional[bool] = False,
+        priority: Optional[int] = None,
+        executor: Optional[str] = None,
+        pool: Optional[str] = None,
+        memoize: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        memory: Optional[float] = None,
         **properties,
     ) -> "TaskConfig":
         """Set the default values for task configurations.
@@ -209,11 +383,50 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            priority (Optional[int]): The priority of the jobs created from the task. Jobs with a
+                higher priority are dispatched first.<br/>
+                The default value is None, equivalent to a priority of 0.
+            executor (Optional[str]): The kind of executor the jobs created from the task run on in
+                *"standalone"* mode. Possible values are *"process"* for CPU-bound tasks or *"thread"*
+                for I/O-bound tasks.<br/>
+                The default value is None, equivalent to *"process"*.
+            pool (Optional[str]): The name of the worker pool, defined in the job configuration, the
+                jobs created from the task run in, in *"standalone"* mode.<br/>
+                The default value is None, meaning the pool of the *executor*.
+            memoize (Optional[bool]): If True, the results of the jobs created from the task are stored,
+                keyed by a fingerprint of the task function and of the input data. A job whose key is
+                already stored does not run the function: the stored results are copied to its output
+                data nodes instead. The fingerprint of the function covers its code and the source file of
+                its module, but not the other modules it calls, nor the values of global variables
+                modified at runtime.<br/>
+                The default value is None, equivalent to False.
+            timeout (Optional[float]): The maximum number of seconds the jobs created from the task can
+                run in *"standalone"* mode. A job still running after this delay is interrupted and
+                fails.<br/>
+                The default value is None, meaning no timeout.
+            memory (Optional[float]): The estimated peak memory, in megabytes, of the jobs created from
+                the task. In *"standalone"* mode, with a *memory_budget* set in the job configuration, a
+                job is only dispatched if its memory fits in the budget.<br/>
+                The default value is None, meaning the peak memory measured on the previous jobs of the
+                task.
             **properties (dict[str, any]): A keyworded variable length list of additional
                 arguments.
         Returns:
             The default task configuration.
         """
-        section = TaskConfig(_Config.DEFAULT_KEY, function, input, output, skippable, **properties)
+        section = TaskConfig(
+            _Config.DEFAULT_KEY,
+            function,
+            input,
+            output,
+            skippable,
+            priority,
+            executor,
+            pool,
+            memoize,
+            timeout,
+            memory,
+            **properties,
+        )
         Config._register(section)
         return Config.sections[TaskConfig.name][_Config.DEFAULT_KEY]
@@ -172,19 +172,19 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
         _replace_in_backup_file(old_file_path=tmp_old_path, new_file_path=self._path)
 
     def _read(self):
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_PANDAS:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_PANDAS:
             return self._read_as_pandas_dataframe()
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_MODIN:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_MODIN:
             return self._read_as_modin_dataframe()
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_NUMPY:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy()
         return self._read_as()
 
     def _read_as(self):
-        custom_class = self.properties[self.__EXPOSED_TYPE_PROPERTY]
-        with open(self._path, encoding=self.properties[self.__ENCODING_KEY]) as csvFile:
+        custom_class = self._get_property(self.__EXPOSED_TYPE_PROPERTY)
+        with open(self._path, encoding=self._get_property(self.__ENCODING_KEY)) as csvFile:
             res = list()
-            if self.properties[self.__HAS_HEADER_PROPERTY]:
+            if self._get_property(self.__HAS_HEADER_PROPERTY):
                 reader = csv.DictReader(csvFile)
                 for line in reader:
                     res.append(custom_class(**line))
@@ -203,16 +203,16 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
         self, usecols: Optional[List[int]] = None, column_names: Optional[List[str]] = None
     ) -> pd.DataFrame:
         try:
-            if self.properties[self.__HAS_HEADER_PROPERTY]:
+            if self._get_property(self.__HAS_HEADER_PROPERTY):
                 if column_names:
-                    return pd.read_csv(self._path, encoding=self.properties[self.__ENCODING_KEY])[column_names]
-                return pd.read_csv(self._path, encoding=self.properties[self.__ENCODING_KEY])
+                    return pd.read_csv(self._path, encoding=self._get_property(self.__ENCODING_KEY))[column_names]
+                return pd.read_csv(self._path, encoding=self._get_property(self.__ENCODING_KEY))
             else:
                 if usecols:
                     return pd.read_csv(
-                        self._path, encoding=self.properties[self.__ENCODING_KEY], header=None, usecols=usecols
+                        self._path, encoding=self._get_property(self.__ENCODING_KEY), header=None, usecols=usecols
                     )
-                return pd.read_csv(self._path, encoding=self.properties[self.__ENCODING_KEY], header=None)
+                return pd.read_csv(self._path, encoding=self._get_property(self.__ENCODING_KEY), header=None)
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
 
@@ -220,32 +220,34 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
         self, usecols: Optional[List[int]] = None, column_names: Optional[List[str]] = None
     ) -> modin_pd.DataFrame:
         try:
-            if self.properties[self.__HAS_HEADER_PROPERTY]:
+            if self._get_property(self.__HAS_HEADER_PROPERTY):
                 if column_names:
-                    return modin_pd.read_csv(self._path, encoding=self.properties[self.__ENCODING_KEY])[column_names]
-                return modin_pd.read_csv(self._path, encoding=self.properties[self.__ENCODING_KEY])
+                    return modin_pd.read_csv(self._path, encoding=self._get_property(self.__ENCODING_KEY))[column_names]
+                return modin_pd.read_csv(self._path, encoding=self._get_property(self.__ENCODING_KEY))
             else:
                 if usecols:
                     return modin_pd.read_csv(
-                        self._path, header=None, usecols=usecols, encoding=self.properties[self.__ENCODING_KEY]
+                        self._path, header=None, usecols=usecols, encoding=self._get_property(self.__ENCODING_KEY)
                     )
-                return modin_pd.read_csv(self._path, header=None, encoding=self.properties[self.__ENCODING_KEY])
+                return modin_pd.read_csv(self._path, header=None, encoding=self._get_property(self.__ENCODING_KEY))
         except pd.errors.EmptyDataError:
             return modin_pd.DataFrame()
 
     def _append(self, data: Any):
         if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)):
-            data.to_csv(self._path, mode="a", index=False, encoding=self.properties[self.__ENCODING_KEY], header=False)
+            data.to_csv(
+                self._path, mode="a", index=False, encoding=self._get_property(self.__ENCODING_KEY), header=False
+            )
         else:
             pd.DataFrame(data).to_csv(
-                self._path, mode="a", index=False, encoding=self.properties[self.__ENCODING_KEY], header=False
+                self._path, mode="a", index=False, encoding=self._get_property(self.__ENCODING_KEY), header=False
             )
 
     def _write(self, data: Any):
         if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)):
-            data.to_csv(self._path, index=False, encoding=self.properties[self.__ENCODING_KEY])
+            data.to_csv(self._path, index=False, encoding=self._get_property(self.__ENCODING_KEY))
         else:
-            pd.DataFrame(data).to_csv(self._path, index=False, encoding=self.properties[self.__ENCODING_KEY])
+            pd.DataFrame(data).to_csv(self._path, index=False, encoding=self._get_property(self.__ENCODING_KEY))
 
     def write_with_column_names(self, data: Any, columns: Optional[List[str]] = None, job_id: Optional[JobId] = None):
         """Write a selection of columns.
@@ -259,5 +261,5 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
             df = pd.DataFrame(data)
         else:
             df = pd.DataFrame(data, columns=columns)
-        df.to_csv(self._path, index=False, encoding=self.properties[self.__ENCODING_KEY])
+        df.to_csv(self._path, index=False, encoding=self._get_property(self.__ENCODING_KEY))
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
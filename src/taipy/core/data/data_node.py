@@ -259,6 +259,14 @@ class DataNode(_Entity, _Labeled):
         self._properties = _Reloader()._reload(self._MANAGER_NAME, self)._properties
         return self._properties
 
+    def _get_property(self, key: str, default: Any = None) -> Any:
+        """Get the value of a property without reloading the data node.
+
+        This accessor is meant for the read and write implementations of the data nodes, where
+        the entity is already up-to-date and properties are accessed many times.
+        """
+        return self._properties.get(key, default)
+
     def _get_user_properties(self) -> Dict[str, Any]:
         """Get user properties."""
         return {key: value for key, value in self.properties.items() if key not in self._TAIPY_PROPERTIES}
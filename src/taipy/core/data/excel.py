@@ -188,11 +188,11 @@ class ExcelDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
                 _AbstractTabularDataNode._check_exposed_type(t, valid_string_exposed_types)
 
     def _read(self):
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_PANDAS:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_PANDAS:
             return self._read_as_pandas_dataframe()
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_MODIN:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_MODIN:
             return self._read_as_modin_dataframe()
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_NUMPY:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy()
         return self._read_as()
 
@@ -207,20 +207,20 @@ class ExcelDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
 
     def _read_as(self):
         excel_file = load_workbook(self._path)
-        exposed_type = self.properties[self.__EXPOSED_TYPE_PROPERTY]
+        exposed_type = self._get_property(self.__EXPOSED_TYPE_PROPERTY)
         work_books = defaultdict()
         sheet_names = excel_file.sheetnames
-        provided_sheet_names = self.__sheet_name_to_list(self.properties)
+        provided_sheet_names = self.__sheet_name_to_list(self._properties)
 
         for sheet_name in provided_sheet_names:
             if sheet_name not in sheet_names:
                 raise NonExistingExcelSheet(sheet_name, self._path)
 
         if isinstance(exposed_type, List):
-            if len(provided_sheet_names) != len(self.properties[self.__EXPOSED_TYPE_PROPERTY]):
+            if len(provided_sheet_names) != len(self._get_property(self.__EXPOSED_TYPE_PROPERTY)):
                 raise ExposedTypeLengthMismatch(
                     f"Expected {len(provided_sheet_names)} exposed types, got "
-                    f"{len(self.properties[self.__EXPOSED_TYPE_PROPERTY])}"
+                    f"{len(self._get_property(self.__EXPOSED_TYPE_PROPERTY))}"
                 )
 
         for i, sheet_name in enumerate(provided_sheet_names):
@@ -243,7 +243,7 @@ class ExcelDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
             res = list()
             for row in work_sheet.rows:
                 res.append([col.value for col in row])
-            if self.properties[self.__HAS_HEADER_PROPERTY] and res:
+            if self._get_property(self.__HAS_HEADER_PROPERTY) and res:
                 header = res.pop(0)
                 for i, row in enumerate(res):
                     res[i] = sheet_exposed_type(**dict([[h, r] for h, r in zip(header, row)]))
@@ -283,8 +283,8 @@ class ExcelDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
     def __get_sheet_names_and_header(self, sheet_names):
         kwargs: Dict[str, Any] = {}
         if sheet_names is None:
-            sheet_names = self.properties[self.__SHEET_NAME_PROPERTY]
-        if not self.properties[self.__HAS_HEADER_PROPERTY]:
+            sheet_names = self._get_property(self.__SHEET_NAME_PROPERTY)
+        if not self._get_property(self.__HAS_HEADER_PROPERTY):
             kwargs["header"] = None
         return sheet_names, kwargs
 
@@ -312,7 +312,7 @@ class ExcelDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
             return modin_pd.DataFrame()
 
     def __append_excel_with_single_sheet(self, append_excel_fct, *args, **kwargs):
-        sheet_name = self.properties.get(self.__SHEET_NAME_PROPERTY)
+        sheet_name = self._get_property(self.__SHEET_NAME_PROPERTY)
 
         with pd.ExcelWriter(self._path, mode="a", engine="openpyxl", if_sheet_exists="overlay") as writer:
             if sheet_name:
@@ -352,7 +352,7 @@ class ExcelDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
             self.__append_excel_with_single_sheet(pd.DataFrame(data).to_excel, index=False, header=False)
 
     def __write_excel_with_single_sheet(self, write_excel_fct, *args, **kwargs):
-        sheet_name = self.properties.get(self.__SHEET_NAME_PROPERTY)
+        sheet_name = self._get_property(self.__SHEET_NAME_PROPERTY)
         if sheet_name:
             if not isinstance(sheet_name, str):
                 if len(sheet_name) > 1:
@@ -180,11 +180,11 @@ class JSONDataNode(DataNode, _AbstractFileDataNode):
         self.properties[self._DECODER_KEY] = decoder
 
     def _read(self):
-        with open(self._path, "r", encoding=self.properties[self.__ENCODING_KEY]) as f:
+        with open(self._path, "r", encoding=self._get_property(self.__ENCODING_KEY)) as f:
             return json.load(f, cls=self._decoder)
 
     def _append(self, data: Any):
-        with open(self._path, "r+", encoding=self.properties[self.__ENCODING_KEY]) as f:
+        with open(self._path, "r+", encoding=self._get_property(self.__ENCODING_KEY)) as f:
             file_data = json.load(f, cls=self._decoder)
             if isinstance(file_data, List):
                 if isinstance(data, List):
@@ -198,7 +198,7 @@ class JSONDataNode(DataNode, _AbstractFileDataNode):
             json.dump(file_data, f, indent=4, cls=self._encoder)
 
     def _write(self, data: Any):
-        with open(self._path, "w", encoding=self.properties[self.__ENCODING_KEY]) as f:  # type: ignore
+        with open(self._path, "w", encoding=self._get_property(self.__ENCODING_KEY)) as f:  # type: ignore
             json.dump(data, f, indent=4, cls=self._encoder)
 
 
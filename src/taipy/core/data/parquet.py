@@ -214,7 +214,7 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
         return self.read_with_kwargs()
 
     def _read_as(self, read_kwargs: Dict):
-        custom_class = self.properties[self.__EXPOSED_TYPE_PROPERTY]
+        custom_class = self._get_property(self.__EXPOSED_TYPE_PROPERTY)
         list_of_dicts = self._read_as_pandas_dataframe(read_kwargs).to_dict(orient="records")
         return [custom_class(**dct) for dct in list_of_dicts]
 
@@ -245,10 +245,10 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
                 `pandas.DataFrame.to_parquet()`.
         """
         kwargs = {
-            self.__ENGINE_PROPERTY: self.properties[self.__ENGINE_PROPERTY],
-            self.__COMPRESSION_PROPERTY: self.properties[self.__COMPRESSION_PROPERTY],
+            self.__ENGINE_PROPERTY: self._get_property(self.__ENGINE_PROPERTY),
+            self.__COMPRESSION_PROPERTY: self._get_property(self.__COMPRESSION_PROPERTY),
         }
-        kwargs.update(self.properties[self.__WRITE_KWARGS_PROPERTY])
+        kwargs.update(self._get_property(self.__WRITE_KWARGS_PROPERTY))
         kwargs.update(write_kwargs)
         if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)):
             data.to_parquet(self._path, **kwargs)
@@ -272,18 +272,18 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
             )
             return None
 
-        kwargs = self.properties[self.__READ_KWARGS_PROPERTY]
+        kwargs = self._get_property(self.__READ_KWARGS_PROPERTY)
         kwargs.update(
             {
-                self.__ENGINE_PROPERTY: self.properties[self.__ENGINE_PROPERTY],
+                self.__ENGINE_PROPERTY: self._get_property(self.__ENGINE_PROPERTY),
             }
         )
         kwargs.update(read_kwargs)
 
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_PANDAS:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_PANDAS:
             return self._read_as_pandas_dataframe(kwargs)
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_MODIN:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_MODIN:
             return self._read_as_modin_dataframe(kwargs)
-        if self.properties[self.__EXPOSED_TYPE_PROPERTY] == self.__EXPOSED_TYPE_NUMPY:
+        if self._get_property(self.__EXPOSED_TYPE_PROPERTY) == self.__EXPOSED_TYPE_NUMPY:
             return self._read_as_numpy(kwargs)
         return self._read_as(kwargs)
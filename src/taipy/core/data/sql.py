@@ -128,17 +128,17 @@ class SQLDataNode(_AbstractSQLDataNode):
         return cls.__STORAGE_TYPE
 
     def _get_base_read_query(self) -> str:
-        return self.properties.get(self.__READ_QUERY_KEY)
+        return self._get_property(self.__READ_QUERY_KEY)
 
     def _do_append(self, data, engine, connection) -> None:
-        if not self.properties.get(self._APPEND_QUERY_BUILDER_KEY):
+        if not self._get_property(self._APPEND_QUERY_BUILDER_KEY):
             raise MissingAppendQueryBuilder
 
-        queries = self.properties.get(self._APPEND_QUERY_BUILDER_KEY)(data)
+        queries = self._get_property(self._APPEND_QUERY_BUILDER_KEY)(data)
         self.__execute_queries(queries, connection)
 
     def _do_write(self, data, engine, connection) -> None:
-        queries = self.properties.get(self._WRITE_QUERY_BUILDER_KEY)(data)
+        queries = self._get_property(self._WRITE_QUERY_BUILDER_KEY)(data)
         self.__execute_queries(queries, connection)
 
     def __execute_queries(self, queries, connection) -> None:
@@ -114,7 +114,7 @@ class SQLTableDataNode(_AbstractSQLDataNode):
         return cls.__STORAGE_TYPE
 
     def _get_base_read_query(self) -> str:
-        return f"SELECT * FROM {self.properties[self.__TABLE_KEY]}"
+        return f"SELECT * FROM {self._get_property(self.__TABLE_KEY)}"
 
     def _do_append(self, data, engine, connection) -> None:
         self.__insert_data(data, engine, connection)
@@ -156,7 +156,7 @@ class SQLTableDataNode(_AbstractSQLDataNode):
 
     def _create_table(self, engine) -> Table:
         return Table(
-            self.properties[self.__TABLE_KEY],
+            self._get_property(self.__TABLE_KEY),
             MetaData(),
             autoload_with=engine,
         )
@@ -240,6 +240,13 @@ class NonExistingScenarioConfig(Exception):
         self.message = f"Scenario config: {scenario_config_id} does not exist."
 
 
+class InvalidSubmissionTarget(Exception):
+    """Raised if a submission target is not a data node of the submitted scenario or sequence."""
+
+    def __init__(self, target: str, submittable_id: str):
+        self.message = f"Submission target: {target} is not a data node of {submittable_id}."
+
+
 class InvalidSscenario(Exception):
     """Raised if a Scenario is not a Directed Acyclic Graph."""
 
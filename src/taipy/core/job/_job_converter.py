@@ -17,7 +17,7 @@ from ..common._utils import _fcts_to_dict, _load_fct
 from ..exceptions import InvalidSubscriber
 from ..job._job_model import _JobModel
 from ..job.job import Job
-from ..task._task_manager_factory import _TaskManagerFactory
+from ..task.task_id import TaskId
 
 
 class _JobConverter(_AbstractConverter):
@@ -25,7 +25,7 @@ class _JobConverter(_AbstractConverter):
     def _entity_to_model(cls, job: Job) -> _JobModel:
         return _JobModel(
             job.id,
-            job._task.id,
+            job._get_task_id(),
             job._status,
             job._force,
             job.submit_id,
@@ -38,12 +38,11 @@ class _JobConverter(_AbstractConverter):
 
     @classmethod
     def _model_to_entity(cls, model: _JobModel) -> Job:
-        task_manager = _TaskManagerFactory._build_manager()
-        task_repository = task_manager._repository
-
+        # The task is loaded lazily, on first access to `Job.task`, so that loading many jobs costs no round trip
+        # to the task repository. A missing task raises `ModelNotFound` then.
         job = Job(
             id=model.id,
-            task=task_repository._load(model.task_id),
+            task=TaskId(model.task_id),
             submit_id=model.submit_id,
             submit_entity_id=model.submit_entity_id,
             version=model.version,
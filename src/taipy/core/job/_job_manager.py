@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import uuid
-from typing import Callable, Iterable, List, Optional, Union
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
@@ -55,6 +55,38 @@ class _JobManager(_Manager[Job], _VersionMixin):
         job._on_status_change(*callbacks)
         return job
 
+    @classmethod
+    def _bulk_create(
+        cls, jobs_to_create: Iterable[Tuple[Task, Iterable[Callable], str, str]], force=False
+    ) -> List[Job]:
+        """Create the jobs of several tasks and save them at once.
+
+        Parameters:
+            jobs_to_create: For each job, its task, its status change callbacks, its submission id and the id of
+                its submitted entity.
+            force (bool): Enforce the execution of the jobs even if their tasks are skippable.
+        """
+        version = _VersionManagerFactory._build_manager()._get_latest_version()
+        jobs_and_callbacks = [
+            (
+                Job(
+                    id=JobId(f"{Job._ID_PREFIX}_{task.config_id}_{uuid.uuid4()}"),
+                    task=task,
+                    submit_id=submit_id,
+                    submit_entity_id=submit_entity_id,
+                    force=force,
+                    version=version,
+                ),
+                callbacks,
+            )
+            for task, callbacks, submit_id, submit_entity_id in jobs_to_create
+        ]
+        cls._set_many(job for job, _ in jobs_and_callbacks)
+        for job, callbacks in jobs_and_callbacks:
+            Notifier.publish(_make_event(job, EventOperation.CREATION))
+            job._on_status_change(*callbacks)
+        return [job for job, _ in jobs_and_callbacks]
+
     @classmethod
     def _delete(cls, job: Job, force=False):
         if job.is_finished() or force:
@@ -75,6 +107,14 @@ class _JobManager(_Manager[Job], _VersionMixin):
 
         _OrchestratorFactory._build_orchestrator().cancel_job(job)
 
+    @classmethod
+    def _wait(cls, jobs: Iterable[Union[str, Job]], timeout: Optional[Union[float, int]] = None) -> bool:
+        jobs = [cls._get(job) if isinstance(job, str) else job for job in jobs]
+
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        return _OrchestratorFactory._build_orchestrator().wait_jobs(jobs, timeout=timeout)
+
     @classmethod
     def _get_latest(cls, task: Task) -> Optional[Job]:
         jobs_of_task = list(filter(lambda job: task in job, cls._get_all()))
@@ -13,17 +13,19 @@ __all__ = ["Job"]
 
 import traceback
 from datetime import datetime
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
 from taipy.logger._taipy_logger import _TaipyLogger
 
 from .._entity._entity import _Entity
 from .._entity._labeled import _Labeled
-from .._entity._reload import _self_reload, _self_setter
+from .._entity._reload import _Reloader, _self_reload, _self_setter
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._utils import _fcts_to_dict
+from ..exceptions.exceptions import ModelNotFound
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..task.task import Task
+from ..task.task_id import TaskId
 from .job_id import JobId
 from .status import Status
 
@@ -45,7 +47,8 @@ class Job(_Entity, _Labeled):
 
     Attributes:
         id (str): The identifier of this job.
-        task (Task^): The task of this job.
+        task (Union[Task^, TaskId]): The task of this job. When a task identifier is provided,
+            the task is only loaded when first accessed.
         force (bool): Enforce the job's execution whatever the output data nodes are in cache or
             not.
         status (Status^): The current status of this job.
@@ -57,10 +60,36 @@ class Job(_Entity, _Labeled):
 
     _MANAGER_NAME = "job"
     _ID_PREFIX = "JOB"
+    __logger = _TaipyLogger._get_logger()
+
+    # Jobs are by far the most numerous entities, hence the compact slotted representation. Their task is
+    # resolved lazily so that loading jobs does not load the tasks and data nodes they refer to.
+    __slots__ = (
+        "id",
+        "_task",
+        "_force",
+        "_status",
+        "_creation_date",
+        "_submit_id",
+        "_submit_entity_id",
+        "_subscribers",
+        "_stacktrace",
+        "_version",
+        "_is_in_context",
+        "_in_context_attributes_changed_collector",
+    )
 
-    def __init__(self, id: JobId, task: Task, submit_id: str, submit_entity_id: str, force=False, version=None):
+    def __init__(
+        self,
+        id: JobId,
+        task: Union[Task, TaskId],
+        submit_id: str,
+        submit_entity_id: str,
+        force=False,
+        version=None,
+    ):
         self.id = id
-        self._task = task
+        self._task: Union[Task, TaskId] = task
         self._force = force
         self._status = Status.SUBMITTED
         self._creation_date = datetime.now()
@@ -68,16 +97,22 @@ class Job(_Entity, _Labeled):
         self._submit_entity_id: str = submit_entity_id
         self._subscribers: List[Callable] = []
         self._stacktrace: List[str] = []
-        self.__logger = _TaipyLogger._get_logger()
         self._version = version or _VersionManagerFactory._build_manager()._get_latest_version()
+        self._is_in_context = False
 
     def get_event_context(self):
-        return {"task_config_id": self._task.config_id}
+        return {"task_config_id": self._get_task().config_id}
 
     @property  # type: ignore
-    @_self_reload(_MANAGER_NAME)
     def task(self):
-        return self._task
+        job = _Reloader()._reload(self._MANAGER_NAME, self)
+        try:
+            return job._get_task()
+        except ModelNotFound:
+            # The task of the job is not saved, the in-memory task is used as is.
+            if job is not self and job._get_task_id() == self._get_task_id():
+                return self._get_task()
+            raise
 
     @task.setter  # type: ignore
     @_self_setter(_MANAGER_NAME)
@@ -86,7 +121,19 @@ class Job(_Entity, _Labeled):
 
     @property
     def owner_id(self) -> str:
-        return self.task.id
+        return self._get_task_id()
+
+    def _get_task(self) -> Task:
+        if isinstance(self._task, str):
+            from ..task._task_manager_factory import _TaskManagerFactory
+
+            # Loaded from the repository rather than through the manager, so that a missing task raises
+            # `ModelNotFound` instead of being silently replaced by None.
+            self._task = _TaskManagerFactory._build_manager()._repository._load(self._task)
+        return self._task  # type: ignore
+
+    def _get_task_id(self) -> TaskId:
+        return self._task if isinstance(self._task, str) else self._task.id  # type: ignore
 
     @property  # type: ignore
     @_self_reload(_MANAGER_NAME)
@@ -132,7 +179,8 @@ class Job(_Entity, _Labeled):
     def creation_date(self, val):
         self._creation_date = val
 
-    @property
+    @property  # type: ignore
+    @_self_reload(_MANAGER_NAME)
     def stacktrace(self) -> List[str]:
         return self._stacktrace
 
@@ -141,7 +189,7 @@ class Job(_Entity, _Labeled):
         return self._version
 
     def __contains__(self, task: Task):
-        return self.task.id == task.id
+        return self._get_task_id() == task.id
 
     def __lt__(self, other):
         return self.creation_date.timestamp() < other.creation_date.timestamp()
@@ -286,6 +334,19 @@ class Job(_Entity, _Labeled):
         """
         return self._status in [Status.COMPLETED, Status.FAILED, Status.CANCELED, Status.SKIPPED, Status.ABANDONED]
 
+    def wait(self, timeout: Optional[Union[float, int]] = None) -> bool:
+        """Wait for the job to be finished.
+
+        Parameters:
+            timeout (Optional[Union[float, int]]): The maximum number of seconds to wait for the job.
+                If not provided, wait until the job is finished.
+        Returns:
+            True if the job is finished, False if the timeout expired before.
+        """
+        from ._job_manager_factory import _JobManagerFactory
+
+        return _JobManagerFactory._build_manager()._wait([self], timeout=timeout)
+
     def _on_status_change(self, *functions):
         """Get a notification when the status of the job changes.
 
@@ -366,7 +427,7 @@ def _make_event_for_job(
     attribute_value: Optional[Any] = None,
     **kwargs,
 ) -> Event:
-    metadata = {"creation_date": job.creation_date, "task_config_id": job._task.config_id}
+    metadata = {"creation_date": job.creation_date, "task_config_id": job._get_task().config_id}
     return Event(
         entity_type=EventEntityType.JOB,
         entity_id=job.id,
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import singledispatch
@@ -51,6 +52,8 @@ class EventEntityType(_ReprEnum):
 
 _NO_ATTRIBUTE_NAME_OPERATIONS = set([EventOperation.CREATION, EventOperation.DELETION, EventOperation.SUBMISSION])
 _UNSUBMITTABLE_ENTITY_TYPES = (EventEntityType.CYCLE, EventEntityType.DATA_NODE, EventEntityType.JOB)
+# Events are created on every entity mutation. Slotted dataclasses reduce their footprint where supported.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 11) else {}
 _ENTITY_TO_EVENT_ENTITY_TYPE = {
     "scenario": EventEntityType.SCENARIO,
     "sequence": EventEntityType.SEQUENCE,
@@ -62,7 +65,7 @@ _ENTITY_TO_EVENT_ENTITY_TYPE = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Event:
     """Event object used to notify any change in the Core service.
 
@@ -93,7 +96,7 @@ class Event:
 
     def __post_init__(self):
         # Creation date
-        super().__setattr__("creation_date", datetime.now())
+        object.__setattr__(self, "creation_date", datetime.now())
 
         # Check operation:
         if self.entity_type in _UNSUBMITTABLE_ENTITY_TYPES and self.operation == EventOperation.SUBMISSION:
@@ -24,6 +24,7 @@ from ..config.scenario_config import ScenarioConfig
 from ..cycle._cycle_manager_factory import _CycleManagerFactory
 from ..cycle.cycle import Cycle
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data.data_node import DataNode
 from ..exceptions.exceptions import (
     DeletingPrimaryScenario,
     DifferentScenarioConfigs,
@@ -205,6 +206,10 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
         check_inputs_are_ready: bool = True,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+        targets: Optional[List[Union[DataNode, str]]] = None,
+        stale_only: bool = False,
     ) -> List[Job]:
         scenario_id = scenario.id if isinstance(scenario, Scenario) else scenario
         scenario = cls._get(scenario_id)
@@ -218,7 +223,17 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         jobs = (
             _TaskManagerFactory._build_manager()
             ._orchestrator()
-            .submit(scenario, callbacks=scenario_subscription_callback, force=force, wait=wait, timeout=timeout)
+            .submit(
+                scenario,
+                callbacks=scenario_subscription_callback,
+                force=force,
+                wait=wait,
+                timeout=timeout,
+                priority=priority,
+                user=user,
+                targets=targets,
+                stale_only=stale_only,
+            )
         )
         Notifier.publish(_make_event(scenario, EventOperation.SUBMISSION))
         return jobs
@@ -486,10 +486,14 @@ class Scenario(_Entity, Submittable, _Labeled):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+        targets: Optional[List[Union[DataNode, str]]] = None,
     ) -> List[Job]:
         """Submit this scenario for execution.
 
-        All the `Task^`s of the scenario will be submitted for execution.
+        All the `Task^`s of the scenario, or only the tasks the *targets* depend on, will be submitted for
+        execution.
 
         Parameters:
             callbacks (List[Callable]): The list of callable functions to be called on status
@@ -499,13 +503,59 @@ class Scenario(_Entity, Submittable, _Labeled):
                 asynchronous mode.
             timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be finished
                 before returning.
+            priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are
+                dispatched first. The default value is 0.
+            user (Optional[str]): The user the submission is made for. With the *"fair_share"* scheduling policy, the
+                submissions of a user share the workers with the other users and submissions, in proportion to the
+                weight of the user. The default value is None, meaning that each submission has its own share.
+            targets (Optional[List[Union[DataNode^, str]]]): The data nodes, data node ids or data node config
+                ids to compute. If given, only the tasks of the scenario these data nodes depend on are submitted,
+                like the targets of a makefile. The skippable tasks among them are still skipped if their
+                outputs are up to date. The default value is None, meaning all the tasks of the scenario.
 
         Returns:
             A list of created `Job^`s.
         """
         from ._scenario_manager_factory import _ScenarioManagerFactory
 
-        return _ScenarioManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout)
+        return _ScenarioManagerFactory._build_manager()._submit(
+            self, callbacks, force, wait, timeout, priority=priority, user=user, targets=targets
+        )
+
+    def resubmit_stale(
+        self,
+        callbacks: Optional[List[Callable]] = None,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+    ) -> List[Job]:
+        """Submit the stale tasks of this scenario for execution.
+
+        Only the `Task^`s returned by `get_stale_tasks()^`, whose outputs are not up to date with their inputs,
+        will be submitted for execution. The other tasks of the scenario are not run again.
+
+        Parameters:
+            callbacks (List[Callable]): The list of callable functions to be called on status
+                change.
+            wait (bool): Wait for the orchestrated jobs created from the scenario submission to be finished in
+                asynchronous mode.
+            timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be finished
+                before returning.
+            priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are
+                dispatched first. The default value is 0.
+            user (Optional[str]): The user the submission is made for. With the *"fair_share"* scheduling policy, the
+                submissions of a user share the workers with the other users and submissions, in proportion to the
+                weight of the user. The default value is None, meaning that each submission has its own share.
+
+        Returns:
+            A list of created `Job^`s.
+        """
+        from ._scenario_manager_factory import _ScenarioManagerFactory
+
+        return _ScenarioManagerFactory._build_manager()._submit(
+            self, callbacks, wait=wait, timeout=timeout, priority=priority, user=user, stale_only=True
+        )
 
     def export(
         self,
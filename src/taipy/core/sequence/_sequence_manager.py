@@ -19,6 +19,7 @@ from .._manager._manager import _Manager
 from .._version._version_mixin import _VersionMixin
 from ..common._utils import _Subscriber
 from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
+from ..data.data_node import DataNode
 from ..exceptions.exceptions import (
     InvalidSequenceId,
     ModelNotFound,
@@ -309,6 +310,10 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
         check_inputs_are_ready: bool = True,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+        targets: Optional[List[Union[DataNode, str]]] = None,
+        stale_only: bool = False,
     ) -> List[Job]:
         sequence_id = sequence.id if isinstance(sequence, Sequence) else sequence
         sequence = cls._get(sequence_id)
@@ -322,7 +327,17 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
         jobs = (
             _TaskManagerFactory._build_manager()
             ._orchestrator()
-            .submit(sequence, callbacks=sequence_subscription_callback, force=force, wait=wait, timeout=timeout)
+            .submit(
+                sequence,
+                callbacks=sequence_subscription_callback,
+                force=force,
+                wait=wait,
+                timeout=timeout,
+                priority=priority,
+                user=user,
+                targets=targets,
+                stale_only=stale_only,
+            )
         )
         Notifier.publish(_make_event(sequence, EventOperation.SUBMISSION))
         return jobs
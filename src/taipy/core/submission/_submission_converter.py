@@ -28,6 +28,8 @@ class _SubmissionConverter(_AbstractConverter):
             creation_date=submission._creation_date.isoformat(),
             submission_status=submission._submission_status,
             version=submission._version,
+            priority=submission._priority,
+            user=submission._user,
         )
 
     @classmethod
@@ -39,5 +41,7 @@ class _SubmissionConverter(_AbstractConverter):
             creation_date=datetime.fromisoformat(model.creation_date),
             submission_status=model.submission_status,
             version=model.version,
+            priority=model.priority,
+            user=model.user,
         )
         return submission
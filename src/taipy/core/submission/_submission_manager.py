@@ -9,15 +9,18 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import List, Optional, Union
+from functools import partial
+from typing import Iterable, List, Optional, Union
 
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
 from .._version._version_mixin import _VersionMixin
+from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
 from ..notification import EventEntityType, EventOperation, Notifier, _make_event
 from ..scenario.scenario import Scenario
 from ..sequence.sequence import Sequence
 from ..submission.submission import Submission
+from ..submission.submission_batch import SubmissionBatch
 from ..task.task import Task
 
 
@@ -38,14 +41,60 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
     def _create(
         cls,
         entity_id: str,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ) -> Submission:
-        submission = Submission(entity_id=entity_id)
+        submission = Submission(entity_id=entity_id, priority=priority, user=user)
         cls._set(submission)
 
         Notifier.publish(_make_event(submission, EventOperation.CREATION))
 
         return submission
 
+    @classmethod
+    def _bulk_create(
+        cls, entity_ids: Iterable[str], priority: Optional[int] = None, user: Optional[str] = None
+    ) -> List[Submission]:
+        submissions = [Submission(entity_id=entity_id, priority=priority, user=user) for entity_id in entity_ids]
+        cls._set_many(submissions)
+
+        for submission in submissions:
+            Notifier.publish(_make_event(submission, EventOperation.CREATION))
+
+        return submissions
+
+    @classmethod
+    def _submit_many(
+        cls,
+        entities: Iterable[Union[Scenario, Sequence, Task]],
+        force: bool = False,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        check_inputs_are_ready: bool = True,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
+    ) -> SubmissionBatch:
+        from ..task._task_manager_factory import _TaskManagerFactory
+
+        entities = list(entities)
+        callbacks = []
+        for entity in entities:
+            if check_inputs_are_ready:
+                _warn_if_inputs_not_ready(entity.input.values() if isinstance(entity, Task) else entity.get_inputs())
+            subscribers = [] if isinstance(entity, Task) else entity.subscribers
+            callbacks.append([partial(c.callback, *c.params, entity) for c in subscribers])
+
+        submission_batch = (
+            _TaskManagerFactory._build_manager()
+            ._orchestrator()
+            .submit_many(
+                entities, callbacks=callbacks, force=force, wait=wait, timeout=timeout, priority=priority, user=user
+            )
+        )
+        for entity in entities:
+            Notifier.publish(_make_event(entity, EventOperation.SUBMISSION))
+        return submission_batch
+
     @classmethod
     def _get_latest(cls, entity: Union[Scenario, Sequence, Task]) -> Optional[Submission]:
         entity_id = entity.id if not isinstance(entity, str) else entity
@@ -10,9 +10,9 @@
 # specific language governing permissions and limitations under the License.
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
-from sqlalchemy import JSON, Column, Enum, String, Table
+from sqlalchemy import JSON, Column, Enum, Integer, String, Table
 
 from .._repository._base_taipy_model import _BaseModel
 from .._repository.db._sql_base_model import mapper_registry
@@ -32,6 +32,8 @@ class _SubmissionModel(_BaseModel):
         Column("creation_date", String),
         Column("submission_status", Enum(SubmissionStatus)),
         Column("version", String),
+        Column("priority", Integer),
+        Column("user", String),
     )
     id: str
     entity_id: str
@@ -39,6 +41,8 @@ class _SubmissionModel(_BaseModel):
     creation_date: str
     submission_status: SubmissionStatus
     version: str
+    priority: int
+    user: Optional[str]
 
     @staticmethod
     def from_dict(data: Dict[str, Any]):
@@ -49,6 +53,8 @@ class _SubmissionModel(_BaseModel):
             creation_date=data["creation_date"],
             submission_status=SubmissionStatus._from_repr(data["submission_status"]),
             version=data["version"],
+            priority=data.get("priority") or 0,
+            user=data.get("user"),
         )
 
     def to_list(self):
@@ -59,4 +65,6 @@ class _SubmissionModel(_BaseModel):
             self.creation_date,
             repr(self.submission_status),
             self.version,
+            self.priority,
+            self.user,
         ]
@@ -0,0 +1,83 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Iterator, List
+
+from ..task.task import Task
+
+
+class PlannedTask:
+    """Estimated execution of a task in an `ExecutionPlan^`.
+
+    Attributes:
+        task (Task^): The task.
+        start (float): The estimated number of seconds between the submission and the start of the task.
+        end (float): The estimated number of seconds between the submission and the end of the task.
+        skipped (bool): True if the task would be skipped, its outputs being up to date.
+        critical (bool): True if the task is on the critical path of the submission.
+    """
+
+    __slots__ = ("task", "start", "end", "skipped", "critical")
+
+    def __init__(self, task: Task, start: float, end: float, skipped: bool = False, critical: bool = False):
+        self.task = task
+        self.start = start
+        self.end = end
+        self.skipped = skipped
+        self.critical = critical
+
+    @property
+    def duration(self) -> float:
+        """The estimated duration of the task in seconds, 0 if the task would be skipped."""
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return (
+            f"PlannedTask({self.task.config_id}, start={self.start:.3f}, end={self.end:.3f}, skipped={self.skipped},"
+            f" critical={self.critical})"
+        )
+
+
+class ExecutionPlan:
+    """Estimated schedule of the submission of a scenario or a sequence, returned by `taipy.plan()^`.
+
+    The durations of the tasks are estimated from the durations of the jobs of their task configuration completed
+    by the application. The tasks are scheduled on the workers of their pool by decreasing duration of the longest
+    path of tasks they start, which is the order the jobs are dispatched in when `JobConfig^`.scheduling_policy is
+    *"critical_path"*.
+
+    Attributes:
+        planned_tasks (List[PlannedTask^]): The planned tasks, in the order of their estimated start.
+    """
+
+    def __init__(self, planned_tasks: List[PlannedTask]):
+        self.planned_tasks = planned_tasks
+
+    @property
+    def makespan(self) -> float:
+        """The estimated number of seconds between the submission and the end of its last task."""
+        return max((planned_task.end for planned_task in self.planned_tasks), default=0.0)
+
+    @property
+    def skipped_tasks(self) -> List[Task]:
+        """The tasks that would be skipped, their outputs being up to date."""
+        return [planned_task.task for planned_task in self.planned_tasks if planned_task.skipped]
+
+    @property
+    def critical_path(self) -> List[Task]:
+        """The tasks of the longest path of tasks of the submission, in execution order."""
+        return [planned_task.task for planned_task in self.planned_tasks if planned_task.critical]
+
+    def __iter__(self) -> Iterator[PlannedTask]:
+        return iter(self.planned_tasks)
+
+    def __len__(self) -> int:
+        return len(self.planned_tasks)
@@ -35,6 +35,9 @@ class Submission(_Entity, _Labeled):
         submission_status (Optional[SubmissionStatus]): The current status of this submission.
         version (Optional[str]): The string indicates the application version of the submission to instantiate.
             If not provided, the latest version is used.
+        priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are dispatched
+            first. The default value is 0.
+        user (Optional[str]): The user the submission was made for, if any. The default value is None.
     """
 
     _ID_PREFIX = "SUBMISSION"
@@ -49,6 +52,8 @@ class Submission(_Entity, _Labeled):
         creation_date: Optional[datetime] = None,
         submission_status: Optional[SubmissionStatus] = None,
         version: Optional[str] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ):
         self._entity_id = entity_id
         self.id = id or self.__new_id()
@@ -56,6 +61,8 @@ class Submission(_Entity, _Labeled):
         self._creation_date = creation_date or datetime.now()
         self._submission_status = submission_status or SubmissionStatus.SUBMITTED
         self._version = version or _VersionManagerFactory._build_manager()._get_latest_version()
+        self._priority = priority or 0
+        self._user = user
 
     @staticmethod
     def __new_id() -> str:
@@ -70,6 +77,14 @@ class Submission(_Entity, _Labeled):
     def creation_date(self):
         return self._creation_date
 
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def user(self) -> Optional[str]:
+        return self._user
+
     def get_label(self) -> str:
         """Returns the submission simple label prefixed by its owner label.
 
@@ -102,6 +117,17 @@ class Submission(_Entity, _Labeled):
     def jobs(self, jobs: Union[List[Job], List[JobId]]):
         self._jobs = jobs
 
+    def wait(self, timeout: Optional[Union[float, int]] = None) -> bool:
+        """Wait for all the jobs of the submission to be finished.
+
+        Parameters:
+            timeout (Optional[Union[float, int]]): The maximum number of seconds to wait for the jobs.
+                If not provided, wait until all the jobs are finished.
+        Returns:
+            True if all the jobs are finished, False if the timeout expired before.
+        """
+        return _JobManagerFactory._build_manager()._wait([job for job in self.jobs if job], timeout=timeout)
+
     def __hash__(self):
         return hash(self.id)
 
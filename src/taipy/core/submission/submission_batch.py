@@ -0,0 +1,53 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Iterator, List, Optional, Union
+
+from ..job._job_manager_factory import _JobManagerFactory
+from ..job.job import Job
+from .submission import Submission
+
+
+class SubmissionBatch:
+    """Handle on the submissions created by a single call to `taipy.submit_many()^`.
+
+    Attributes:
+        submissions (List[Submission^]): The submissions, in the order of the submitted entities.
+    """
+
+    def __init__(self, submissions: List[Submission], jobs: List[List[Job]]):
+        self.submissions = submissions
+        self.__jobs = jobs
+
+    @property
+    def jobs(self) -> List[Job]:
+        """The jobs of all the submissions."""
+        return [job for jobs in self.__jobs for job in jobs]
+
+    def wait(self, timeout: Optional[Union[float, int]] = None) -> bool:
+        """Wait for all the jobs of all the submissions to be finished.
+
+        Parameters:
+            timeout (Optional[Union[float, int]]): The maximum number of seconds to wait for the jobs.
+                If not provided, wait until all the jobs are finished.
+        Returns:
+            True if all the jobs are finished, False if the timeout expired before.
+        """
+        return _JobManagerFactory._build_manager()._wait(self.jobs, timeout=timeout)
+
+    def __iter__(self) -> Iterator[Submission]:
+        return iter(self.submissions)
+
+    def __len__(self) -> int:
+        return len(self.submissions)
+
+    def __getitem__(self, index: int) -> Submission:
+        return self.submissions[index]
@@ -12,7 +12,7 @@
 import pathlib
 import shutil
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Union, overload
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union, overload
 
 from taipy.config.common.scope import Scope
 from taipy.logger._taipy_logger import _TaipyLogger
@@ -44,7 +44,9 @@ from .sequence._sequence_manager_factory import _SequenceManagerFactory
 from .sequence.sequence import Sequence
 from .sequence.sequence_id import SequenceId
 from .submission._submission_manager_factory import _SubmissionManagerFactory
+from .submission.execution_plan import ExecutionPlan
 from .submission.submission import Submission
+from .submission.submission_batch import SubmissionBatch
 from .task._task_manager_factory import _TaskManagerFactory
 from .task.task import Task
 from .task.task_id import TaskId
@@ -150,6 +152,9 @@ def submit(
     force: bool = False,
     wait: bool = False,
     timeout: Optional[Union[float, int]] = None,
+    priority: Optional[int] = None,
+    user: Optional[str] = None,
+    targets: Optional[List[Union[DataNode, str]]] = None,
 ) -> Union[Job, List[Job]]:
     """Submit a scenario, sequence or task entity for execution.
 
@@ -165,6 +170,16 @@ def submit(
             in asynchronous mode.
         timeout (Union[float, int]): The optional maximum number of seconds to wait
             for the jobs to be finished before returning.
+        priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are
+            dispatched first, the priority of the task configurations being added to the submission priority.
+            The default value is 0.
+        user (Optional[str]): The user the submission is made for. With the *"fair_share"* scheduling policy, the
+            submissions of a user share the workers with the other users and submissions, in proportion to the weight of
+            the user. The default value is None, meaning that each submission has its own share.
+        targets (Optional[List[Union[DataNode^, str]]]): The data nodes, data node ids or data node config ids
+            to compute, if the entity is a scenario or a sequence. If given, only the tasks of the entity these
+            data nodes depend on are submitted, the skippable tasks among them being still skipped if their
+            outputs are up to date. The default value is None, meaning all the tasks of the entity.
 
     Returns:
         The created `Job^` or a collection of the created `Job^` depends on the submitted entity.
@@ -173,11 +188,98 @@ def submit(
             - If a `Task^` is provided, it will return the created `Job^`.
     """
     if isinstance(entity, Scenario):
-        return _ScenarioManagerFactory._build_manager()._submit(entity, force=force, wait=wait, timeout=timeout)
+        return _ScenarioManagerFactory._build_manager()._submit(
+            entity, force=force, wait=wait, timeout=timeout, priority=priority, user=user, targets=targets
+        )
     if isinstance(entity, Sequence):
-        return _SequenceManagerFactory._build_manager()._submit(entity, force=force, wait=wait, timeout=timeout)
+        return _SequenceManagerFactory._build_manager()._submit(
+            entity, force=force, wait=wait, timeout=timeout, priority=priority, user=user, targets=targets
+        )
     if isinstance(entity, Task):
-        return _TaskManagerFactory._build_manager()._submit(entity, force=force, wait=wait, timeout=timeout)
+        return _TaskManagerFactory._build_manager()._submit(
+            entity, force=force, wait=wait, timeout=timeout, priority=priority, user=user
+        )
+
+
+@_warn_no_core_service()
+def submit_many(
+    entities: Iterable[Union[Scenario, Sequence, Task]],
+    force: bool = False,
+    wait: bool = False,
+    timeout: Optional[Union[float, int]] = None,
+    priority: Optional[int] = None,
+    user: Optional[str] = None,
+) -> SubmissionBatch:
+    """Submit many scenario, sequence or task entities for execution at once.
+
+    This function is equivalent to calling `taipy.submit()^` on each entity, but the submissions and the jobs
+    of all the entities are created with bulk writes and enqueued in a single pass, which is much faster when
+    submitting hundreds of entities.
+
+    Parameters:
+        entities (Iterable[Union[Scenario^, Sequence^, Task^]]): The scenarios, sequences or tasks to submit.
+        force (bool): If True, the execution is forced even if for skippable tasks.
+        wait (bool): Wait for the orchestrated jobs created from all the submissions to be finished
+            in asynchronous mode.
+        timeout (Union[float, int]): The optional maximum number of seconds to wait
+            for the jobs to be finished before returning.
+        priority (Optional[int]): The priority of the submissions. Jobs of higher priority submissions are
+            dispatched first, the priority of the task configurations being added to the submission priority.
+            The default value is 0.
+        user (Optional[str]): The user the submissions are made for. With the *"fair_share"* scheduling policy, the
+            submissions of a user share the workers with the other users and submissions, in proportion to the weight of
+            the user. The default value is None, meaning that each submission has its own share.
+
+    Returns:
+        The `SubmissionBatch^` holding the created submissions, one for each entity in the same order, which can
+            be used to wait for all the jobs to be finished.
+    """
+    return _SubmissionManagerFactory._build_manager()._submit_many(
+        entities, force=force, wait=wait, timeout=timeout, priority=priority, user=user
+    )
+
+
+def plan(
+    entity: Union[Scenario, Sequence], force: bool = False, targets: Optional[List[Union[DataNode, str]]] = None
+) -> ExecutionPlan:
+    """Estimate the schedule of the submission of a scenario or sequence entity.
+
+    Nothing is submitted. The duration of each task is estimated from the durations of the jobs of its task
+    configuration completed by the application, and the tasks are scheduled on the workers configured in
+    `JobConfig^` by decreasing duration of the longest path of tasks they start, as the jobs are dispatched with
+    the *"critical_path"* scheduling policy.
+
+    Parameters:
+        entity (Union[Scenario^, Sequence^]): The scenario or sequence to plan the submission of.
+        force (bool): If True, the execution is planned as forced, no skippable task being skipped.
+        targets (Optional[List[Union[DataNode^, str]]]): The data nodes, data node ids or data node config ids
+            to compute. If given, only the tasks of the entity these data nodes depend on are planned.
+
+    Returns:
+        The `ExecutionPlan^` holding the estimated start and end of each task, the tasks that would be skipped
+            and the critical path.
+    """
+    return _TaskManagerFactory._build_manager()._orchestrator().plan(entity, force=force, targets=targets)
+
+
+def get_job_execution_metrics() -> Dict[str, Any]:
+    """Get the current metrics of the job executions.
+
+    Returns:
+        A dictionary with the following keys:
+
+        - *"nb_of_jobs_to_run"*: The number of jobs ready to run, waiting for a worker.
+        - *"nb_of_blocked_jobs"*: The number of jobs waiting for their input data nodes.
+        - *"memory_in_use"*: The estimated memory of the running jobs in megabytes, see `JobConfig^`.memory_budget.
+        - *"pools"*: In *"standalone"* mode, a dictionary holding, for each worker pool name, the current number
+            of workers (*"nb_of_workers"*), of busy workers (*"nb_of_busy_workers"*) and the minimum and maximum
+            numbers of workers (*"min_nb_of_workers"* and *"max_nb_of_workers"*) of the pool.
+        - *"wait_times"*: A dictionary holding, for each of the latest submissions with a dispatched job, by
+            submission id, the percentiles (*"p50"*, *"p90"* and *"p99"*) and the maximum (*"max"*) of the
+            number of seconds its jobs waited for a worker once ready to run, and the number of these jobs
+            (*"count"*).
+    """
+    return _TaskManagerFactory._build_manager()._orchestrator().get_metrics()
 
 
 @overload
@@ -0,0 +1,65 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set
+
+from ..data._data_manager_factory import _DataManagerFactory
+from .task import Task
+
+
+class _Staleness:
+    """Staleness of the tasks, derived from the edit dates of their data nodes persisted in the repository.
+
+    A task is stale when its outputs are not up to date with its inputs: one of its outputs was never written or has
+    expired, one of its inputs was edited after its outputs, or one of the tasks writing its inputs is stale.
+
+    The staleness is evaluated each time the stale tasks of a scenario or sequence are requested. Each data node of
+    the tasks is loaded once from the repository, without reading its data, so that the edits made by any process,
+    including the workers executing the jobs, are seen. The staleness then propagates down the tasks in topological
+    order.
+    """
+
+    @classmethod
+    def _get_stale_tasks(cls, tasks: List[Task]) -> List[Task]:
+        """Returns the stale tasks among the given ones, which must be in topological order."""
+        data_manager = _DataManagerFactory._build_manager()
+        # Last edit dates of the data nodes, None for the invalid ones, by data node id.
+        edit_dates: Dict[str, Optional[datetime]] = {}
+
+        def get_edit_dates(dn_ids: Sequence[str]) -> List[Optional[datetime]]:
+            for dn_id in dn_ids:
+                if dn_id not in edit_dates:
+                    dn = data_manager._get(dn_id)
+                    edit_dates[dn_id] = dn.last_edit_date if dn is not None and dn.is_valid else None
+            return [edit_dates[dn_id] for dn_id in dn_ids]
+
+        stale_tasks: List[Task] = []
+        # Outputs of the stale tasks.
+        stale_dn_ids: Set[str] = set()
+        for task in tasks:
+            input_ids = [dn.id for dn in task.input.values()]
+            output_ids = [dn.id for dn in task.output.values()]
+            if not output_ids:
+                continue
+            if stale_dn_ids.intersection(input_ids) or cls.__is_outdated(
+                get_edit_dates(input_ids), get_edit_dates(output_ids)
+            ):
+                stale_tasks.append(task)
+                stale_dn_ids.update(output_ids)
+        return stale_tasks
+
+    @staticmethod
+    def __is_outdated(input_edit_dates: List[Optional[datetime]], output_edit_dates: List[Optional[datetime]]) -> bool:
+        if any(edit_date is None for edit_date in output_edit_dates):
+            return True
+        input_edits = [edit_date for edit_date in input_edit_dates if edit_date]
+        return bool(input_edits) and max(input_edits) > min(output_edit_dates)  # type: ignore
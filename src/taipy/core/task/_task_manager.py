@@ -175,6 +175,8 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
         check_inputs_are_ready: bool = True,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ):
         task_id = task.id if isinstance(task, Task) else task
         task = cls._get(task_id)
@@ -182,7 +184,9 @@ class _TaskManager(_Manager[Task], _VersionMixin):
             raise NonExistingTask(task_id)
         if check_inputs_are_ready:
             _warn_if_inputs_not_ready(task.input.values())
-        job = cls._orchestrator().submit_task(task, callbacks=callbacks, force=force, wait=wait, timeout=timeout)
+        job = cls._orchestrator().submit_task(
+            task, callbacks=callbacks, force=force, wait=wait, timeout=timeout, priority=priority, user=user
+        )
         Notifier.publish(_make_event(task, EventOperation.SUBMISSION))
         return job
 
@@ -174,6 +174,8 @@ class Task(_Entity, _Labeled):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: Optional[int] = None,
+        user: Optional[str] = None,
     ) -> "Job":  # noqa
         """Submit the task for execution.
 
@@ -185,13 +187,20 @@ class Task(_Entity, _Labeled):
                 mode.
             timeout (Union[float, int]): The maximum number of seconds to wait for the job to be finished before
                 returning.
+            priority (Optional[int]): The priority of the submission. Jobs of higher priority submissions are
+                dispatched first. The default value is 0.
+            user (Optional[str]): The user the submission is made for. With the *"fair_share"* scheduling policy, the
+                submissions of a user share the workers with the other users and submissions, in proportion to the
+                weight of the user. The default value is None, meaning that each submission has its own share.
 
         Returns:
             The created `Job^`.
         """
         from ._task_manager_factory import _TaskManagerFactory
 
-        return _TaskManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout)
+        return _TaskManagerFactory._build_manager()._submit(
+            self, callbacks, force, wait, timeout, priority=priority, user=user
+        )
 
     def get_label(self) -> str:
         """Returns the task simple label prefixed by its owner label.
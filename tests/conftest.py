@@ -13,14 +13,18 @@ import os
 import pickle
 import shutil
 from datetime import datetime
-from queue import Queue
 
 import pandas as pd
 import pytest
 from sqlalchemy import create_engine, text
 
 from src.taipy.core._core import Core
+from src.taipy.core._orchestrator._dispatcher._memoization import _Memoization
+from src.taipy.core._orchestrator._dispatcher._memory_usage import _MemoryUsage
+from src.taipy.core._orchestrator._job_queue import _JobQueue
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from src.taipy.core._orchestrator._task_durations import _TaskDurations
+from src.taipy.core._orchestrator._wait_times import _WaitTimes
 from src.taipy.core._repository.db._sql_connection import _SQLConnection
 from src.taipy.core._version._version import _Version
 from src.taipy.core._version._version_manager_factory import _VersionManagerFactory
@@ -425,8 +429,14 @@ def init_orchestrator():
     if _OrchestratorFactory._orchestrator is None:
         _OrchestratorFactory._build_orchestrator()
     _OrchestratorFactory._build_dispatcher()
-    _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
+    _OrchestratorFactory._orchestrator.jobs_to_run = _JobQueue()
     _OrchestratorFactory._orchestrator.blocked_jobs = []
+    _OrchestratorFactory._orchestrator.blocked_jobs_by_input_dn_id = {}
+    _OrchestratorFactory._orchestrator.fused_jobs = {}
+    _TaskDurations._clean()
+    _MemoryUsage._clean()
+    _WaitTimes._clean()
+    _Memoization._clean()
 
 
 def init_notifier():
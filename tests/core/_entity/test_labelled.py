@@ -25,8 +25,12 @@ class MockOwner:
         return self.label
 
 
+class LabeledEntity(_Labeled):
+    pass
+
+
 def test_get_label():
-    labeled_entity = _Labeled()
+    labeled_entity = LabeledEntity()
 
     with pytest.raises(NotImplementedError):
         labeled_entity.get_label()
@@ -76,6 +76,9 @@ class MockRepository(_AbstractRepository):  # type: ignore
     def _save(self, entity: MockEntity):
         return self.repo._save(entity)
 
+    def _save_many(self, entities: Iterable[MockEntity]):
+        return self.repo._save_many(entities)
+
     def _exists(self, entity_id: str) -> bool:
         return self.repo._exists(entity_id)
 
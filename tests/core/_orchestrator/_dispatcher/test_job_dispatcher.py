@@ -9,22 +9,36 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
+import hashlib
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
+from time import sleep
 from unittest import mock
 from unittest.mock import MagicMock
 
-from pytest import raises
+import pytest
 
-from src.taipy.core import DataNodeId, JobId, TaskId
+from src.taipy.core import DataNodeId, JobId, TaskId, taipy
 from src.taipy.core._orchestrator._dispatcher._development_job_dispatcher import _DevelopmentJobDispatcher
+from src.taipy.core._orchestrator._dispatcher._interruption import _Interruption, _JobInterrupted
+from src.taipy.core._orchestrator._dispatcher._resizable_process_pool_executor import _ResizableProcessPoolExecutor
 from src.taipy.core._orchestrator._dispatcher._standalone_job_dispatcher import _StandaloneJobDispatcher
+from src.taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
+from src.taipy.core._orchestrator._dispatcher._worker_pool import _WorkerPool
+from src.taipy.core._orchestrator._job_handle import _JobHandle
+from src.taipy.core._orchestrator._job_queue import _JobQueue
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from src.taipy.core.config.job_config import JobConfig
 from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.job._job_manager import _JobManager
 from src.taipy.core.job.job import Job
+from src.taipy.core.scenario._scenario_manager import _ScenarioManager
 from src.taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+from src.taipy.core.task._staleness import _Staleness
 from src.taipy.core.task.task import Task
 from taipy.config.config import Config
 from tests.core.utils import assert_true_after_time
@@ -40,6 +54,29 @@ def _error():
     raise RuntimeError("Something bad has happened")
 
 
+async def async_mult_by_2(n):
+    await asyncio.sleep(0)
+    return n * 2
+
+
+def _loop_forever():
+    while True:
+        sleep(0.01)
+
+
+def _ignore_interruptions():
+    while True:
+        try:
+            sleep(0.01)
+        except Exception:
+            pass
+
+
+def _sleep_and_return_1():
+    sleep(3)
+    return 1
+
+
 def test_build_development_job_dispatcher():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -48,15 +85,45 @@ def test_build_development_job_dispatcher():
     assert isinstance(dispatcher, _DevelopmentJobDispatcher)
     assert dispatcher._nb_available_workers == 1
 
-    with raises(NotImplementedError):
+    with pytest.raises(NotImplementedError):
         assert dispatcher.start()
 
     assert dispatcher.is_running()
 
-    with raises(NotImplementedError):
+    with pytest.raises(NotImplementedError):
         dispatcher.stop()
 
 
+def mult_by_2(n):
+    return n * 2
+
+
+def test_development_job_dispatcher_runs_fused_jobs_one_after_the_other():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    foo_cfg = Config.configure_data_node("foo", default_data=1)
+    bar_cfg = Config.configure_data_node("bar")
+    baz_cfg = Config.configure_data_node("baz")
+    task_cfgs = [
+        Config.configure_task("by_2", mult_by_2, foo_cfg, bar_cfg),
+        Config.configure_task("by_4", mult_by_2, bar_cfg, baz_cfg),
+    ]
+    scenario = _ScenarioManager._create(Config.configure_scenario("chain", task_cfgs))
+    _OrchestratorFactory._build_dispatcher()
+    jobs = [
+        _JobManager._create(getattr(scenario, cfg.id), [MagicMock()], "submit_id", scenario.id) for cfg in task_cfgs
+    ]
+    for job in jobs:
+        job.running()
+
+    _OrchestratorFactory._dispatcher._dispatch_fused_jobs(jobs)
+
+    assert all(job.is_completed() for job in jobs)
+    assert scenario.baz.read() == 4
+    # The intermediate data node is passed in memory, and also written.
+    assert scenario.bar.read() == 2
+    assert _Staleness._get_stale_tasks([scenario.by_2, scenario.by_4]) == []
+
+
 def test_build_standalone_job_dispatcher():
     Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
     _OrchestratorFactory._build_dispatcher()
@@ -106,6 +173,380 @@ def test_can_execute_2_workers():
     assert_true_after_time(lambda: dispatcher._can_execute())
 
 
+def test_thread_executor_jobs_run_while_process_workers_are_busy():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1, max_nb_of_threads=2)
+    Config.configure_task("io_task", print, executor="thread")
+
+    m = multiprocessing.Manager()
+    lock = m.Lock()
+    output = list(_DataManager._bulk_get_or_create([Config.configure_data_node("input1", default_data=21)]).values())
+
+    _OrchestratorFactory._build_dispatcher()
+    cpu_task = Task("cpu_task", {}, partial(execute, lock), [], output, TaskId("cpu_task_id"))
+    io_task = Task("io_task", {}, partial(execute, lock), [], [], TaskId("io_task_id"))
+    cpu_job = Job(JobId("cpu_job"), cpu_task, "submit_id", cpu_task.id)
+    io_job = Job(JobId("io_job"), io_task, "submit_id", io_task.id)
+    cpu_handle = _JobHandle(cpu_job.id, cpu_task.id, (), (), "submit_id", 0, cpu_task.config_id)
+    io_handle = _JobHandle(io_job.id, io_task.id, (), (), "submit_id", 0, io_task.config_id)
+
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    assert isinstance(dispatcher._thread_executor, ThreadPoolExecutor)
+    assert dispatcher._nb_available_threads == 2
+
+    with lock:
+        dispatcher._dispatch(cpu_job)
+        assert not dispatcher._can_execute_job(cpu_handle)
+        assert dispatcher._can_execute_job(io_handle)
+        dispatcher._dispatch(io_job)
+        dispatcher._dispatch(io_job)
+        assert not dispatcher._can_execute_job(io_handle)
+
+    assert_true_after_time(lambda: dispatcher._can_execute_job(cpu_handle))
+    assert_true_after_time(lambda: dispatcher._nb_available_threads == 2)
+
+
+def test_jobs_are_dispatched_on_the_pool_of_their_task():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE,
+        max_nb_of_workers=1,
+        pools={"training": {"max_nb_of_workers": 1}, "io": {"max_nb_of_workers": 3, "executor": "thread"}},
+    )
+    Config.configure_task("training_task", print, pool="training")
+    Config.configure_task("io_task", print, pool="io")
+
+    m = multiprocessing.Manager()
+    lock = m.Lock()
+
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    assert isinstance(dispatcher._pools["training"].executor, ProcessPoolExecutor)
+    assert isinstance(dispatcher._pools["io"].executor, ThreadPoolExecutor)
+    assert dispatcher._pools["io"].nb_available_workers == 3
+
+    jobs, handles = {}, {}
+    for config_id in ["default_task", "training_task", "io_task"]:
+        task = Task(config_id, {}, partial(execute, lock), [], [], TaskId(f"{config_id}_id"))
+        jobs[config_id] = Job(JobId(f"{config_id}_job"), task, "submit_id", task.id)
+        handles[config_id] = _JobHandle(jobs[config_id].id, task.id, (), (), "submit_id", 0, task.config_id)
+
+    with lock:
+        dispatcher._dispatch(jobs["training_task"])
+        assert not dispatcher._can_execute_job(handles["training_task"])
+        assert dispatcher._can_execute_job(handles["default_task"])
+        assert dispatcher._can_execute_job(handles["io_task"])
+        dispatcher._dispatch(jobs["io_task"])
+        assert dispatcher._pools["io"].nb_available_workers == 2
+        assert dispatcher._nb_available_workers == 1
+
+    assert_true_after_time(lambda: dispatcher._can_execute_job(handles["training_task"]))
+    assert_true_after_time(lambda: dispatcher._pools["io"].nb_available_workers == 3)
+
+
+def test_queue_is_not_searched_when_no_queued_job_has_a_free_worker():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE,
+        max_nb_of_workers=1,
+        pools={"training": {"max_nb_of_workers": 1}},
+    )
+    Config.configure_task("training_task", print, pool="training")
+    _OrchestratorFactory._build_dispatcher()
+    orchestrator = _OrchestratorFactory._orchestrator
+    dispatcher = _StandaloneJobDispatcher(orchestrator)
+    for i in range(10):
+        orchestrator.jobs_to_run.put(_JobHandle(f"job_{i}", "task_id", (), (), "submit_id", 0, "training_task"))
+
+    with mock.patch.object(orchestrator.jobs_to_run, "find", wraps=orchestrator.jobs_to_run.find) as find:
+        dispatcher._pools["training"].nb_available_workers = 0
+        assert not dispatcher._JobDispatcher__can_dispatch()
+        find.assert_not_called()
+
+        dispatcher._pools["training"].nb_available_workers = 1
+        assert dispatcher._JobDispatcher__can_dispatch()
+        find.assert_called_once()
+
+
+def test_standalone_dispatcher_serializes_the_config_once():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    _OrchestratorFactory._build_dispatcher()
+
+    task = Task(config_id="name", properties={}, input=[], function=print, output=[], id=TaskId("task_id1"))
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+
+    serializer = "src.taipy.core._orchestrator._dispatcher._standalone_job_dispatcher._TomlSerializer._serialize"
+    with mock.patch(serializer, return_value="config") as serialize:
+        dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+        with mock.patch.object(dispatcher._executor, "submit") as submit, mock.patch.object(
+            dispatcher, "_set_dispatched_processes"
+        ):
+            dispatcher._dispatch(job)
+            dispatcher._dispatch(job)
+
+    serialize.assert_called_once()
+    assert submit.call_count == 2
+    submit.assert_called_with(
+        dispatcher._wrapped_function_with_config_load,
+        "config",
+        hashlib.sha256(b"config").hexdigest(),
+        job.id,
+        print,
+        (),
+        (),
+        None,
+        "name",
+    )
+
+
+def test_standalone_dispatcher_only_sends_identifiers_to_workers():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_configs = [Config.configure_data_node("input", default_data=21), Config.configure_data_node("output")]
+    _OrchestratorFactory._build_dispatcher()
+
+    data_nodes = _DataManager._bulk_get_or_create(dn_configs)
+    input_dn, output_dn = data_nodes[dn_configs[0]], data_nodes[dn_configs[1]]
+    for _ in range(100):
+        input_dn.write(21)
+    task = Task(config_id="name", properties={}, input=[input_dn], function=print, output=[output_dn])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    with mock.patch.object(dispatcher._executor, "submit") as submit, mock.patch.object(
+        dispatcher, "_set_dispatched_processes"
+    ):
+        dispatcher._dispatch(job)
+
+    _, _, _, job_id, function, input_dn_ids, output_dn_ids, submit_id, task_config_id = submit.call_args.args
+    assert job_id == job.id
+    assert function is print
+    assert input_dn_ids == (input_dn.id,)
+    assert output_dn_ids == (output_dn.id,)
+    assert submit_id is None
+    assert task_config_id == "name"
+
+
+def test_worker_only_reloads_the_config_when_its_fingerprint_changes():
+    deserializer = "src.taipy.core._orchestrator._dispatcher._task_function_wrapper._TomlSerializer._deserialize"
+
+    with mock.patch(deserializer) as deserialize, mock.patch.object(Config._applied_config, "_update"):
+        _TaskFunctionWrapper._wrapped_function_with_config_load("config", "fingerprint_1", JobId("id1"), print, (), ())
+        _TaskFunctionWrapper._wrapped_function_with_config_load("config", "fingerprint_1", JobId("id2"), print, (), ())
+        assert deserialize.call_count == 1
+        _TaskFunctionWrapper._wrapped_function_with_config_load(
+            "new_config", "fingerprint_2", JobId("id3"), print, (), ()
+        )
+        assert deserialize.call_count == 2
+        deserialize.assert_called_with("new_config")
+
+    _TaskFunctionWrapper._TaskFunctionWrapper__config_fingerprint = None
+
+
+def test_standalone_dispatcher_worker_processes_options():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, start_method="spawn", max_tasks_per_child=1
+    )
+    _OrchestratorFactory._build_dispatcher()
+    executor = _OrchestratorFactory._dispatcher._executor
+
+    assert executor._mp_context.get_start_method() == "spawn"
+    assert executor._initializer == _StandaloneJobDispatcher._initialize_worker
+    assert executor._initargs == (
+        _OrchestratorFactory._dispatcher._config_as_string,
+        _OrchestratorFactory._dispatcher._config_fingerprint,
+        _OrchestratorFactory._dispatcher._pools[JobConfig._DEFAULT_POOL].reports,
+        _OrchestratorFactory._dispatcher._interruption_requests_folder,
+    )
+    if sys.version_info >= (3, 11):
+        assert executor._max_tasks_per_child == 1
+
+
+def test_standalone_dispatcher_warns_when_max_tasks_per_child_is_ignored():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1, start_method="spawn", max_tasks_per_child=1
+    )
+    _OrchestratorFactory._build_dispatcher()
+    with mock.patch.object(sys, "version_info", (3, 10)), mock.patch.object(
+        _StandaloneJobDispatcher, "_StandaloneJobDispatcher__logger"
+    ) as logger:
+        _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    logger.warning.assert_called_once_with(
+        "max_tasks_per_child is only supported from Python 3.11. The worker processes are not replaced."
+    )
+
+
+def test_worker_initializer_loads_the_config_ahead_of_the_first_job():
+    deserializer = "src.taipy.core._orchestrator._dispatcher._task_function_wrapper._TomlSerializer._deserialize"
+
+    with mock.patch(deserializer) as deserialize, mock.patch.object(Config._applied_config, "_update"):
+        _TaskFunctionWrapper._initialize_worker("config", "fingerprint")
+        assert deserialize.call_count == 1
+        _TaskFunctionWrapper._wrapped_function_with_config_load("config", "fingerprint", JobId("id1"), print, (), ())
+        assert deserialize.call_count == 1
+
+        deserialize.side_effect = ValueError()
+        _TaskFunctionWrapper._initialize_worker("invalid_config", "invalid_fingerprint")
+
+    _TaskFunctionWrapper._TaskFunctionWrapper__config_fingerprint = None
+
+
+def test_running_job_exceeding_its_timeout_is_interrupted_and_fails():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1)
+    output_cfg = Config.configure_data_node("output")
+    task_cfg = Config.configure_task("runaway", _loop_forever, [], output_cfg, timeout=0.5)
+    scenario_cfg = Config.configure_scenario("scenario", [task_cfg])
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    scenario = _ScenarioManager._create(scenario_cfg)
+
+    job = taipy.submit(scenario.runaway)
+
+    assert_true_after_time(job.is_failed)
+    assert "exceeded its timeout of 0.5 seconds" in job.stacktrace[-1]
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 1)
+    assert not _DataManager._get(scenario.output.id).edit_in_progress
+    assert scenario.output.job_ids == []
+
+
+def test_cancel_running_job_in_thread_pool():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1, max_nb_of_threads=1)
+    output_cfg = Config.configure_data_node("output")
+    task_cfg = Config.configure_task("runaway", _loop_forever, [], output_cfg, executor="thread")
+    scenario_cfg = Config.configure_scenario("scenario", [task_cfg])
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    scenario = _ScenarioManager._create(scenario_cfg)
+
+    job = taipy.submit(scenario.runaway)
+    assert_true_after_time(job.is_running)
+    assert_true_after_time(lambda: dispatcher._nb_available_threads == 0)
+    taipy.cancel_job(job)
+
+    assert_true_after_time(job.is_canceled)
+    assert_true_after_time(lambda: dispatcher._nb_available_threads == 1)
+    assert not _DataManager._get(scenario.output.id).edit_in_progress
+
+
+def test_worker_process_ignoring_the_interruption_is_killed():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1)
+    output_cfg = Config.configure_data_node("output")
+    task_cfgs = [
+        Config.configure_task("runaway", _ignore_interruptions, [], output_cfg),
+        Config.configure_task("other", print, [], []),
+    ]
+    scenario_cfg = Config.configure_scenario("scenario", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    executor = dispatcher._executor
+    scenario = _ScenarioManager._create(scenario_cfg)
+
+    with mock.patch.object(_StandaloneJobDispatcher, "_INTERRUPTION_GRACE_PERIOD", 0.5):
+        job = taipy.submit(scenario.runaway)
+        assert_true_after_time(job.is_running)
+        assert_true_after_time(lambda: dispatcher._pools[JobConfig._DEFAULT_POOL]._get_worker_pid(job.id) is not None)
+        taipy.cancel_job(job)
+
+        assert_true_after_time(job.is_canceled)
+    assert dispatcher._executor is not executor
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 1)
+    assert not _DataManager._get(scenario.output.id).edit_in_progress
+    other_job = taipy.submit(scenario.other)
+    assert_true_after_time(other_job.is_completed)
+
+
+def test_jobs_of_the_other_workers_of_a_killed_worker_are_queued_again():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    output_cfgs = [Config.configure_data_node("output"), Config.configure_data_node("other_output")]
+    task_cfgs = [
+        Config.configure_task("runaway", _ignore_interruptions, [], output_cfgs[0]),
+        Config.configure_task("other", _sleep_and_return_1, [], output_cfgs[1]),
+    ]
+    scenario_cfg = Config.configure_scenario("scenario", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    pool = dispatcher._pools[JobConfig._DEFAULT_POOL]
+    scenario = _ScenarioManager._create(scenario_cfg)
+
+    with mock.patch.object(_StandaloneJobDispatcher, "_INTERRUPTION_GRACE_PERIOD", 0.5):
+        job = taipy.submit(scenario.runaway)
+        other_job = taipy.submit(scenario.other)
+        assert_true_after_time(lambda: pool._get_worker_pid(job.id) is not None)
+        assert_true_after_time(lambda: pool._get_worker_pid(other_job.id) is not None)
+        taipy.cancel_job(job)
+
+        assert_true_after_time(job.is_canceled)
+    assert_true_after_time(other_job.is_completed, time=15)
+    assert _DataManager._get(scenario.other_output.id).read() == 1
+    assert not _DataManager._get(scenario.output.id).edit_in_progress
+
+
+def test_worker_process_running_another_job_is_not_killed():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1)
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    pool = dispatcher._pools[JobConfig._DEFAULT_POOL]
+    executor = pool.executor
+    future = MagicMock(done=MagicMock(return_value=False))
+
+    with mock.patch.object(_WorkerPool, "_get_worker_pid", return_value=1), mock.patch.object(
+        _WorkerPool, "_get_running_job_id", return_value="another_job"
+    ), mock.patch("os.kill") as kill:
+        dispatcher._StandaloneJobDispatcher__kill_worker(pool, ("job",), executor, future)
+
+    kill.assert_not_called()
+    assert pool.executor is executor
+
+
+def test_signal_only_interrupts_the_job_requested_to_stop(tmp_path):
+    folder = str(tmp_path / "requests")
+    _Interruption._request(folder, ["job"])
+
+    with mock.patch.object(_Interruption, "_Interruption__requests_folder", folder):
+        with mock.patch.object(_Interruption, "_Interruption__running_job_id", "another_job"):
+            _Interruption._Interruption__on_signal(_Interruption._SIGNAL, None)
+        with mock.patch.object(_Interruption, "_Interruption__running_job_id", "job"):
+            with pytest.raises(_JobInterrupted):
+                _Interruption._Interruption__on_signal(_Interruption._SIGNAL, None)
+
+    _Interruption._discard_requests(folder, ["job"])
+    assert not os.path.exists(folder)
+
+
+def test_outputs_an_aborted_job_may_have_partially_written_are_invalidated():
+    invalidate_partial_outputs = _StandaloneJobDispatcher._StandaloneJobDispatcher__invalidate_partial_outputs
+    dn_configs = [
+        Config.configure_pickle_data_node("written"),
+        Config.configure_pickle_data_node("partially_written"),
+        Config.configure_in_memory_data_node("in_memory"),
+    ]
+    written_dn, partially_written_dn, in_memory_dn = _DataManager._bulk_get_or_create(dn_configs).values()
+    for dn in (written_dn, partially_written_dn, in_memory_dn):
+        dn.write(1)
+        dn.lock_edit()
+    written_dn.write(2, job_id="job")
+    job = MagicMock(
+        id="job", task=MagicMock(output={dn.config_id: dn for dn in (written_dn, partially_written_dn, in_memory_dn)})
+    )
+
+    assert invalidate_partial_outputs(job) == {partially_written_dn.id}
+    partially_written_dn = _DataManager._get(partially_written_dn.id)
+    assert os.path.exists(partially_written_dn.path)
+    assert partially_written_dn.edit_in_progress
+    assert not partially_written_dn.is_ready_for_reading
+    assert _DataManager._get(written_dn.id).read() == 2
+    assert _DataManager._get(in_memory_dn.id).read() == 1
+
+
+def test_worker_processes_report_the_jobs_starting_to_write_their_outputs():
+    reports = multiprocessing.SimpleQueue()
+    pool = _WorkerPool("pool", lambda _: ThreadPoolExecutor(1), 1, reports=reports)
+    reports.put(("job", 1, None))
+    reports.put(("other_job", 2, None))
+    reports.put(("job", 1, _Interruption._WRITING))
+
+    assert pool._get_writing_jobs("job", "other_job") == {"job"}
+    pool._forget_jobs("job")
+    assert pool._get_writing_jobs("job") == set()
+    pool.executor.shutdown()
+
+
 def test_can_execute_synchronous():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -123,6 +564,22 @@ def test_can_execute_synchronous():
     assert dispatcher._can_execute()
 
 
+def test_execute_coroutine_task_function_synchronously():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    dn_configs = [Config.configure_data_node("input", default_data=21), Config.configure_data_node("output")]
+    _OrchestratorFactory._build_dispatcher()
+
+    data_nodes = _DataManager._bulk_get_or_create(dn_configs)
+    input_dn, output_dn = data_nodes[dn_configs[0]], data_nodes[dn_configs[1]]
+    task = Task(config_id="name", properties={}, input=[input_dn], function=async_mult_by_2, output=[output_dn])
+    submission = _SubmissionManagerFactory._build_manager()._create(task.id)
+    job = Job(JobId("id1"), task, submission.id, task.id)
+
+    _OrchestratorFactory._dispatcher._dispatch(job)
+    assert job.is_completed()
+    assert output_dn.read() == 42
+
+
 def test_exception_in_user_function():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -161,3 +618,69 @@ def test_exception_in_writing_data():
         dispatcher._dispatch(job)
         assert job.is_failed()
         assert "node" in job.stacktrace[0]
+
+
+@pytest.mark.parametrize("resizable", [True, False])
+def test_autoscaled_pool_scales_up_on_backlog_and_down_when_idle(resizable, monkeypatch):
+    if resizable and not _ResizableProcessPoolExecutor._is_supported():
+        pytest.skip("The executor is only resized in place with the Python versions it was checked against")
+    monkeypatch.setattr(_ResizableProcessPoolExecutor, "_is_supported", MagicMock(return_value=resizable))
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=3, min_nb_of_workers=1, worker_idle_timeout=0.1
+    )
+
+    m = multiprocessing.Manager()
+    lock = m.Lock()
+
+    orchestrator = MagicMock(jobs_to_run=_JobQueue())
+    dispatcher = _StandaloneJobDispatcher(orchestrator)
+    dispatcher._scaling_period = 0
+    pool = dispatcher._pools[JobConfig._DEFAULT_POOL]
+    assert pool.is_autoscaled
+    assert not dispatcher._pools[JobConfig._THREAD_POOL].is_autoscaled
+    executor = dispatcher._executor
+    assert executor._max_workers == 1
+
+    jobs, handles = [], []
+    for i in range(4):
+        task = Task("task", {}, partial(execute, lock), [], [], TaskId(f"task_{i}"))
+        jobs.append(Job(JobId(f"job_{i}"), task, "submit_id", task.id))
+        handles.append(_JobHandle(jobs[i].id, task.id, (), (), "submit_id", 0, task.config_id))
+
+    with lock:
+        dispatcher._dispatch(jobs[0])
+        for job_handle in handles[1:]:
+            orchestrator.jobs_to_run.put(job_handle)
+        dispatcher._scale_pools()
+        if resizable:
+            assert dispatcher._executor is executor
+            assert len(executor._processes) == 3
+        else:
+            assert dispatcher._executor is not executor
+            executor = dispatcher._executor
+        assert executor._max_workers == 3
+        assert dispatcher._get_pool_metrics()[JobConfig._DEFAULT_POOL] == {
+            "nb_of_workers": 3,
+            "nb_of_busy_workers": 1,
+            "min_nb_of_workers": 1,
+            "max_nb_of_workers": 3,
+        }
+        for job_handle in handles[1:]:
+            orchestrator.jobs_to_run.remove(job_handle.id)
+
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 3)
+    dispatcher._scale_pools()
+    assert pool.nb_of_workers == 3
+    sleep(0.2)
+    dispatcher._scale_pools()
+    assert pool.nb_of_workers == 1
+    if resizable:
+        assert dispatcher._executor is executor
+        # The idle worker processes are retired.
+        assert_true_after_time(lambda: len(executor._processes) == 1)
+    else:
+        assert dispatcher._executor is not executor
+    assert dispatcher._executor._max_workers == 1
+    assert dispatcher._nb_available_workers == 1
+    dispatcher._dispatch(jobs[1])
+    assert_true_after_time(jobs[1].is_completed)
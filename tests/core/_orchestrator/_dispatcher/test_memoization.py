@@ -0,0 +1,149 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import importlib.util
+import os
+import sys
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.taipy.core._orchestrator._dispatcher._memoization import _Memoization
+from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.data.csv import CSVDataNode
+from src.taipy.core.data.in_memory import InMemoryDataNode
+from taipy.config.common.scope import Scope
+from taipy.config.config import Config
+
+
+def double(n):
+    return n * 2
+
+
+def triple(n):
+    return n * 3
+
+
+def read(data_node):
+    return lambda dn_id: data_node.read()
+
+
+def test_key_depends_on_task_function_and_input_data():
+    data_node = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": pd.DataFrame({"a": [1, 2]})})
+    same_data_node = InMemoryDataNode("bar", Scope.SCENARIO, properties={"default_data": pd.DataFrame({"a": [1, 2]})})
+    other_data_node = InMemoryDataNode("baz", Scope.SCENARIO, properties={"default_data": pd.DataFrame({"a": [1, 3]})})
+
+    key = _Memoization._get_key("task", double, [data_node], read(data_node))
+    assert key == _Memoization._get_key("task", double, [same_data_node], read(same_data_node))
+    assert key != _Memoization._get_key("task", double, [other_data_node], read(other_data_node))
+    assert key != _Memoization._get_key("task", triple, [data_node], read(data_node))
+    assert key != _Memoization._get_key("other_task", double, [data_node], read(data_node))
+
+
+def _import_module(path):
+    spec = importlib.util.spec_from_file_location("memoized_module", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["memoized_module"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_key_depends_on_the_source_of_the_module_of_the_task_function(tmpdir_factory, monkeypatch):
+    monkeypatch.setitem(sys.modules, "memoized_module", None)
+    path = str(tmpdir_factory.mktemp("memoization").join("memoized_module.py"))
+    source = "FACTOR = {}\n\n\ndef helper(n):\n    return n * FACTOR\n\n\ndef compute(n):\n    return helper(n)\n"
+    data_node = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": 21})
+
+    with open(path, "w") as f:
+        f.write(source.format(2))
+    key = _Memoization._get_key("task", _import_module(path).compute, [data_node], read(data_node))
+    assert key == _Memoization._get_key("task", _import_module(path).compute, [data_node], read(data_node))
+
+    # The task function is unchanged, but the global variable its helper reads is.
+    with open(path, "w") as f:
+        f.write(source.format(10))
+    assert key != _Memoization._get_key("task", _import_module(path).compute, [data_node], read(data_node))
+
+
+def test_fingerprint_data():
+    def fingerprint(data):
+        data_node = InMemoryDataNode("foo", Scope.SCENARIO, properties={"default_data": data})
+        return _Memoization._fingerprint(data_node, read(data_node))
+
+    assert fingerprint(np.arange(10)) == fingerprint(np.arange(10))
+    assert fingerprint(np.arange(10)) != fingerprint(np.arange(10.0))
+    assert fingerprint(np.arange(10)) != fingerprint(np.arange(10).reshape(2, 5))
+    assert fingerprint(pd.Series([1, 2])) != fingerprint(pd.Series([1.0, 2.0]))
+    assert fingerprint(pd.DataFrame({"a": [[1], [2]]})) == fingerprint(pd.DataFrame({"a": [[1], [2]]}))
+    assert fingerprint({"foo": [1, 2]}) == fingerprint({"foo": [1, 2]})
+    assert fingerprint({"foo": [1, 2]}) != fingerprint({"foo": [1, 3]})
+
+
+def test_fingerprint_file_without_reading_it(tmpdir_factory):
+    path = str(tmpdir_factory.mktemp("data").join("foo.csv"))
+    pd.DataFrame({"a": [1, 2]}).to_csv(path, index=False)
+    data_node = CSVDataNode("foo", Scope.SCENARIO, properties={"path": path})
+
+    def fail(dn_id):
+        raise AssertionError("The file should not be read")
+
+    fingerprint = _Memoization._fingerprint(data_node, fail)
+    assert fingerprint == _Memoization._fingerprint(data_node, fail)
+    pd.DataFrame({"a": [1, 3]}).to_csv(path, index=False)
+    os.utime(path, ns=(0, 0))
+    assert fingerprint != _Memoization._fingerprint(data_node, fail)
+
+
+def test_store_and_restore_results(tmpdir_factory):
+    path = str(tmpdir_factory.mktemp("data").join("foo.csv"))
+    csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": path, "exposed_type": "numpy"})
+    in_memory_dn = InMemoryDataNode("bar", Scope.SCENARIO)
+    _DataManager._set(csv_dn)
+    _DataManager._set(in_memory_dn)
+    written = []
+
+    def write_results(results, job_id):
+        written.extend(results)
+        return []
+
+    assert _Memoization._restore("key", [csv_dn, in_memory_dn], "job_id", write_results) is None
+
+    csv_dn.write(np.array([[1, 2], [3, 4]]))
+    _Memoization._store("key", [csv_dn, in_memory_dn], [None, {"foo": 1}])
+    os.remove(path)
+
+    assert _Memoization._restore("key", [csv_dn, in_memory_dn], "job_id", write_results) == []
+    assert csv_dn.read().tolist() == [[1, 2], [3, 4]]
+    assert csv_dn.job_ids[-1] == "job_id"
+    assert written == [(in_memory_dn.id, {"foo": 1})]
+
+
+def test_least_recently_used_results_are_evicted():
+    in_memory_dn = InMemoryDataNode("foo", Scope.SCENARIO)
+    _DataManager._set(in_memory_dn)
+
+    def write_results(results, job_id):
+        return []
+
+    with mock.patch.object(_Memoization, "_MAX_NB_OF_EXECUTIONS", 2):
+        for i, key in enumerate(["first", "second"]):
+            _Memoization._store(key, [in_memory_dn], [i])
+            os.utime(os.path.join(Config.core.storage_folder, "memoization", key), ns=(i, i))
+        assert _Memoization._restore("first", [in_memory_dn], "job_id", write_results) == []
+        _Memoization._store("third", [in_memory_dn], [2])
+
+        assert _Memoization._restore("second", [in_memory_dn], "job_id", write_results) is None
+        assert _Memoization._restore("first", [in_memory_dn], "job_id", write_results) == []
+        assert _Memoization._restore("third", [in_memory_dn], "job_id", write_results) == []
+
+    _Memoization._clean()
+    assert _Memoization._restore("first", [in_memory_dn], "job_id", write_results) is None
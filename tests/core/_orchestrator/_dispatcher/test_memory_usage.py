@@ -0,0 +1,103 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import multiprocessing
+from functools import partial
+from typing import Tuple
+
+from src.taipy.core import JobId, TaskId
+from src.taipy.core._orchestrator._dispatcher._memory_usage import _MemoryUsage
+from src.taipy.core._orchestrator._dispatcher._standalone_job_dispatcher import _StandaloneJobDispatcher
+from src.taipy.core._orchestrator._job_handle import _JobHandle
+from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from src.taipy.core.config.job_config import JobConfig
+from src.taipy.core.job.job import Job
+from src.taipy.core.task.task import Task
+from taipy.config.config import Config
+from tests.core.utils import assert_true_after_time
+
+
+def execute(lock):
+    with lock:
+        ...
+    return None
+
+
+def allocate(nb_of_megabytes):
+    data = bytearray(nb_of_megabytes << 20)
+    return len(data)
+
+
+def _create_job(config_id: str, function) -> Tuple[Job, _JobHandle]:
+    task = Task(config_id, {}, function, [], [], TaskId(f"{config_id}_id"))
+    job = Job(JobId(f"{config_id}_job"), task, "submit_id", task.id)
+    return job, _JobHandle(job.id, task.id, (), (), "submit_id", 0, task.config_id)
+
+
+def test_memory_estimates():
+    Config.configure_task("configured", print, memory=512)
+
+    assert _MemoryUsage._estimate("measured") == 0
+    _MemoryUsage._record("measured", 100.0)
+    _MemoryUsage._record("measured", 300.0)
+    _MemoryUsage._record("measured", 200.0)
+    assert _MemoryUsage._estimate("measured") == 300.0
+
+    # The memory of the task configuration prevails over the measured peak memory.
+    _MemoryUsage._record("configured", 100.0)
+    assert _MemoryUsage._estimate("configured") == 512.0
+
+
+def test_jobs_are_dispatched_within_the_memory_budget():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=3, memory_budget=100)
+    Config.configure_task("large", print, memory=80)
+    Config.configure_task("small", print, memory=15)
+    Config.configure_task("huge", print, memory=150)
+
+    m = multiprocessing.Manager()
+    lock = m.Lock()
+
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    jobs = {config_id: _create_job(config_id, partial(execute, lock)) for config_id in ["large", "small"]}
+    handles = {config_id: job_handle for config_id, (_, job_handle) in jobs.items()}
+    _, huge = _create_job("huge", print)
+
+    # A job larger than the budget runs when no other job runs.
+    assert dispatcher._can_execute_job(huge)
+
+    with lock:
+        dispatcher._dispatch(jobs["large"][0])
+        assert dispatcher._memory_in_use == 80
+        assert not dispatcher._can_execute_job(huge)
+        assert not dispatcher._can_execute_job(handles["large"])
+        # The smaller jobs are dispatched around the jobs that do not fit.
+        assert dispatcher._can_execute_job(handles["small"])
+        dispatcher._dispatch(jobs["small"][0])
+        assert not dispatcher._can_execute_job(handles["small"])
+        assert dispatcher._nb_available_workers == 1
+
+    assert_true_after_time(lambda: dispatcher._memory_in_use == 0)
+    assert dispatcher._can_execute_job(handles["large"])
+    assert dispatcher._can_execute_job(huge)
+
+
+def test_peak_memory_of_the_jobs_executed_in_worker_processes_is_recorded():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1, memory_budget=1024)
+
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    job, _ = _create_job("allocating", partial(allocate, 64))
+
+    dispatcher._dispatch(job)
+    assert_true_after_time(lambda: _MemoryUsage._get_peak("allocating") is not None)
+    assert _MemoryUsage._estimate("allocating") >= 64
+    assert dispatcher._memory_in_use == 0
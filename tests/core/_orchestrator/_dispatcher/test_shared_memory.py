@@ -0,0 +1,51 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.taipy.core._orchestrator._dispatcher._shared_memory import _SharedMemory
+
+pytestmark = pytest.mark.skipif(not _SharedMemory._is_available(), reason="Shared memory hand-off requires POSIX")
+
+
+def test_publish_and_read_data():
+    name = _SharedMemory._segment_name("SUBMISSION_id", "DATANODE_id")
+    assert name == _SharedMemory._segment_name("SUBMISSION_id", "DATANODE_id")
+    assert name != _SharedMemory._segment_name("SUBMISSION_other_id", "DATANODE_id")
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000.0)})
+
+    try:
+        _SharedMemory._publish(name, df)
+        mapped_df = _SharedMemory._read(name)
+        assert mapped_df.equals(df)
+        # The buffers of the segment are mapped copy-on-write, without copy.
+        mapped_df["a"] += 1
+        assert mapped_df["a"].tolist() == list(range(1, 1001))
+        assert _SharedMemory._read(name).equals(df)
+        del mapped_df
+        _SharedMemory._release_mapped_segments()
+
+        copied_df = _SharedMemory._read(name, copy=True)
+        assert copied_df.equals(df)
+        assert copied_df["a"].to_numpy().flags.writeable
+
+        _SharedMemory._publish(name, {"foo": [1, 2, 3]})
+        assert _SharedMemory._read(name, copy=True) == {"foo": [1, 2, 3]}
+        _SharedMemory._publish(name, np.arange(10)[::2])
+        assert _SharedMemory._read(name, copy=True).tolist() == [0, 2, 4, 6, 8]
+    finally:
+        _SharedMemory._unlink(name)
+
+    with pytest.raises(FileNotFoundError):
+        _SharedMemory._read(name)
+    _SharedMemory._unlink(name)
@@ -0,0 +1,170 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+from unittest import mock
+
+from src.taipy.core import taipy
+from src.taipy.core._orchestrator._critical_path import _CriticalPath
+from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from src.taipy.core._orchestrator._task_durations import _TaskDurations
+from src.taipy.core.config.job_config import JobConfig
+from src.taipy.core.scenario._scenario_manager import _ScenarioManager
+from taipy.config import Config
+
+
+def mult_by_2(n):
+    return n * 2
+
+
+def _configure_scenario(skippable=False):
+    foo, bar, baz, qux = [Config.configure_data_node(name, default_data=1) for name in ["foo", "bar", "baz", "qux"]]
+    short = Config.configure_task("short", mult_by_2, foo, bar, skippable=skippable)
+    first = Config.configure_task("first", mult_by_2, foo, baz)
+    second = Config.configure_task("second", mult_by_2, baz, qux)
+    return Config.configure_scenario("scenario", [short, first, second])
+
+
+def _record_durations():
+    _TaskDurations._record("short", 5.0)
+    _TaskDurations._record("first", 1.0)
+    _TaskDurations._record("second", 10.0)
+
+
+def test_remaining_durations():
+    # a -> b -> d and a -> c -> d, with the longest path through c.
+    remaining_durations = _CriticalPath._get_remaining_durations(
+        [
+            ("a", 1.0, ["x"], ["y"]),
+            ("b", 2.0, ["y"], ["z1"]),
+            ("c", 5.0, ["y"], ["z2"]),
+            ("d", 3.0, ["z1", "z2"], ["w"]),
+            ("e", 4.0, ["x"], []),
+        ]
+    )
+    assert remaining_durations == {"a": 9.0, "b": 5.0, "c": 8.0, "d": 3.0, "e": 4.0}
+
+    chain = [(str(i), 1.0, [f"dn_{i}"], [f"dn_{i + 1}"]) for i in range(5000)]
+    assert _CriticalPath._get_remaining_durations(chain)["0"] == 5000.0
+
+
+def test_task_duration_estimates():
+    assert _TaskDurations._estimate("short") == _TaskDurations._DEFAULT_DURATION
+
+    _TaskDurations._record("short", 2.0)
+    _TaskDurations._record("short", 4.0)
+    _TaskDurations._record("first", 9.0)
+    statistics = _TaskDurations._get_statistics("short")
+    assert (statistics.count, statistics.mean, statistics.min, statistics.max, statistics.last) == (2, 3, 2, 4, 4)
+    # The task configurations without completed jobs are estimated with the average of the others.
+    assert _TaskDurations._estimate("second") == 6.0
+
+
+def test_task_durations_are_saved_in_the_storage_folder():
+    path = os.path.join(Config.core.storage_folder, _TaskDurations._FILE)
+    with mock.patch.object(_TaskDurations, "_SAVING_PERIOD", float("inf")):
+        _TaskDurations._record("short", 2.0)
+        _TaskDurations._record("short", 4.0)
+        # The changed statistics are only saved periodically, or when flushed.
+        assert not os.path.exists(path)
+        _TaskDurations._flush()
+
+    with open(path) as f:
+        assert json.load(f) == {"short": {"count": 2, "mean": 3.0, "min": 2.0, "max": 4.0, "last": 4.0}}
+    # A new process loads the saved statistics.
+    with mock.patch.object(_TaskDurations, "_TaskDurations__path", None), mock.patch.object(
+        _TaskDurations, "_TaskDurations__statistics", {}
+    ):
+        assert _TaskDurations._estimate("short") == 3.0
+        assert _TaskDurations._get_statistics("short").count == 2
+
+    _TaskDurations._clean()
+    assert not os.path.exists(path)
+    assert _TaskDurations._estimate("short") == _TaskDurations._DEFAULT_DURATION
+
+
+def test_task_durations_are_saved_when_the_dispatcher_stops():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    _OrchestratorFactory._build_dispatcher()
+    path = os.path.join(Config.core.storage_folder, _TaskDurations._FILE)
+    with mock.patch.object(_TaskDurations, "_SAVING_PERIOD", float("inf")):
+        _TaskDurations._record("short", 2.0)
+        assert not os.path.exists(path)
+
+        _OrchestratorFactory._remove_dispatcher()
+
+    with open(path) as f:
+        assert json.load(f)["short"]["count"] == 1
+
+
+def test_durations_of_completed_jobs_are_recorded():
+    scenario = _ScenarioManager._create(_configure_scenario())
+    taipy.submit(scenario)
+
+    for task_config_id in ["short", "first", "second"]:
+        assert _TaskDurations._get_statistics(task_config_id).count == 1
+    taipy.submit(scenario.first)
+    assert _TaskDurations._get_statistics("first").count == 2
+
+
+def test_plan_scenario():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    scenario = _ScenarioManager._create(_configure_scenario())
+    _record_durations()
+
+    plan = taipy.plan(scenario)
+    planned_tasks = {planned_task.task.config_id: planned_task for planned_task in plan}
+    assert len(plan) == 3
+    assert (planned_tasks["first"].start, planned_tasks["first"].end) == (0, 1)
+    assert (planned_tasks["second"].start, planned_tasks["second"].end) == (1, 11)
+    assert (planned_tasks["short"].start, planned_tasks["short"].end) == (0, 5)
+    assert plan.makespan == 11
+    assert plan.critical_path == [scenario.first, scenario.second]
+    assert plan.skipped_tasks == []
+    assert not planned_tasks["short"].critical
+
+
+def test_plan_scenario_with_a_single_worker():
+    scenario = _ScenarioManager._create(_configure_scenario())
+    _record_durations()
+
+    # In development mode, the jobs are executed one after the other, by decreasing remaining duration.
+    plan = taipy.plan(scenario)
+    assert [planned_task.task.config_id for planned_task in plan] == ["first", "second", "short"]
+    assert [planned_task.end for planned_task in plan] == [1, 11, 16]
+    assert plan.makespan == 16
+
+
+def test_plan_scenario_with_skipped_tasks():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1)
+    scenario = _ScenarioManager._create(_configure_scenario(skippable=True))
+    _record_durations()
+    scenario.bar.write(2)
+
+    plan = taipy.plan(scenario)
+    assert plan.skipped_tasks == [scenario.short]
+    assert plan.makespan == 11
+    skipped_task = plan.planned_tasks[0]
+    assert skipped_task.skipped and skipped_task.duration == 0
+
+    plan = taipy.plan(scenario, force=True)
+    assert plan.skipped_tasks == []
+    assert plan.makespan == 16
+
+
+def test_plan_scenario_targets():
+    scenario = _ScenarioManager._create(_configure_scenario())
+    _record_durations()
+
+    plan = taipy.plan(scenario, targets=["bar"])
+    assert [planned_task.task for planned_task in plan] == [scenario.short]
+    assert plan.makespan == 5
@@ -0,0 +1,203 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import random
+from queue import Empty
+from unittest import mock
+
+import pytest
+
+from src.taipy.core._orchestrator._job_handle import _JobHandle
+from src.taipy.core._orchestrator._job_queue import _JobQueue
+from src.taipy.core._orchestrator._task_durations import _TaskDurations
+from src.taipy.core._orchestrator._wait_times import _WaitTimes
+
+
+def _handle(id: str, priority: int = 0) -> _JobHandle:
+    return _JobHandle(id, "task_id", (), (), "submit_id", priority)
+
+
+def _shared_handle(id: str, share: str, weight: float = 1.0, task_config_id: str = "task") -> _JobHandle:
+    handle = _JobHandle(id, "task_id", (), (), f"{share}_submit_id", 0, task_config_id)
+    handle.share = share
+    handle.share_weight = weight
+    return handle
+
+
+def test_get_by_priority_then_by_arrival():
+    queue = _JobQueue()
+    for handle in [_handle("low_1"), _handle("high", 2), _handle("low_2"), _handle("medium", 1)]:
+        queue.put(handle)
+
+    assert queue.qsize() == 4
+    assert [queue.get().id for _ in range(4)] == ["high", "medium", "low_1", "low_2"]
+    assert queue.empty()
+    with pytest.raises(Empty):
+        queue.get()
+
+
+def test_waiting_jobs_age_over_higher_priority_jobs():
+    queue = _JobQueue()
+    with mock.patch("src.taipy.core._orchestrator._job_queue.monotonic") as monotonic:
+        monotonic.return_value = 0
+        queue.put(_handle("old_low"))
+        monotonic.return_value = _JobQueue._AGING_PERIOD / 2
+        queue.put(_handle("new_high", 1))
+        monotonic.return_value = _JobQueue._AGING_PERIOD * 2
+        queue.put(_handle("newest_high", 1))
+
+    assert [queue.get().id for _ in range(3)] == ["new_high", "old_low", "newest_high"]
+
+
+def test_rescheduled_job_keeps_the_age_of_its_arrival():
+    queue = _JobQueue()
+    with mock.patch("src.taipy.core._orchestrator._job_queue.monotonic") as monotonic:
+        monotonic.return_value = 0
+        queue.put(_handle("old_low"))
+        monotonic.return_value = _JobQueue._AGING_PERIOD * 2
+        queue.put(_handle("new_high", 1))
+        monotonic.return_value = _JobQueue._AGING_PERIOD * 3
+        queue.put(_handle("old_low"))
+
+    assert [queue.get().id for _ in range(2)] == ["old_low", "new_high"]
+
+
+def test_remaining_duration_only_breaks_ties_within_a_priority_level():
+    queue = _JobQueue()
+    handles = [_handle("short_low"), _handle("long_low"), _handle("short_high", 1)]
+    handles[0].remaining_duration = 1.0
+    handles[1].remaining_duration = _JobQueue._AGING_PERIOD * 10
+    handles[2].remaining_duration = 1.0
+    with mock.patch("src.taipy.core._orchestrator._job_queue.monotonic") as monotonic:
+        monotonic.return_value = 0
+        for handle in handles:
+            queue.put(handle)
+
+    assert [queue.get().id for _ in range(3)] == ["short_high", "long_low", "short_low"]
+
+
+def test_remove():
+    queue = _JobQueue()
+    handles = [_handle(f"job_{i}", random.randint(-5, 5)) for i in range(200)]
+    for handle in handles:
+        queue.put(handle)
+
+    removed = set(random.sample([handle.id for handle in handles], 100))
+    for job_id in removed:
+        assert queue.remove(job_id).id == job_id
+        assert job_id not in queue
+    assert queue.remove("job_0" if "job_0" in removed else "unknown") is None
+    assert queue.qsize() == 100
+
+    expected = [handle.id for handle in sorted(handles, key=lambda h: -h.priority) if handle.id not in removed]
+    assert [queue.get().id for _ in range(100)] == expected
+
+
+def test_put_an_already_queued_job_reschedules_it():
+    queue = _JobQueue()
+    queue.put(_handle("job_1"))
+    queue.put(_handle("job_2"))
+    queue.put(_handle("job_1"))
+
+    assert queue.qsize() == 2
+    assert [queue.get().id for _ in range(2)] == ["job_2", "job_1"]
+
+
+def test_find_and_get_the_first_accepted_job():
+    queue = _JobQueue()
+    handles = [_handle(f"job_{i}", random.randint(-5, 5)) for i in range(50)]
+    for handle in handles:
+        queue.put(handle)
+    expected = [handle.id for handle in sorted(handles, key=lambda h: -h.priority) if int(handle.id[4:]) % 3 == 0]
+
+    def accept(handle):
+        return int(handle.id[4:]) % 3 == 0
+
+    assert queue.find(accept).id == expected[0]
+    assert queue.qsize() == 50
+    assert [queue.get(accept).id for _ in range(len(expected))] == expected
+    assert queue.find(accept) is None
+    with pytest.raises(Empty):
+        queue.get(accept)
+    assert queue.qsize() == 50 - len(expected)
+
+
+def test_task_config_ids_of_queued_jobs():
+    queue = _JobQueue()
+    queue.put(_shared_handle("job_1", "a", task_config_id="task_a"))
+    queue.put(_shared_handle("job_2", "a", task_config_id="task_b"))
+    queue.put(_shared_handle("job_3", "b", task_config_id="task_a"))
+    queue.put(_shared_handle("job_1", "a", task_config_id="task_a"))
+    assert sorted(queue.task_config_ids()) == ["task_a", "task_b"]
+
+    queue.remove("job_1")
+    assert sorted(queue.task_config_ids()) == ["task_a", "task_b"]
+    queue.get(lambda handle: handle.id == "job_3")
+    assert queue.task_config_ids() == ["task_b"]
+    queue.get()
+    assert queue.task_config_ids() == []
+
+
+def test_fair_share_between_shares():
+    queue = _JobQueue()
+    for i in range(6):
+        queue.put(_shared_handle(f"huge_{i}", "huge"))
+    for i in range(2):
+        queue.put(_shared_handle(f"small_{i}", "small"))
+
+    # The small share is not served after all the jobs of the huge share queued before it.
+    assert [queue.get().id for _ in range(5)] == ["huge_0", "small_0", "huge_1", "small_1", "huge_2"]
+
+    # A share coming back does not catch up on the time it did not use.
+    queue.put(_shared_handle("small_2", "small"))
+    queue.put(_shared_handle("small_3", "small"))
+    assert [queue.get().id for _ in range(4)] == ["huge_3", "small_2", "huge_4", "small_3"]
+
+
+def test_fair_share_weights_and_durations():
+    _TaskDurations._record("long", 3.0)
+    _TaskDurations._record("short", 1.0)
+    queue = _JobQueue()
+    for i in range(6):
+        queue.put(_shared_handle(f"heavy_{i}", "heavy", weight=2, task_config_id="short"))
+        queue.put(_shared_handle(f"light_{i}", "light", task_config_id="short"))
+        queue.put(_shared_handle(f"long_{i}", "slow", task_config_id="long"))
+
+    # The virtual times grow by 0.5 for a job of the heavy share, 1 for the light share and 3 for the slow share.
+    assert [queue.get().id for _ in range(11)] == [
+        "heavy_0",
+        "light_0",
+        "long_0",
+        "heavy_1",
+        "light_1",
+        "heavy_2",
+        "heavy_3",
+        "light_2",
+        "heavy_4",
+        "heavy_5",
+        "long_1",
+    ]
+
+
+def test_wait_times_of_dispatched_jobs():
+    queue = _JobQueue()
+    with mock.patch("src.taipy.core._orchestrator._job_queue.monotonic") as monotonic:
+        monotonic.return_value = 0
+        for i in range(10):
+            queue.put(_handle(f"job_{i}"))
+        queue.put(_shared_handle("other", "other"))
+        queue.remove("job_9")
+        for i in range(9):
+            monotonic.return_value = i + 1
+            queue.get(lambda handle: handle.id != "other")
+
+    assert _WaitTimes._get_percentiles("submit_id") == {"p50": 5, "p90": 9, "p99": 9, "max": 9, "count": 9}
+    assert _WaitTimes._get_percentiles("other_submit_id") is None
@@ -9,26 +9,37 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import multiprocessing
+import os
 import random
 import string
+import threading
 from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial
 from time import sleep
+from unittest import mock
 
+import numpy as np
 import pytest
 
 from src.taipy.core import taipy
+from src.taipy.core._orchestrator._dispatcher._shared_memory import _SharedMemory
+from src.taipy.core._orchestrator._job_handle import _JobHandle
 from src.taipy.core._orchestrator._orchestrator import _Orchestrator
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from src.taipy.core._orchestrator._task_durations import _TaskDurations
 from src.taipy.core.config.job_config import JobConfig
 from src.taipy.core.data._data_manager import _DataManager
 from src.taipy.core.data.in_memory import InMemoryDataNode
+from src.taipy.core.job._job_manager import _JobManager
 from src.taipy.core.scenario._scenario_manager import _ScenarioManager
 from src.taipy.core.scenario.scenario import Scenario
 from src.taipy.core.sequence._sequence_manager import _SequenceManager
 from src.taipy.core.sequence.sequence import Sequence
+from src.taipy.core.submission._submission_manager import _SubmissionManager
+from src.taipy.core.submission.submission_status import SubmissionStatus
 from src.taipy.core.task._task_manager import _TaskManager
 from src.taipy.core.task.task import Task
 from taipy.config import Config
@@ -65,6 +76,31 @@ def _error():
     raise Exception
 
 
+_release = threading.Event()
+
+
+def wait_for_release(n):
+    _release.wait(30)
+    return n * 2
+
+
+def mult_by_2_once_released(release_path, n):
+    while not os.path.exists(release_path):
+        sleep(0.01)
+    return n * 2
+
+
+_started_coroutines = []
+
+
+async def async_mult_by_2(n):
+    # Only returns once both jobs started, which requires them to run concurrently.
+    _started_coroutines.append(n)
+    while len(_started_coroutines) < 2:
+        await asyncio.sleep(0.01)
+    return n * 2
+
+
 # ################################  TEST METHODS    ##################################
 
 
@@ -95,6 +131,120 @@ def test_submit_task():
     assert job.is_completed()
 
 
+def test_submit_many():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    foo_cfg = Config.configure_data_node("foo", "pickle", default_data=1)
+    bar_cfg = Config.configure_data_node("bar", "pickle")
+    baz_cfg = Config.configure_data_node("baz", "pickle")
+    task_cfgs = [
+        Config.configure_task("first", mult_by_2, foo_cfg, bar_cfg),
+        Config.configure_task("second", mult_by_2, bar_cfg, baz_cfg),
+    ]
+    scenario_cfg = Config.configure_scenario("scenario", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    scenarios = [_ScenarioManager._create(scenario_cfg) for _ in range(5)]
+    for i, scenario in enumerate(scenarios):
+        scenario.foo.write(i)
+    task = scenarios[0].tasks["first"]
+
+    submission_batch = taipy.submit_many([*scenarios, task])
+
+    assert len(submission_batch) == 6
+    assert [submission.entity_id for submission in submission_batch] == [*(s.id for s in scenarios), task.id]
+    assert len(submission_batch.jobs) == 11
+    assert all(job.is_completed() for job in submission_batch.jobs)
+    assert all(submission.submission_status == SubmissionStatus.COMPLETED for submission in submission_batch)
+    assert len({job.submit_id for job in submission_batch[0].jobs}) == 1
+    assert [scenario.baz.read() for scenario in scenarios] == [0, 4, 8, 12, 16]
+    assert all(_DataManager._get(scenario.baz.id).is_ready_for_reading for scenario in scenarios)
+    assert submission_batch.wait(timeout=1)
+
+
+def test_submit_many_in_standalone_mode():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    foo_cfg = Config.configure_data_node("foo", "pickle", default_data=1)
+    bar_cfg = Config.configure_data_node("bar", "pickle")
+    baz_cfg = Config.configure_data_node("baz", "pickle")
+    task_cfgs = [
+        Config.configure_task("first", mult_by_2, foo_cfg, bar_cfg),
+        Config.configure_task("second", mult_by_2, bar_cfg, baz_cfg),
+    ]
+    scenario_cfg = Config.configure_scenario("scenario", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    scenarios = [_ScenarioManager._create(scenario_cfg) for _ in range(10)]
+
+    submission_batch = taipy.submit_many(scenarios, wait=True, timeout=30)
+
+    assert all(job.is_completed() for job in submission_batch.jobs)
+    assert all(scenario.baz.read() == 4 for scenario in scenarios)
+    assert_true_after_time(
+        lambda: all(submission.submission_status == SubmissionStatus.COMPLETED for submission in submission_batch)
+    )
+
+
+def test_submissions_share_the_unfinished_job_of_a_global_task(tmp_path):
+    release_path = str(tmp_path / "release")
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    release_path_cfg = Config.configure_data_node(
+        "release_path", "pickle", scope=Scope.GLOBAL, default_data=release_path
+    )
+    foo_cfg = Config.configure_data_node("foo", "pickle", scope=Scope.GLOBAL, default_data=21)
+    bar_cfg = Config.configure_data_node("bar", "pickle", scope=Scope.GLOBAL)
+    result_cfg = Config.configure_data_node("result", "pickle")
+    task_cfgs = [
+        Config.configure_task("shared", mult_by_2_once_released, [release_path_cfg, foo_cfg], bar_cfg),
+        Config.configure_task("double", mult_by_2, bar_cfg, result_cfg),
+    ]
+    scenario_cfg = Config.configure_scenario("scenario", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    scenario_1 = _ScenarioManager._create(scenario_cfg)
+    scenario_2 = _ScenarioManager._create(scenario_cfg)
+
+    jobs_1 = taipy.submit(scenario_1)
+    shared_job = next(job for job in jobs_1 if job.task.config_id == "shared")
+    assert_true_after_time(shared_job.is_running)
+    jobs_2 = taipy.submit(scenario_2)
+    assert shared_job in jobs_2
+    assert len(jobs_2) == 2
+    open(release_path, "w").close()
+
+    submissions = [_SubmissionManager._get(jobs[-1].submit_id) for jobs in (jobs_1, jobs_2)]
+    assert submissions[0].id != submissions[1].id
+    assert shared_job in submissions[1].jobs
+    assert_true_after_time(
+        lambda: all(
+            _SubmissionManager._get(submission.id).submission_status == SubmissionStatus.COMPLETED
+            for submission in submissions
+        )
+    )
+    assert scenario_1.result.read() == 84
+    assert scenario_2.result.read() == 84
+
+
+def test_submit_many_creates_a_single_job_for_a_global_task():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    foo_cfg = Config.configure_data_node("foo", "pickle", scope=Scope.GLOBAL, default_data=1)
+    bar_cfg = Config.configure_data_node("bar", "pickle", scope=Scope.GLOBAL)
+    baz_cfg = Config.configure_data_node("baz", "pickle")
+    task_cfgs = [
+        Config.configure_task("first", mult_by_2, foo_cfg, bar_cfg),
+        Config.configure_task("second", mult_by_2, bar_cfg, baz_cfg),
+    ]
+    scenario_cfg = Config.configure_scenario("scenario", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    scenarios = [_ScenarioManager._create(scenario_cfg) for _ in range(3)]
+
+    submission_batch = taipy.submit_many(scenarios)
+
+    assert len({job.id for job in submission_batch.jobs}) == 4
+    assert all(job.is_completed() for job in submission_batch.jobs)
+    assert all(submission.submission_status == SubmissionStatus.COMPLETED for submission in submission_batch)
+    assert [scenario.baz.read() for scenario in scenarios] == [4, 4, 4]
+    # The job of the global task is finished, a new submission creates a new job.
+    jobs = taipy.submit(scenarios[0])
+    assert not {job.id for job in jobs} & {job.id for job in submission_batch.jobs}
+
+
 def test_submit_sequence_generate_unique_submit_id():
 
     dn_1 = InMemoryDataNode("dn_config_id_1", Scope.SCENARIO)
@@ -555,6 +705,26 @@ def test_submit_task_synchronously_in_parallel_with_timeout():
     assert_true_after_time(job.is_completed)
 
 
+def test_wait_for_jobs_and_submissions_to_be_finished():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_cfgs = [Config.configure_data_node("input", default_data=1), Config.configure_data_node("output")]
+    task_cfg = Config.configure_task("task", wait_for_release, dn_cfgs[0], dn_cfgs[1], executor="thread")
+    task = _create_task_from_config(task_cfg)
+    _OrchestratorFactory._build_dispatcher()
+
+    job = _Orchestrator.submit_task(task)
+    submission = _SubmissionManager._get(job.submit_id)
+    assert not job.wait(timeout=0.2)
+    assert not submission.wait(timeout=0.2)
+
+    _release.set()
+    assert job.wait(timeout=30)
+    assert job.is_completed()
+    assert submission.wait(timeout=30)
+    assert job.wait()
+    _release.clear()
+
+
 def test_submit_task_multithreading_multiple_task():
     Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
 
@@ -860,6 +1030,290 @@ def test_blocked_scenario():
     assert_true_after_time(lambda: len(_OrchestratorFactory._dispatcher._dispatched_processes) == 0)
 
 
+def test_orchestrator_holds_job_handles():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    foo_cfg = Config.configure_data_node("foo", default_data=1)
+    bar_cfg = Config.configure_data_node("bar")
+    baz_cfg = Config.configure_data_node("baz")
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    dns = _DataManager._bulk_get_or_create([foo_cfg, bar_cfg, baz_cfg])
+    task_1 = Task("by_2", {}, mult_by_2, [dns[foo_cfg]], [dns[bar_cfg]])
+    task_2 = Task("by_4", {}, mult_by_2, [dns[bar_cfg]], [dns[baz_cfg]])
+    _TaskManager._set(task_1)
+    _TaskManager._set(task_2)
+
+    job_1 = _Orchestrator.submit_task(task_1)
+    job_2 = _Orchestrator.submit_task(task_2)
+
+    pending_job = _Orchestrator.jobs_to_run.get()
+    assert isinstance(pending_job, _JobHandle)
+    assert pending_job.id == job_1.id
+    assert pending_job.task_id == task_1.id
+    assert pending_job.input_dn_ids == (task_1.foo.id,)
+    assert pending_job.output_dn_ids == (task_1.bar.id,)
+    assert pending_job.submit_id == job_1.submit_id
+    # The handle does not hold the job, which is loaded from the repository when it is dispatched.
+    assert not hasattr(pending_job, "job")
+    loaded_job = _Orchestrator._get_job(pending_job)
+    assert loaded_job == job_1
+    assert loaded_job.task == task_1
+    assert loaded_job._subscribers is job_1._subscribers
+
+    blocked_job = _Orchestrator.blocked_jobs[0]
+    assert isinstance(blocked_job, _JobHandle)
+    assert blocked_job.id == job_2.id
+    assert _Orchestrator._get_job(blocked_job) == job_2
+    assert _Orchestrator._is_blocked(blocked_job)
+
+
+def test_completed_job_only_unblocks_its_direct_dependents():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_cfgs = [Config.configure_data_node(name) for name in ["foo", "bar", "baz", "qux"]]
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    dns = _DataManager._bulk_get_or_create(dn_cfgs)
+    foo, bar, baz, qux = (dns[dn_cfg] for dn_cfg in dn_cfgs)
+    foo.write(1)
+    task_1 = Task("by_2", {}, mult_by_2, [foo], [bar], id="task_1")
+    task_2 = Task("by_4", {}, mult_by_2, [bar], [baz], id="task_2")
+    task_3 = Task("by_8", {}, mult_by_2, [baz], [qux], id="task_3")
+    for task in [task_1, task_2, task_3]:
+        _TaskManager._set(task)
+    scenario = Scenario("scenario", {task_1, task_2, task_3}, {}, set(), "scenario")
+    _ScenarioManager._set(scenario)
+
+    jobs = {job.task.id: job for job in _Orchestrator.submit(scenario)}
+    assert _Orchestrator.jobs_to_run.qsize() == 1
+    assert len(_Orchestrator.blocked_jobs) == 2
+    assert _Orchestrator.blocked_jobs_by_input_dn_id.keys() == {bar.id, baz.id}
+    assert [job.id for job in _Orchestrator.blocked_jobs_by_input_dn_id[bar.id]] == [jobs["task_2"].id]
+
+    bar.write(2)
+    jobs["task_1"].completed()
+    assert jobs["task_2"].is_pending()
+    assert jobs["task_3"].is_blocked()
+    assert _Orchestrator.jobs_to_run.qsize() == 2
+    assert [job.id for job in _Orchestrator.blocked_jobs] == [jobs["task_3"].id]
+    assert _Orchestrator.blocked_jobs_by_input_dn_id.keys() == {baz.id}
+
+    jobs["task_2"].failed()
+    assert jobs["task_3"].is_abandoned()
+    assert len(_Orchestrator.blocked_jobs) == 0
+    assert len(_Orchestrator.blocked_jobs_by_input_dn_id) == 0
+
+
+def test_short_task_chain_latency():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    nb_tasks = 5
+    dn_cfgs = [Config.configure_data_node(f"dn_{i}", default_data=1) for i in range(nb_tasks + 1)]
+    task_cfgs = [Config.configure_task(f"by_2_{i}", mult_by_2, dn_cfgs[i], dn_cfgs[i + 1]) for i in range(nb_tasks)]
+    scenario_cfg = Config.configure_scenario("chain", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    wait_for = dispatcher._condition.wait_for
+    wait_timeouts = []
+
+    def record_wait_timeout(predicate, timeout=None):
+        wait_timeouts.append(timeout)
+        return wait_for(predicate, timeout)
+
+    dispatcher._condition.wait_for = record_wait_timeout
+    scenario = _ScenarioManager._create(scenario_cfg)
+    jobs = _Orchestrator.submit(scenario)  # Warm up the workers
+    assert_true_after_time(lambda: all(job.is_completed() for job in jobs))
+
+    start = datetime.now()
+    jobs = _Orchestrator.submit(scenario, force=True)
+    while not all(job.is_finished() for job in jobs) and datetime.now() - start < timedelta(seconds=10):
+        sleep(0.001)
+    latency = (datetime.now() - start).total_seconds() / nb_tasks
+
+    # Dispatching a job must not wait for a polling period once its inputs are ready and a worker is free: the
+    # dispatcher waits without timeout, and is woken up through its condition.
+    assert all(job.is_completed() for job in jobs)
+    assert wait_timeouts and all(timeout is None for timeout in wait_timeouts)
+    assert latency < 0.5
+    assert scenario.dn_5.read() == 32
+
+    # A queued job is dispatched well within the former polling period.
+    queued_at, dispatched_at = [], []
+    put, execute_job = _Orchestrator.jobs_to_run.put, dispatcher._execute_job
+
+    def record_queuing(job_handle):
+        queued_at.append(datetime.now())
+        put(job_handle)
+
+    def record_dispatch(job, fused_jobs=()):
+        dispatched_at.append(datetime.now())
+        execute_job(job, fused_jobs)
+
+    with mock.patch.object(_Orchestrator.jobs_to_run, "put", record_queuing):
+        dispatcher._execute_job = record_dispatch
+        job = _Orchestrator.submit_task(scenario.by_2_0, force=True)
+        assert_true_after_time(job.is_completed)
+    assert (dispatched_at[0] - queued_at[0]).total_seconds() < 0.05
+
+
+def test_linear_task_chains_are_fused():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, fuse_task_chains=True)
+    dn_cfgs = [Config.configure_data_node(name) for name in ["foo", "bar", "baz", "qux", "quux"]]
+    for task_config_id in ["by_2", "by_4", "by_8", "other_by_4"]:
+        Config.configure_task(task_config_id, mult_by_2)
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    dns = _DataManager._bulk_get_or_create(dn_cfgs)
+    foo, bar, baz, qux, quux = (dns[dn_cfg] for dn_cfg in dn_cfgs)
+    foo.write(1)
+    task_1 = Task("by_2", {}, mult_by_2, [foo], [bar], id="task_1")
+    task_2 = Task("by_4", {}, mult_by_2, [bar], [baz], id="task_2")
+    task_3 = Task("by_8", {}, mult_by_2, [baz], [qux], id="task_3")
+    task_4 = Task("other_by_4", {}, mult_by_2, [bar], [quux], id="task_4")
+    for task in [task_1, task_2, task_3, task_4]:
+        _TaskManager._set(task)
+    scenario = Scenario("scenario", {task_1, task_2, task_3, task_4}, {}, set(), "scenario")
+    _ScenarioManager._set(scenario)
+
+    jobs = {job.task.id: job for job in _Orchestrator.submit(scenario)}
+
+    # bar is read by two tasks, so only the chain task_2 -> task_3 is fused.
+    assert _Orchestrator.fused_jobs.keys() == {jobs["task_3"].id}
+    assert all(job.is_blocked() for task_id, job in jobs.items() if task_id != "task_1")
+    assert len(_Orchestrator.blocked_jobs) == 3
+    job_handle = _Orchestrator.jobs_to_run.get()
+    assert job_handle.id == jobs["task_1"].id
+    assert job_handle.fused_jobs == ()
+
+    bar.write(2)
+    jobs["task_1"].completed()
+    assert jobs["task_2"].is_pending()
+    assert jobs["task_4"].is_pending()
+    assert jobs["task_3"].is_blocked()
+    job_handles = {job_handle.id: job_handle for job_handle in [_Orchestrator.jobs_to_run.get() for _ in range(2)]}
+    assert [job_handle.id for job_handle in job_handles[jobs["task_2"].id].fused_jobs] == [jobs["task_3"].id]
+    assert _Orchestrator._get_fused_jobs(job_handles[jobs["task_2"].id]) == [jobs["task_3"]]
+
+    _Orchestrator.cancel_job(jobs["task_3"])
+    assert jobs["task_3"].is_canceled()
+    assert len(_Orchestrator.fused_jobs) == 0
+    assert _Orchestrator._get_fused_jobs(job_handles[jobs["task_2"].id]) == []
+
+
+def test_fused_task_chain_passes_intermediate_data_in_memory():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, fuse_task_chains=True)
+    foo_cfg = Config.configure_data_node("foo", default_data=1)
+    bar_cfg = Config.configure_data_node("bar")
+    baz_cfg = Config.configure_data_node("baz", persist=False)
+    qux_cfg = Config.configure_data_node("qux")
+    task_cfgs = [
+        Config.configure_task("by_2", mult_by_2, foo_cfg, bar_cfg),
+        Config.configure_task("by_4", mult_by_2, bar_cfg, baz_cfg),
+        Config.configure_task("by_8", mult_by_2, baz_cfg, qux_cfg),
+    ]
+    scenario_cfg = Config.configure_scenario("chain", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+
+    scenario = _ScenarioManager._create(scenario_cfg)
+    jobs = _Orchestrator.submit(scenario, wait=True, timeout=30)
+
+    # A job is still recorded for each task of the chain.
+    assert len(jobs) == 3
+    assert all(job.is_completed() for job in jobs)
+    assert scenario.qux.read() == 8
+    # The intermediate data are written, unless the data node is not persisted.
+    assert scenario.bar.read() == 2
+    assert scenario.baz.last_edit_date is None
+    assert not scenario.baz.edit_in_progress
+    assert len(_Orchestrator.fused_jobs) == 0
+    assert len(_Orchestrator.blocked_jobs) == 0
+
+
+def to_array(n):
+    return np.arange(n)
+
+
+def add_1_in_place(array):
+    array += 1
+    return array
+
+
+@pytest.mark.skipif(not _SharedMemory._is_available(), reason="Shared memory hand-off requires POSIX")
+def test_hand_data_over_through_shared_memory():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, use_shared_memory=True)
+    foo_cfg = Config.configure_data_node("foo", "in_memory", default_data=10)
+    bar_cfg = Config.configure_data_node("bar", "pickle")
+    baz_cfg = Config.configure_data_node("baz", "in_memory")
+    qux_cfg = Config.configure_data_node("qux", "in_memory")
+    task_cfgs = [
+        Config.configure_task("to_array", to_array, foo_cfg, bar_cfg),
+        Config.configure_task("by_2", mult_by_2, bar_cfg, baz_cfg),
+        Config.configure_task("add_1_in_place", add_1_in_place, baz_cfg, qux_cfg),
+    ]
+    scenario_cfg = Config.configure_scenario("hand_off", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+
+    scenario = _ScenarioManager._create(scenario_cfg)
+    jobs = _Orchestrator.submit(scenario, wait=True, timeout=30)
+
+    assert all(job.is_completed() for job in jobs)
+    assert scenario.bar.read().tolist() == list(range(10))
+    # The in-memory data written by the worker processes are collected in the memory of the main process.
+    assert scenario.baz.read().tolist() == list(range(0, 20, 2))
+    # The input of the last job is mapped copy-on-write from shared memory, so it can be modified in place.
+    assert scenario.qux.read().tolist() == list(range(1, 20, 2))
+    assert scenario.baz.read().tolist() == list(range(0, 20, 2))
+    assert_true_after_time(lambda: len(_OrchestratorFactory._dispatcher._shared_memory_segments) == 0)
+
+
+nb_of_memoized_executions = 0
+
+
+def count_and_mult_by_2(n):
+    global nb_of_memoized_executions
+    nb_of_memoized_executions += 1
+    return n * 2
+
+
+def test_memoized_task_reuses_results_of_identical_inputs():
+    global nb_of_memoized_executions
+    nb_of_memoized_executions = 0
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    input_cfg = Config.configure_data_node("input", "pickle", default_data=21)
+    output_cfg = Config.configure_data_node("output", "pickle")
+    task_cfg = Config.configure_task("by_2", count_and_mult_by_2, input_cfg, output_cfg, memoize=True)
+    scenario_cfg = Config.configure_scenario("memoized", [task_cfg])
+    _OrchestratorFactory._build_dispatcher()
+
+    scenario_1 = _ScenarioManager._create(scenario_cfg)
+    scenario_2 = _ScenarioManager._create(scenario_cfg)
+    assert _Orchestrator.submit(scenario_1)[0].is_completed()
+    assert nb_of_memoized_executions == 1
+    assert scenario_1.output.read() == 42
+
+    # A scenario with identical input data shares the stored results.
+    job = _Orchestrator.submit(scenario_2)[0]
+    assert job.is_completed()
+    assert nb_of_memoized_executions == 1
+    assert scenario_2.output.read() == 42
+    assert scenario_2.output.job_ids == [job.id]
+
+    # Rewriting an input with identical content does not trigger a new execution.
+    scenario_1.input.write(21)
+    assert _Orchestrator.submit(scenario_1)[0].is_completed()
+    assert nb_of_memoized_executions == 1
+
+    scenario_1.input.write(5)
+    assert _Orchestrator.submit(scenario_1)[0].is_completed()
+    assert nb_of_memoized_executions == 2
+    assert scenario_1.output.read() == 10
+
+
 def test_task_orchestrator_create_synchronous_dispatcher():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -942,6 +1396,38 @@ def test_cannot_exec_task_that_update_config():
     assert_true_after_time(jobs[0].is_failed)
 
 
+def test_execute_jobs_in_spawned_worker_processes():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, start_method="spawn", max_tasks_per_child=1
+    )
+    dn_cfgs = [Config.configure_data_node(f"dn_{i}", "pickle", default_data=1 if i == 0 else None) for i in range(3)]
+    task_cfgs = [Config.configure_task(f"task_{i}", mult_by_2, dn_cfgs[i], dn_cfgs[i + 1]) for i in range(2)]
+    scenario_config = Config.configure_scenario("scenario_config", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+
+    scenario = _ScenarioManager._create(scenario_config)
+    jobs = scenario.submit()
+
+    assert_true_after_time(lambda: all(job.is_completed() for job in jobs), time=60)
+    assert scenario.dn_2.read() == 4
+
+
+def test_execute_coroutine_task_functions_concurrently():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1, max_nb_of_coroutines=2)
+    dn_cfgs = [Config.configure_data_node(f"dn_{i}", "pickle", default_data=i + 1) for i in range(4)]
+    task_cfgs = [Config.configure_task(f"task_{i}", async_mult_by_2, dn_cfgs[i], dn_cfgs[i + 2]) for i in range(2)]
+    scenario_config = Config.configure_scenario("scenario_config", task_cfgs)
+    _OrchestratorFactory._build_dispatcher()
+
+    scenario = _ScenarioManager._create(scenario_config)
+    jobs = scenario.submit()
+
+    assert_true_after_time(lambda: all(job.is_completed() for job in jobs))
+    assert scenario.dn_2.read() == 2
+    assert scenario.dn_3.read() == 4
+    _started_coroutines.clear()
+
+
 def test_can_execute_task_with_development_mode():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
 
@@ -1083,3 +1569,151 @@ def _create_task(function, nb_outputs=1):
 
 def _create_task_from_config(task_cfg):
     return _TaskManager()._bulk_get_or_create([task_cfg])[0]
+
+
+def test_jobs_to_run_are_dispatched_by_priority():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_cfgs = [Config.configure_data_node(name, default_data=1) for name in ["foo", "bar", "baz", "qux"]]
+    Config.configure_task("urgent", mult_by_2, dn_cfgs[0], dn_cfgs[2], priority=10)
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    dns = _DataManager._bulk_get_or_create(dn_cfgs)
+    low_task = Task("low", {}, mult_by_2, [dns[dn_cfgs[0]]], [dns[dn_cfgs[1]]])
+    urgent_task = Task("urgent", {}, mult_by_2, [dns[dn_cfgs[0]]], [dns[dn_cfgs[2]]])
+    high_task = Task("high", {}, mult_by_2, [dns[dn_cfgs[0]]], [dns[dn_cfgs[3]]])
+    for task in [low_task, urgent_task, high_task]:
+        _TaskManager._set(task)
+
+    low_job = _Orchestrator.submit_task(low_task)
+    urgent_job = _Orchestrator.submit_task(urgent_task)
+    high_job = _Orchestrator.submit_task(high_task, priority=5)
+    assert _SubmissionManager._get(high_job.submit_id).priority == 5
+
+    assert _Orchestrator.jobs_to_run.get().id == urgent_job.id
+    assert _Orchestrator.jobs_to_run.get().id == high_job.id
+    assert _Orchestrator.jobs_to_run.get().id == low_job.id
+
+    _Orchestrator.jobs_to_run.put(_JobHandle._from_job(low_job))
+    _Orchestrator.jobs_to_run.put(_JobHandle._from_job(high_job, 5))
+    _Orchestrator.cancel_job(low_job)
+    assert low_job.is_canceled()
+    assert _Orchestrator.jobs_to_run.qsize() == 1
+    assert _Orchestrator.jobs_to_run.get().id == high_job.id
+
+
+def test_queued_job_deleted_before_its_dispatch_is_dropped():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_cfgs = [Config.configure_data_node(name, default_data=1) for name in ["foo", "bar", "baz"]]
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    dns = _DataManager._bulk_get_or_create(dn_cfgs)
+    deleted_task = Task("deleted", {}, mult_by_2, [dns[dn_cfgs[0]]], [dns[dn_cfgs[1]]])
+    other_task = Task("other", {}, mult_by_2, [dns[dn_cfgs[0]]], [dns[dn_cfgs[2]]])
+    for task in [deleted_task, other_task]:
+        _TaskManager._set(task)
+    deleted_job = _Orchestrator.submit_task(deleted_task)
+    other_job = _Orchestrator.submit_task(other_task)
+    _JobManager._delete(deleted_job, force=True)
+
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+
+    assert_true_after_time(other_job.is_completed)
+    assert _Orchestrator.jobs_to_run.empty()
+    assert _Orchestrator._get_job(deleted_job.id) is None
+    assert deleted_job.id not in _Orchestrator._Orchestrator__in_memory_job_parts
+
+
+def test_jobs_to_run_are_dispatched_by_critical_path():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, scheduling_policy=JobConfig._CRITICAL_PATH_POLICY
+    )
+    foo, bar, baz, qux = [Config.configure_data_node(name, default_data=1) for name in ["foo", "bar", "baz", "qux"]]
+    short_cfg = Config.configure_task("short", mult_by_2, foo, bar)
+    first_cfg = Config.configure_task("first", mult_by_2, foo, baz)
+    second_cfg = Config.configure_task("second", mult_by_2, baz, qux)
+    scenario_cfg = Config.configure_scenario("scenario", [short_cfg, first_cfg, second_cfg])
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+    _TaskDurations._record("short", 5.0)
+    _TaskDurations._record("first", 1.0)
+    _TaskDurations._record("second", 10.0)
+
+    scenario = _ScenarioManager._create(scenario_cfg)
+    jobs = {job.task.config_id: job for job in _Orchestrator.submit(scenario)}
+
+    # The first task starts the longest path of the submission.
+    first_job_handle = _Orchestrator.jobs_to_run.get()
+    assert first_job_handle.id == jobs["first"].id
+    assert first_job_handle.remaining_duration == 11.0
+    assert _Orchestrator.jobs_to_run.get().id == jobs["short"].id
+
+
+def test_jobs_to_run_are_dispatched_by_fair_share():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE,
+        max_nb_of_workers=2,
+        scheduling_policy=JobConfig._FAIR_SHARE_POLICY,
+        fair_shares={"alice": 2},
+    )
+    foo = Config.configure_data_node("foo", default_data=1)
+    task_cfgs = [
+        Config.configure_task(f"task_{i}", mult_by_2, foo, Config.configure_data_node(f"dn_{i}")) for i in range(4)
+    ]
+    huge_cfg = Config.configure_scenario("huge", task_cfgs[:3])
+    small_cfg = Config.configure_scenario("small", task_cfgs[3:])
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    huge_jobs = _Orchestrator.submit(_ScenarioManager._create(huge_cfg), priority=5)
+    small_scenario = _ScenarioManager._create(small_cfg)
+    alice_job = _Orchestrator.submit(small_scenario, user="alice")[0]
+    assert _SubmissionManager._get(alice_job.submit_id).user == "alice"
+
+    # The submission of alice does not wait for all the jobs of the earlier submission of higher priority.
+    job_handles = [_Orchestrator.jobs_to_run.get() for _ in range(4)]
+    assert [job_handle.id for job_handle in job_handles] == [
+        huge_jobs[0].id,
+        alice_job.id,
+        huge_jobs[1].id,
+        huge_jobs[2].id,
+    ]
+    assert (job_handles[0].share, job_handles[0].share_weight) == (huge_jobs[0].submit_id, 1)
+    assert (job_handles[1].share, job_handles[1].share_weight) == ("alice", 2)
+
+
+def test_get_job_execution_metrics():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=4, min_nb_of_workers=2, memory_budget=1024
+    )
+    Config.configure_task("large", mult_by_2, memory=300)
+    _OrchestratorFactory._build_dispatcher()
+    _OrchestratorFactory._dispatcher.stop()
+    assert_true_after_time(lambda: not _OrchestratorFactory._dispatcher.is_running())
+
+    task = Task("large", {}, mult_by_2)
+    _TaskManager._set(task)
+    _Orchestrator.submit_task(task)
+    _OrchestratorFactory._dispatcher._reserve_memory("running_job", ["large"])
+
+    metrics = taipy.get_job_execution_metrics()
+    assert metrics["nb_of_jobs_to_run"] == 1
+    assert metrics["nb_of_blocked_jobs"] == 0
+    assert metrics["memory_in_use"] == 300
+    assert metrics["pools"][JobConfig._DEFAULT_POOL] == {
+        "nb_of_workers": 2,
+        "nb_of_busy_workers": 0,
+        "min_nb_of_workers": 2,
+        "max_nb_of_workers": 4,
+    }
+    assert metrics["wait_times"] == {}
+
+    _Orchestrator.jobs_to_run.get()
+    wait_times = taipy.get_job_execution_metrics()["wait_times"]
+    assert list(wait_times) == [_SubmissionManager._get_all()[0].id]
+    assert wait_times[_SubmissionManager._get_all()[0].id]["count"] == 1
@@ -9,6 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import multiprocessing
+import os
+import sys
+
 import pytest
 
 from src.taipy.core.config.job_config import JobConfig
@@ -45,3 +49,204 @@ class TestJobConfigChecker:
             ' value of property `storage_type` is "in_memory".'
         )
         assert expected_error_message in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2, use_shared_memory=True)
+        if os.name == "posix":
+            Config._collector = IssueCollector()
+            Config.check()
+            assert len(Config._collector.errors) == 0
+        else:
+            with pytest.raises(SystemExit):
+                Config._collector = IssueCollector()
+                Config.check()
+            assert len(Config._collector.errors) == 1
+            assert len(Config._collector.warnings) == 1
+
+    def test_check_worker_processes(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="teleport")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "start_method field of JobConfig must be populated with one of the start methods" in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="spawn", max_tasks_per_child=0)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "max_tasks_per_child field of JobConfig must be populated with a positive integer value." in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="spawn", max_tasks_per_child=2)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_max_nb_of_threads(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_threads=0)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "max_nb_of_threads field of JobConfig must be populated with a positive integer value." in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_threads=8)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_coroutines="many")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "max_nb_of_coroutines field of JobConfig must be populated with a positive integer value." in caplog.text
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 11) or "fork" not in multiprocessing.get_all_start_methods(),
+        reason="max_tasks_per_child is only supported from Python 3.11 and fork is not available on all platforms",
+    )
+    def test_check_max_tasks_per_child_with_fork(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="fork", max_tasks_per_child=2)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert (
+            "max_tasks_per_child field of JobConfig cannot be used with the `fork` start_method of JobConfig."
+            in caplog.text
+        )
+
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE,
+            start_method="spawn",
+            max_tasks_per_child=2,
+            pools={"forked": {"start_method": "fork"}, "threads": {"executor": "thread", "start_method": "fork"}},
+        )
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert (
+            "max_tasks_per_child field of JobConfig cannot be used with the `fork` start_method of pool `forked`."
+            in caplog.text
+        )
+
+    def test_check_pools(self, caplog):
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE,
+            pools={"default": {}, "training": {"max_nb_of_workers": 0, "executor": "gpu", "start_method": "teleport"}},
+        )
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 4
+        assert "Pool `default` of JobConfig cannot use one of the reserved names" in caplog.text
+        assert "max_nb_of_workers field of pool `training` must be populated with a positive integer" in caplog.text
+        assert "executor field of pool `training` must be populated with one of" in caplog.text
+        assert "start_method field of pool `training` must be populated with one of the start methods" in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, pools={"training": {"max_nb_of_workers": 2}})
+        Config.configure_task("train", print, pool="unknown")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "pool field of TaskConfig `train` must be populated with a pool defined in JobConfig." in caplog.text
+
+        Config.configure_task("train", print, pool="training")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_executor_of_the_pool_of_a_task(self, caplog):
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE, pools={"io": {"executor": "thread"}, "training": {}}
+        )
+        Config.configure_task("load", print, pool="io", executor="thread")
+        Config.configure_task("train", print, pool="training", executor="process")
+        Config.configure_task("fetch", print, pool="thread", executor="thread")
+        Config._collector = IssueCollector()
+        Config.check()
+        nb_of_warnings = len(Config._collector.warnings)
+
+        Config.configure_task("train", print, pool="training", executor="thread")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+        assert len(Config._collector.warnings) == nb_of_warnings + 1
+        assert (
+            "executor field of TaskConfig `train` is ignored. The task runs on the process executor of its pool"
+            " `training`." in caplog.text
+        )
+
+    def test_check_scheduling_policy(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, scheduling_policy="shortest_first")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "scheduling_policy field of JobConfig must be populated with one of" in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, scheduling_policy="critical_path")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_memory_budget(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, memory_budget="a lot")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "memory_budget field of JobConfig must be populated with a positive number" in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, memory_budget=2048.5)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_autoscaling(self, caplog):
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE,
+            max_nb_of_workers=2,
+            min_nb_of_workers=4,
+            worker_idle_timeout=-1,
+            pools={"training": {"max_nb_of_workers": 2, "min_nb_of_workers": 0}},
+        )
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 3
+        assert "min_nb_of_workers field of JobConfig must not be greater than its max_nb_of_workers" in caplog.text
+        assert "worker_idle_timeout field of JobConfig must be populated with a positive number" in caplog.text
+        assert "min_nb_of_workers field of pool `training` must be populated with a positive integer" in caplog.text
+
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE,
+            max_nb_of_workers=4,
+            min_nb_of_workers=1,
+            worker_idle_timeout=30,
+            pools={"training": {"max_nb_of_workers": 2, "min_nb_of_workers": 1}},
+        )
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_fair_shares(self, caplog):
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE, scheduling_policy="fair_share", fair_shares={"alice": 0, "bob": "high"}
+        )
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 2
+        assert "fair_shares field of JobConfig must be populated with a positive number for user `alice`" in caplog.text
+        assert "fair_shares field of JobConfig must be populated with a positive number for user `bob`" in caplog.text
+
+        Config.configure_job_executions(
+            mode=JobConfig._STANDALONE_MODE, scheduling_policy="fair_share", fair_shares={"alice": 2, "bob": "0.5"}
+        )
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
@@ -240,3 +240,124 @@ class TestTaskConfigChecker:
         Config.check()
         assert len(Config._collector.errors) == 0
         assert len(Config._collector.warnings) == 2
+
+    def test_check_priority(self, caplog):
+        config = Config._applied_config
+        Config._compile_configs()
+
+        config._sections[TaskConfig.name]["new"] = copy(config._sections[TaskConfig.name]["default"])
+        config._sections[TaskConfig.name]["new"].id = "new"
+        config._sections[TaskConfig.name]["new"].function = print
+        config._sections[TaskConfig.name]["new"]._priority = "high"
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "priority field of TaskConfig `new` must be populated with an integer value." in caplog.text
+
+        config._sections[TaskConfig.name]["new"]._priority = 2
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_executor(self, caplog):
+        config = Config._applied_config
+        Config._compile_configs()
+
+        config._sections[TaskConfig.name]["new"] = copy(config._sections[TaskConfig.name]["default"])
+        config._sections[TaskConfig.name]["new"].id = "new"
+        config._sections[TaskConfig.name]["new"].function = print
+        config._sections[TaskConfig.name]["new"]._executor = "gpu"
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "executor field of TaskConfig `new` must be populated with one of ['process', 'thread']." in caplog.text
+
+        config._sections[TaskConfig.name]["new"]._executor = "thread"
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_memoize(self, caplog):
+        config = Config._applied_config
+        Config._compile_configs()
+
+        config._sections[TaskConfig.name]["new"] = copy(config._sections[TaskConfig.name]["default"])
+        config._sections[TaskConfig.name]["new"].id = "new"
+        config._sections[TaskConfig.name]["new"].function = print
+        config._sections[TaskConfig.name]["new"]._memoize = "yes"
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "memoize field of TaskConfig `new` must be populated with a Boolean value." in caplog.text
+
+        config._sections[TaskConfig.name]["new"]._memoize = True
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_timeout(self, caplog):
+        config = Config._applied_config
+        Config._compile_configs()
+
+        config._sections[TaskConfig.name]["new"] = copy(config._sections[TaskConfig.name]["default"])
+        config._sections[TaskConfig.name]["new"].id = "new"
+        config._sections[TaskConfig.name]["new"].function = print
+        for timeout in [-1, 0, "soon"]:
+            config._sections[TaskConfig.name]["new"]._timeout = timeout
+            with pytest.raises(SystemExit):
+                Config._collector = IssueCollector()
+                Config.check()
+            assert len(Config._collector.errors) == 1
+        assert "timeout field of TaskConfig `new` must be populated with a positive number of seconds." in caplog.text
+
+        config._sections[TaskConfig.name]["new"]._timeout = 2.5
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_memory(self, caplog):
+        config = Config._applied_config
+        Config._compile_configs()
+
+        config._sections[TaskConfig.name]["new"] = copy(config._sections[TaskConfig.name]["default"])
+        config._sections[TaskConfig.name]["new"].id = "new"
+        config._sections[TaskConfig.name]["new"].function = print
+        for memory in [-1, "large", [512]]:
+            config._sections[TaskConfig.name]["new"]._memory = memory
+            with pytest.raises(SystemExit):
+                Config._collector = IssueCollector()
+                Config.check()
+            assert len(Config._collector.errors) == 1
+        assert "memory field of TaskConfig `new` must be populated with a positive number of megabytes." in caplog.text
+
+        config._sections[TaskConfig.name]["new"]._memory = 512
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_coroutine_function(self, caplog):
+        async def coroutine_function():
+            return None
+
+        config = Config._applied_config
+        Config._compile_configs()
+
+        config._sections[TaskConfig.name]["new"] = copy(config._sections[TaskConfig.name]["default"])
+        config._sections[TaskConfig.name]["new"].id = "new"
+        config._sections[TaskConfig.name]["new"].function = coroutine_function
+        Config._collector = IssueCollector()
+        Config.check()
+        nb_of_warnings = len(Config._collector.warnings)
+
+        config._sections[TaskConfig.name]["new"]._executor = "thread"
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+        assert len(Config._collector.warnings) == nb_of_warnings + 1
+        assert (
+            "executor field of TaskConfig `new` is ignored. The function of the task is a coroutine function, run on"
+            " the event loop of the dispatcher." in caplog.text
+        )
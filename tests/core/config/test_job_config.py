@@ -28,6 +28,95 @@ def test_job_config():
     assert Config.job_config.foo == "bar"
 
 
+def test_job_config_worker_processes():
+    assert Config.job_config.start_method is None
+    assert Config.job_config.max_tasks_per_child is None
+
+    job_c = Config.configure_job_executions(mode="standalone", start_method="spawn", max_tasks_per_child=10)
+    assert job_c.start_method == "spawn"
+    assert job_c.max_tasks_per_child == 10
+    assert Config.job_config.start_method == "spawn"
+    assert Config.job_config.max_tasks_per_child == 10
+
+
+def test_job_config_max_nb_of_threads():
+    assert Config.job_config.max_nb_of_threads is None
+
+    job_c = Config.configure_job_executions(mode="standalone", max_nb_of_workers=2, max_nb_of_threads=16)
+    assert job_c.max_nb_of_threads == 16
+    assert Config.job_config.max_nb_of_threads == 16
+
+
+def test_job_config_max_nb_of_coroutines():
+    assert Config.job_config.max_nb_of_coroutines is None
+
+    job_c = Config.configure_job_executions(mode="standalone", max_nb_of_coroutines=50)
+    assert job_c.max_nb_of_coroutines == 50
+    assert Config.job_config.max_nb_of_coroutines == 50
+
+
+def test_job_config_pools():
+    assert Config.job_config.pools is None
+
+    pools = {"training": {"max_nb_of_workers": 2, "start_method": "spawn"}, "io": {"executor": "thread"}}
+    job_c = Config.configure_job_executions(mode="standalone", pools=pools)
+    assert job_c.pools == pools
+    assert Config.job_config.pools == pools
+
+
+def test_job_config_fuse_task_chains():
+    assert Config.job_config.fuse_task_chains is None
+
+    job_c = Config.configure_job_executions(mode="standalone", fuse_task_chains=True)
+    assert job_c.fuse_task_chains
+    assert Config.job_config.fuse_task_chains
+
+
+def test_job_config_use_shared_memory():
+    assert Config.job_config.use_shared_memory is None
+
+    job_c = Config.configure_job_executions(mode="standalone", use_shared_memory=True)
+    assert job_c.use_shared_memory
+    assert Config.job_config.use_shared_memory
+
+
+def test_job_config_scheduling_policy():
+    assert Config.job_config.scheduling_policy is None
+
+    job_c = Config.configure_job_executions(mode="standalone", scheduling_policy="critical_path")
+    assert job_c.scheduling_policy == "critical_path"
+    assert Config.job_config.scheduling_policy == "critical_path"
+
+
+def test_job_config_memory_budget():
+    assert Config.job_config.memory_budget is None
+
+    job_c = Config.configure_job_executions(mode="standalone", memory_budget=4096)
+    assert job_c.memory_budget == 4096
+    assert Config.job_config.memory_budget == 4096
+
+
+def test_job_config_autoscaling():
+    assert Config.job_config.min_nb_of_workers is None
+    assert Config.job_config.worker_idle_timeout is None
+
+    job_c = Config.configure_job_executions(
+        mode="standalone", max_nb_of_workers=8, min_nb_of_workers=2, worker_idle_timeout=300
+    )
+    assert job_c.min_nb_of_workers == 2
+    assert job_c.worker_idle_timeout == 300
+
+
+def test_job_config_fair_shares():
+    assert Config.job_config.fair_shares is None
+
+    job_c = Config.configure_job_executions(
+        mode="standalone", scheduling_policy="fair_share", fair_shares={"alice": 2, "bob": 0.5}
+    )
+    assert job_c.scheduling_policy == "fair_share"
+    assert job_c.fair_shares == {"alice": 2, "bob": 0.5}
+
+
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=2, prop="foo")
 
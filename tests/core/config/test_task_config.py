@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+from copy import copy
 from unittest import mock
 
 from src.taipy.core.config import DataNodeConfig
@@ -19,8 +20,7 @@ from tests.core.utils.named_temporary_file import NamedTemporaryFile
 
 
 def _configure_task_in_toml():
-    return NamedTemporaryFile(
-        content="""
+    return NamedTemporaryFile(content="""
 [TAIPY]
 
 [DATA_NODE.input]
@@ -31,8 +31,7 @@ def _configure_task_in_toml():
 function = "builtins.print:function"
 inputs = [ "input:SECTION",]
 outputs = [ "output:SECTION",]
-    """
-    )
+    """)
 
 
 def _check_data_nodes_instance(dn_id, task_id):
@@ -107,6 +106,106 @@ def test_task_config_creation():
     assert list(Config.tasks) == ["default", task_config.id, task2.id]
 
 
+def test_task_config_priority():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.priority is None
+    assert "priority" not in task_config._to_dict()
+
+    task_config_2 = Config.configure_task("tasks2", print, input_config, output_config, priority=5)
+    assert task_config_2.priority == 5
+    assert task_config_2._to_dict()["priority"] == 5
+    assert copy(task_config_2).priority == 5
+
+    with mock.patch.dict(os.environ, {"PRIORITY": "3"}):
+        task_config_3 = Config.configure_task("tasks3", print, input_config, output_config, priority="ENV[PRIORITY]")
+        assert task_config_3.priority == 3
+
+
+def test_task_config_executor():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.executor is None
+    assert "executor" not in task_config._to_dict()
+
+    task_config_2 = Config.configure_task("tasks2", print, input_config, output_config, executor="thread")
+    assert task_config_2.executor == "thread"
+    assert task_config_2._to_dict()["executor"] == "thread"
+    assert copy(task_config_2).executor == "thread"
+
+    with mock.patch.dict(os.environ, {"EXECUTOR": "process"}):
+        task_config_3 = Config.configure_task("tasks3", print, input_config, output_config, executor="ENV[EXECUTOR]")
+        assert task_config_3.executor == "process"
+
+
+def test_task_config_pool():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.pool is None
+    assert "pool" not in task_config._to_dict()
+
+    task_config_2 = Config.configure_task("tasks2", print, input_config, output_config, pool="training")
+    assert task_config_2.pool == "training"
+    assert task_config_2._to_dict()["pool"] == "training"
+    assert copy(task_config_2).pool == "training"
+
+
+def test_task_config_memoize():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.memoize is None
+    assert "memoize" not in task_config._to_dict()
+
+    task_config_2 = Config.configure_task("tasks2", print, input_config, output_config, memoize=True)
+    assert task_config_2.memoize
+    assert task_config_2._to_dict()["memoize"]
+    assert copy(task_config_2).memoize
+
+    with mock.patch.dict(os.environ, {"MEMOIZE": "True"}):
+        task_config_3 = Config.configure_task("tasks3", print, input_config, output_config, memoize="ENV[MEMOIZE]:bool")
+        assert task_config_3.memoize is True
+
+
+def test_task_config_timeout():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.timeout is None
+    assert "timeout" not in task_config._to_dict()
+
+    task_config_2 = Config.configure_task("tasks2", print, input_config, output_config, timeout=2.5)
+    assert task_config_2.timeout == 2.5
+    assert task_config_2._to_dict()["timeout"] == 2.5
+    assert copy(task_config_2).timeout == 2.5
+
+    with mock.patch.dict(os.environ, {"TIMEOUT": "60"}):
+        task_config_3 = Config.configure_task(
+            "tasks3", print, input_config, output_config, timeout="ENV[TIMEOUT]:float"
+        )
+        assert task_config_3.timeout == 60.0
+
+
+def test_task_config_memory():
+    input_config = Config.configure_data_node("input")
+    output_config = Config.configure_data_node("output")
+    task_config = Config.configure_task("tasks1", print, input_config, output_config)
+    assert task_config.memory is None
+    assert "memory" not in task_config._to_dict()
+
+    task_config_2 = Config.configure_task("tasks2", print, input_config, output_config, memory=512)
+    assert task_config_2.memory == 512
+    assert task_config_2._to_dict()["memory"] == 512
+    assert copy(task_config_2).memory == 512
+
+    with mock.patch.dict(os.environ, {"MEMORY": "1024"}):
+        task_config_3 = Config.configure_task("tasks3", print, input_config, output_config, memory="ENV[MEMORY]:float")
+        assert task_config_3.memory == 1024.0
+
+
 def test_task_count():
     input_config = Config.configure_data_node("input")
     output_config = Config.configure_data_node("output")
@@ -673,6 +673,25 @@ class TestDataNode:
             assert dn.properties["prop"] == "bar"
             assert dn.prop == "bar"
 
+    def test_resolved_property_cache_is_invalidated(self):
+        dn = FakeDataNode("foo", properties={"prop": "ENV[FOO]", "kwargs": {"a": "ENV[BAR]"}})
+        with mock.patch.dict(os.environ, {"FOO": "bar", "BAR": "baz"}):
+            assert dn._get_property("prop") == "bar"
+            assert dn._get_property("kwargs") == {"a": "baz"}
+            assert "prop" in dn._properties._cached_values
+        with mock.patch.dict(os.environ, {"FOO": "qux", "BAR": "quux"}):
+            assert dn._get_property("prop") == "qux"
+            assert dn._get_property("kwargs") == {"a": "quux"}
+
+            dn._get_property("kwargs")["b"] = "mutated"
+            assert dn._get_property("kwargs") == {"a": "quux"}
+
+            dn._properties["prop"] = "baz"
+            assert dn._get_property("prop") == "baz"
+            del dn._properties["prop"]
+            assert dn._get_property("prop") is None
+            assert "prop" not in dn._properties._cached_values
+
     def test_path_populated_with_config_default_path(self):
         dn_config = Config.configure_data_node("data_node", "pickle", default_path="foo.p")
         assert dn_config.default_path == "foo.p"
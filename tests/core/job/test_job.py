@@ -23,6 +23,7 @@ from src.taipy.core._orchestrator._dispatcher._standalone_job_dispatcher import
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from src.taipy.core.config.job_config import JobConfig
 from src.taipy.core.data.in_memory import InMemoryDataNode
+from src.taipy.core.job._job_converter import _JobConverter
 from src.taipy.core.job._job_manager import _JobManager
 from src.taipy.core.job.job import Job
 from src.taipy.core.job.status import Status
@@ -308,3 +309,18 @@ def test_is_deletable():
         job = Job(job_id, task, "submit_id_1", "scenario_entity_id")
         job.is_deletable()
         mock_submit.assert_called_once_with(job)
+
+
+def test_job_is_slotted_and_lazily_loads_its_task(task, job):
+    assert not hasattr(job, "__dict__")
+    _TaskManager._set(task)
+    _JobManager._set(job)
+
+    loaded_job = _JobConverter._model_to_entity(_JobConverter._entity_to_model(job))
+    assert loaded_job._task == task.id
+    assert loaded_job.owner_id == task.id
+    assert task in loaded_job
+    assert loaded_job._task == task.id
+    assert loaded_job.task == task
+    assert loaded_job._get_task() == task
+    assert isinstance(loaded_job._task, Task)
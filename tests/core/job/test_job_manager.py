@@ -326,10 +326,11 @@ def test_cancel_single_running_job():
         assert_true_after_time(lambda: _OrchestratorFactory._dispatcher._nb_available_workers == 1)
         assert_true_after_time(job.is_running)
         _JobManager._cancel(job)
-        assert_true_after_time(job.is_running)
-    assert_true_after_time(lambda: len(_JobDispatcher._dispatched_processes) == 0)
-    assert_true_after_time(lambda: _OrchestratorFactory._dispatcher._nb_available_workers == 2)
-    assert_true_after_time(job.is_completed)
+        assert_true_after_time(job.is_canceled)
+        assert_true_after_time(lambda: len(_JobDispatcher._dispatched_processes) == 0)
+        assert_true_after_time(lambda: _OrchestratorFactory._dispatcher._nb_available_workers == 2)
+        assert not dnm._get(dn_3.id).edit_in_progress
+        assert dnm._get(dn_3.id).job_ids == []
 
 
 def test_cancel_subsequent_jobs():
@@ -408,11 +409,11 @@ def test_cancel_subsequent_jobs():
         assert len(_OrchestratorFactory._orchestrator.blocked_jobs) == 2
 
         _JobManager._cancel(job_1)
-        assert_true_after_time(job_1.is_running)
+        assert_true_after_time(job_1.is_canceled)
         assert_true_after_time(job_2.is_abandoned)
         assert_true_after_time(job_3.is_abandoned)
 
-    assert_true_after_time(job_1.is_completed)
+    assert_true_after_time(job_1.is_canceled)
     assert_true_after_time(job_2.is_abandoned)
     assert_true_after_time(job_3.is_abandoned)
     assert_true_after_time(job_4.is_canceled)
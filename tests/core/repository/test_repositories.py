@@ -38,6 +38,22 @@ class TestRepositoriesStorage:
         fetched_model = r._load(m.id)
         assert m == fetched_model
 
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "converter": MockConverter}),
+        ],
+    )
+    def test_save_many(self, mock_repo, params, init_sql_repo):
+        r = mock_repo(**params)
+        r._save(MockObj("uuid-0", "foo"))
+        objs = [MockObj(f"uuid-{i}", f"bar-{i}") for i in range(5)]
+        r._save_many(objs)
+
+        for obj in objs:
+            assert r._load(obj.id) == obj
+
     @pytest.mark.parametrize(
         "mock_repo,params",
         [
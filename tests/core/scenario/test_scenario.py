@@ -694,7 +694,7 @@ def test_submit_scenario():
     with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mock_submit:
         scenario = Scenario("foo", [], {})
         scenario.submit(force=False)
-        mock_submit.assert_called_once_with(scenario, None, False, False, None)
+        mock_submit.assert_called_once_with(scenario, None, False, False, None, priority=None, user=None, targets=None)
 
 
 def test_subscribe_scenario():
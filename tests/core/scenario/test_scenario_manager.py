@@ -29,6 +29,7 @@ from src.taipy.core.exceptions.exceptions import (
     DeletingPrimaryScenario,
     DifferentScenarioConfigs,
     InsufficientScenarioToCompare,
+    InvalidSubmissionTarget,
     NonExistingComparator,
     NonExistingScenario,
     NonExistingScenarioConfig,
@@ -1100,6 +1101,110 @@ def test_submit():
         assert submit_calls.index(task_1.id) < submit_calls.index(task_4.id)
 
 
+def test_submit_targets():
+    foo, bar, baz, qux, quux = [
+        Config.configure_data_node(name, default_data=1) for name in ["foo", "bar", "baz", "qux", "quux"]
+    ]
+    first = Config.configure_task("first", mult_by_2, foo, bar)
+    second = Config.configure_task("second", mult_by_2, bar, baz)
+    third = Config.configure_task("third", mult_by_2, foo, qux)
+    fourth = Config.configure_task("fourth", mult_by_2, qux, quux)
+    scenario = _ScenarioManager._create(Config.configure_scenario("scenario", [first, second, third, fourth]))
+
+    jobs = _ScenarioManager._submit(scenario, targets=["baz"])
+    assert {job.task.config_id for job in jobs} == {"first", "second"}
+    assert scenario.baz.read() == 4
+    assert scenario.quux.read() == 1
+
+    # The data nodes themselves or their ids are accepted as well.
+    jobs = scenario.submit(targets=[scenario.qux, scenario.bar.id])
+    assert {job.task.config_id for job in jobs} == {"first", "third"}
+    assert scenario.quux.read() == 1
+
+    with pytest.raises(InvalidSubmissionTarget):
+        scenario.submit(targets=["unknown"])
+
+
+def test_get_stale_tasks_and_resubmit_stale():
+    foo = Config.configure_data_node("foo", default_data=1)
+    bar, baz, qux = [Config.configure_data_node(name) for name in ["bar", "baz", "qux"]]
+    first = Config.configure_task("first", mult_by_2, foo, bar)
+    second = Config.configure_task("second", mult_by_2, bar, baz)
+    third = Config.configure_task("third", mult_by_2, foo, qux)
+    scenario = _ScenarioManager._create(Config.configure_scenario("scenario", [first, second, third]))
+
+    # The outputs were never written.
+    stale_tasks = scenario.get_stale_tasks()
+    assert {task.config_id for task in stale_tasks} == {"first", "second", "third"}
+    assert stale_tasks.index(scenario.first) < stale_tasks.index(scenario.second)
+    _ScenarioManager._submit(scenario)
+    assert scenario.get_stale_tasks() == []
+
+    # The edits make the tasks downstream of the edited data nodes stale.
+    scenario.bar.write(5)
+    assert scenario.get_stale_tasks() == [scenario.second]
+    jobs = scenario.resubmit_stale()
+    assert [job.task.config_id for job in jobs] == ["second"]
+    assert scenario.baz.read() == 10
+    assert scenario.get_stale_tasks() == []
+    assert scenario.resubmit_stale() == []
+
+    scenario.foo.write(3)
+    assert {task.config_id for task in scenario.get_stale_tasks()} == {"first", "second", "third"}
+    # A task remains stale while a task writing its inputs is stale.
+    _TaskManager._orchestrator().submit_task(scenario.second)
+    assert {task.config_id for task in scenario.get_stale_tasks()} == {"first", "second", "third"}
+    _TaskManager._orchestrator().submit_task(scenario.first)
+    assert {task.config_id for task in scenario.get_stale_tasks()} == {"second", "third"}
+
+    jobs = scenario.resubmit_stale()
+    assert {job.task.config_id for job in jobs} == {"second", "third"}
+    assert (scenario.baz.read(), scenario.qux.read()) == (12, 6)
+    assert scenario.get_stale_tasks() == []
+
+
+def test_stale_tasks_in_standalone_mode():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    foo = Config.configure_data_node("foo", default_data=1)
+    bar, baz = [Config.configure_data_node(name, "pickle") for name in ["bar", "baz"]]
+    first = Config.configure_task("first", mult_by_2, foo, bar)
+    second = Config.configure_task("second", mult_by_2, bar, baz)
+    scenario = _ScenarioManager._create(Config.configure_scenario("scenario", [first, second]))
+    _OrchestratorFactory._build_dispatcher()
+
+    _ScenarioManager._submit(scenario, wait=True)
+    assert_true_after_time(lambda: scenario.get_stale_tasks() == [])
+
+    # The outputs written by the worker make the tasks reading them stale.
+    _TaskManager._orchestrator().submit_task(scenario.first, wait=True)
+    assert_true_after_time(lambda: scenario.get_stale_tasks() == [scenario.second])
+
+
+def test_stale_tasks_are_derived_from_the_saved_edit_dates():
+    foo = Config.configure_data_node("foo", default_data=1)
+    bar, baz = [Config.configure_data_node(name) for name in ["bar", "baz"]]
+    first = Config.configure_task("first", mult_by_2, foo, bar)
+    second = Config.configure_task("second", mult_by_2, bar, baz)
+    scenario = _ScenarioManager._create(Config.configure_scenario("scenario", [first, second]))
+    _ScenarioManager._submit(scenario)
+    assert scenario.get_stale_tasks() == []
+
+    # An edit saved by another process, without going through the data node of the current process.
+    bar = _DataManager._get(scenario.bar.id)
+    bar._last_edit_date = datetime.now()
+    _DataManager._set(bar)
+    assert scenario.get_stale_tasks() == [scenario.second]
+
+    baz = _DataManager._get(scenario.baz.id)
+    baz._validity_period = timedelta(microseconds=1)
+    _DataManager._set(baz)
+    assert scenario.get_stale_tasks() == [scenario.second]
+    foo = _DataManager._get(scenario.foo.id)
+    foo._last_edit_date = datetime.now()
+    _DataManager._set(foo)
+    assert scenario.get_stale_tasks() == [scenario.first, scenario.second]
+
+
 def my_print(a, b):
     print(a + b)
 
@@ -699,4 +699,4 @@ def test_submit_sequence():
     with mock.patch("src.taipy.core.sequence._sequence_manager._SequenceManager._submit") as mck:
         sequence = Sequence({}, [], "id")
         sequence.submit(None, False)
-        mck.assert_called_once_with(sequence, None, False, False, None)
+        mck.assert_called_once_with(sequence, None, False, False, None, priority=None, user=None, targets=None)
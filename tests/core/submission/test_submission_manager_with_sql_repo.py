@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import sqlite3
 from datetime import datetime
 from time import sleep
 
@@ -18,6 +19,7 @@ from src.taipy.core._version._version_manager_factory import _VersionManagerFact
 from src.taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
 from src.taipy.core.submission.submission import Submission
 from src.taipy.core.submission.submission_status import SubmissionStatus
+from taipy.config.config import Config
 
 
 def init_managers():
@@ -37,6 +39,19 @@ def test_create_submission(scenario, init_sql_repo):
     assert submission_1._submission_status == SubmissionStatus.SUBMITTED
 
 
+def test_bulk_create_submissions(init_sql_repo):
+    init_managers()
+
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    submissions = submission_manager._bulk_create([f"entity_{i}" for i in range(3)], priority=2, user="alice")
+
+    assert [submission.entity_id for submission in submissions] == ["entity_0", "entity_1", "entity_2"]
+    assert len(submission_manager._get_all()) == 3
+    for submission in submissions:
+        assert submission_manager._get(submission.id).priority == 2
+        assert submission_manager._get(submission.id).user == "alice"
+
+
 def test_get_submission(init_sql_repo):
     init_managers()
 
@@ -120,3 +135,31 @@ def test_delete_submission(init_sql_repo):
 
     submission_manager._delete_all()
     assert len(submission_manager._get_all()) == 0
+
+
+def test_submission_table_created_by_a_previous_version_is_upgraded(tmp_path):
+    db_location = str(tmp_path / "previous_version.db")
+    connection = sqlite3.connect(db_location)
+    connection.execute(
+        "CREATE TABLE submission (id VARCHAR NOT NULL, entity_id VARCHAR, job_ids JSON, creation_date VARCHAR, "
+        "submission_status VARCHAR(9), version VARCHAR, PRIMARY KEY (id))"
+    )
+    connection.execute(
+        "INSERT INTO submission VALUES (?, ?, ?, ?, ?, ?)",
+        ["submission_id", "entity_id", "[]", datetime.now().isoformat(), repr(SubmissionStatus.COMPLETED), "1.0"],
+    )
+    connection.commit()
+    connection.close()
+    Config.configure_core(repository_type="sql", repository_properties={"db_location": db_location})
+    if _SQLConnection._connection:
+        _SQLConnection._connection.close()
+        _SQLConnection._connection = None
+    _SQLConnection.init_db()
+
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    submission = submission_manager._get("submission_id")
+    assert submission.priority == 0
+    assert submission.user is None
+    submission_manager._set(Submission("entity_id", "new_submission_id", priority=2, user="alice"))
+    assert submission_manager._get("new_submission_id").priority == 2
+    assert submission_manager._get("new_submission_id").user == "alice"
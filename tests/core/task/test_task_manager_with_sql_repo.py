@@ -325,7 +325,7 @@ def test_submit_task():
         submit_calls = []
         submit_ids = []
 
-        def submit_task(self, task, callbacks=None, force=False, wait=False, timeout=None):
+        def submit_task(self, task, callbacks=None, force=False, wait=False, timeout=None, priority=None, user=None):
             submit_id = f"SUBMISSION_{str(uuid.uuid4())}"
             self.submit_calls.append(task)
             self.submit_ids.append(submit_id)
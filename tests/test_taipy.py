@@ -291,31 +291,48 @@ class TestTaipy:
     def test_submit(self, scenario, sequence, task):
         with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
             tp.submit(scenario)
-            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(
+                scenario, force=False, wait=False, timeout=None, priority=None, user=None, targets=None
+            )
         with mock.patch("src.taipy.core.sequence._sequence_manager._SequenceManager._submit") as mck:
             tp.submit(sequence)
-            mck.assert_called_once_with(sequence, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(
+                sequence, force=False, wait=False, timeout=None, priority=None, user=None, targets=None
+            )
         with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mck:
             tp.submit(task)
-            mck.assert_called_once_with(task, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(task, force=False, wait=False, timeout=None, priority=None, user=None)
         with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
             tp.submit(scenario, False, False, None)
-            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(
+                scenario, force=False, wait=False, timeout=None, priority=None, user=None, targets=None
+            )
         with mock.patch("src.taipy.core.sequence._sequence_manager._SequenceManager._submit") as mck:
             tp.submit(sequence, False, False, None)
-            mck.assert_called_once_with(sequence, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(
+                sequence, force=False, wait=False, timeout=None, priority=None, user=None, targets=None
+            )
         with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mck:
             tp.submit(task, False, False, None)
-            mck.assert_called_once_with(task, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(task, force=False, wait=False, timeout=None, priority=None, user=None)
         with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
             tp.submit(scenario, True, True, 60)
-            mck.assert_called_once_with(scenario, force=True, wait=True, timeout=60)
+            mck.assert_called_once_with(
+                scenario, force=True, wait=True, timeout=60, priority=None, user=None, targets=None
+            )
         with mock.patch("src.taipy.core.sequence._sequence_manager._SequenceManager._submit") as mck:
             tp.submit(sequence, True, True, 60)
-            mck.assert_called_once_with(sequence, force=True, wait=True, timeout=60)
+            mck.assert_called_once_with(
+                sequence, force=True, wait=True, timeout=60, priority=None, user=None, targets=None
+            )
         with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mck:
             tp.submit(task, True, True, 60)
-            mck.assert_called_once_with(task, force=True, wait=True, timeout=60)
+            mck.assert_called_once_with(task, force=True, wait=True, timeout=60, priority=None, user=None)
+        with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
+            tp.submit(scenario, priority=3)
+            mck.assert_called_once_with(
+                scenario, force=False, wait=False, timeout=None, priority=3, user=None, targets=None
+            )
 
     def test_warning_no_core_service_running(self, scenario):
         _OrchestratorFactory._remove_dispatcher()